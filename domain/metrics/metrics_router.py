@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+from starlette import status
+
+from src.query_metrics import query_metrics
+
+router = APIRouter(prefix="/api/metrics")
+
+
+@router.get("/queries", status_code=status.HTTP_200_OK)
+def get_query_metrics():
+    """
+    요청/작업별 쿼리 수, DB 시간, 행 수와 가장 느린 쿼리를 반환합니다.
+    DB_QUERY_METRICS=1일 때만 수집됩니다.
+    """
+    return query_metrics.snapshot()
@@ -1,6 +1,7 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from domain.recommendation import recommendation_schema
-from src.models import User
+from src.models import SimilarityScore, User
 
 
 # 유저의 다른 정보를 기반으로 id를 가져올 때를 위한 함수
@@ -9,4 +10,32 @@ def get_existing_user(
 ):
     print(f"Looking for user with ID: {user.user_id}")  # Debugging line
     user = db.query(User).filter((User.id == user.user_id)).first()
-    return user.id
+    return user.id if user else None
+
+
+# content_id와 유사도가 높은 순으로 n개의 SimilarityScore를 가져오는 함수
+def get_similar_contents(db: Session, content_id: str, n_items: int):
+    return (
+        db.query(SimilarityScore)
+        .filter(SimilarityScore.source_bill_id == content_id)
+        .order_by(SimilarityScore.similarity_score.desc())
+        .limit(n_items)
+        .all()
+    )
+
+
+# source_ids와의 유사도 합이 높은 순으로 (target_bill_id, total_similarity)를 가져오는 함수
+# source_ids에 포함된 컨텐츠는 제외한다
+def get_similarity_totals(db: Session, source_ids: list, n_items: int):
+    return (
+        db.query(
+            SimilarityScore.target_bill_id,
+            func.sum(SimilarityScore.similarity_score).label("total_similarity"),
+        )
+        .filter(SimilarityScore.source_bill_id.in_(source_ids))
+        .filter(SimilarityScore.target_bill_id.notin_(source_ids))
+        .group_by(SimilarityScore.target_bill_id)
+        .order_by(func.sum(SimilarityScore.similarity_score).desc())
+        .limit(n_items)
+        .all()
+    )
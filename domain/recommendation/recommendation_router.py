@@ -1,14 +1,12 @@
 from fastapi import APIRouter, HTTPException, Query
 from fastapi import Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from starlette import status
 
 import src.recommendation_models as rm
 from src.dna_logger import logger
 from src.db_handler import DBHandler, get_db_handler
 from src.database import get_db
-from src.models import SimilarityScore  # Import your SimilarityScore model
 from domain.recommendation import recommendation_crud, recommendation_schema
 
 router = APIRouter(prefix="/api/recommend")
@@ -57,12 +55,8 @@ def recommend_based_on_bill(
     )  # This is already available in your request
 
     # Query the similarity_scores table for the specified content_id
-    similarity_scores = (
-        db.query(SimilarityScore)
-        .filter(SimilarityScore.source_bill_id == content_id)
-        .order_by(SimilarityScore.similarity_score.desc())
-        .limit(n_recommendations)
-        .all()
+    similarity_scores = recommendation_crud.get_similar_contents(
+        db, content_id, n_recommendations
     )
 
     # Check if any similarity scores were found
@@ -125,19 +119,8 @@ def recommend_based_on_interests(
             return_contents.extend(rr.recommend_randomly(return_contents, 2))
         else:
             n_random = 2
-            total_similarity = (
-                db.query(
-                    SimilarityScore.target_bill_id,
-                    func.sum(SimilarityScore.similarity_score).label(
-                        "total_similarity"
-                    ),
-                )
-                .filter(SimilarityScore.source_bill_id.in_(recent_page_ids))
-                .filter(SimilarityScore.target_bill_id.notin_(recent_page_ids))
-                .group_by(SimilarityScore.target_bill_id)
-                .order_by(func.sum(SimilarityScore.similarity_score).desc())
-                .limit(n_recommendations - n_random)
-                .all()
+            total_similarity = recommendation_crud.get_similarity_totals(
+                db, recent_page_ids, n_recommendations - n_random
             )
             return_contents = [content[0] for content in total_similarity]  # 여기 문제
             return_contents.extend(rr.recommend_randomly(return_contents, n_random))
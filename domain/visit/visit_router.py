@@ -0,0 +1,35 @@
+import math
+
+from fastapi import APIRouter, HTTPException
+from starlette import status
+
+from src.view_counter import view_counter
+from src.visit_buffer import visit_buffer
+from domain.visit import visit_schema
+
+router = APIRouter(prefix="/api/visits")
+
+
+@router.post(
+    "",
+    response_model=visit_schema.PageVisitBatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def record_visits(batch: visit_schema.PageVisitBatch):
+    """
+    방문 기록을 메모리 버퍼에 담고 바로 응답합니다.
+    DB에는 visit_buffer가 모아서 multi-row INSERT로 저장합니다.
+    방문한 페이지(content_id)의 조회수도 view_counter에 더해 주기적으로 저장합니다.
+    버퍼가 가득 차 방문 기록을 받지 못하면 조회수도 더하지 않고 503을 반환합니다.
+    """
+    accepted = visit_buffer.add(visit.model_dump() for visit in batch.visits)
+    if not accepted:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Visit buffer is full, retry later.",
+            headers={"Retry-After": str(math.ceil(visit_buffer.flush_interval))},
+        )
+    # visit_buffer.add는 batch 전체를 받거나 전체를 버린다
+    for visit in batch.visits:
+        view_counter.increment(visit.page_id)
+    return {"accepted": accepted}
@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class PageVisit(BaseModel):
+    user_id: int
+    page_id: str = Field(max_length=255)
+    visit_time: int = Field(ge=0, description="Seconds spent on the page")
+    visited_at: Optional[datetime] = None
+
+
+class PageVisitBatch(BaseModel):
+    visits: List[PageVisit] = Field(min_length=1, max_length=1000)
+
+
+class PageVisitBatchResponse(BaseModel):
+    accepted: int
@@ -1,10 +1,27 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from starlette.middleware.cors import CORSMiddleware
 
+from domain.metrics import metrics_router
 from domain.recommendation import recommendation_router
+from domain.visit import visit_router
+from src.query_metrics import query_metrics
+from src.view_counter import view_counter
+from src.visit_buffer import visit_buffer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 조회수와 방문 기록은 모아서 주기적으로 저장하고, 종료 시 남은 것을 저장한다
+    view_counter.start()
+    visit_buffer.start()
+    yield
+    visit_buffer.stop()
+    view_counter.stop()
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 origins = [
     "http://localhost:5173",
@@ -20,4 +37,17 @@ app.add_middleware(
 )
 
 
+if query_metrics.enabled:
+    # 비활성화 시에는 미들웨어를 추가하지 않는다
+    @app.middleware("http")
+    async def track_queries(request: Request, call_next):
+        with query_metrics.track() as stats:
+            response = await call_next(request)
+            route = request.scope.get("route")
+            stats.name = f"{request.method} {route.path if route else 'unmatched'}"
+        return response
+
+
+app.include_router(metrics_router.router)
 app.include_router(recommendation_router.router)
+app.include_router(visit_router.router)
@@ -0,0 +1,50 @@
+"""add translation_jobs table
+
+Revision ID: 3b8e1f6a2c47
+Revises: 5d32e4f1b75a
+Create Date: 2026-10-19 10:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b8e1f6a2c47"
+down_revision: Union[str, None] = "5d32e4f1b75a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "translation_jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("bill_id", sa.String(length=255), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("worker_id", sa.String(length=64), nullable=True),
+        sa.Column("claimed_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["bill_id"],
+            ["bills.bill_id"],
+            name=op.f("fk_translation_jobs_translation_jobs_bill_id_bills"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_translation_jobs")),
+        sa.UniqueConstraint("bill_id", name=op.f("uq_translation_jobs_bill_id")),
+    )
+    op.create_index(
+        op.f("ix_translation_jobs_status"),
+        "translation_jobs",
+        ["status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_translation_jobs_status"), table_name="translation_jobs")
+    op.drop_table("translation_jobs")
@@ -0,0 +1,36 @@
+"""add text_hash to bills_embedding
+
+Revision ID: 8f2d4c9a1e55
+Revises: 3b8e1f6a2c47
+Create Date: 2026-10-19 11:03:48.215907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8f2d4c9a1e55"
+down_revision: Union[str, None] = "3b8e1f6a2c47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "bills_embedding",
+        sa.Column("text_hash", sa.String(length=64), nullable=True),
+    )
+    op.create_index(
+        op.f("ix_bills_embedding_text_hash"),
+        "bills_embedding",
+        ["text_hash"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_bills_embedding_text_hash"), table_name="bills_embedding")
+    op.drop_column("bills_embedding", "text_hash")
@@ -0,0 +1,30 @@
+"""add pdf_hash and pdf_text to bills
+
+Revision ID: c4a9d2e7b130
+Revises: 8f2d4c9a1e55
+Create Date: 2026-10-19 14:22:07.518342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a9d2e7b130"
+down_revision: Union[str, None] = "8f2d4c9a1e55"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("bills", sa.Column("pdf_hash", sa.String(length=64), nullable=True))
+    op.add_column(
+        "bills", sa.Column("pdf_text", sa.Text(length=16777215), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("bills", "pdf_text")
+    op.drop_column("bills", "pdf_hash")
@@ -0,0 +1,126 @@
+"""add indexes for recommendation and content queries
+
+Revision ID: d7e3b5a1f902
+Revises: c4a9d2e7b130
+Create Date: 2026-10-19 17:41:26.904115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d7e3b5a1f902"
+down_revision: Union[str, None] = "c4a9d2e7b130"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# VARCHAR(255)로 줄이는 컬럼
+SHRUNK_COLUMNS = [
+    ("user_page_visits", "page_id"),
+    ("likes", "content_id"),
+    ("comments", "content_id"),
+]
+
+
+def check_column_lengths() -> None:
+    # 255자를 넘는 값이 있으면 잘리거나 ALTER가 중간에 실패하므로 미리 중단한다
+    conn = op.get_bind()
+    too_long = []
+    for table, column in SHRUNK_COLUMNS:
+        longest = conn.execute(
+            sa.text(f"SELECT MAX(CHAR_LENGTH({column})) FROM {table}")
+        ).scalar()
+        if longest is not None and longest > 255:
+            too_long.append(f"{table}.{column} ({longest} chars)")
+    if too_long:
+        raise RuntimeError(
+            "cannot change columns to VARCHAR(255), longer values exist in: "
+            + ", ".join(too_long)
+            + ". Shorten or remove those rows and run the migration again."
+        )
+
+
+def upgrade() -> None:
+    check_column_lengths()
+
+    # TEXT / VARCHAR(500) 컬럼은 MySQL에서 전체를 인덱싱할 수 없으므로 VARCHAR(255)로 변경
+    op.alter_column(
+        "user_page_visits",
+        "page_id",
+        existing_type=mysql.TEXT(),
+        type_=sa.String(length=255),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "likes",
+        "content_id",
+        existing_type=mysql.VARCHAR(length=500),
+        type_=sa.String(length=255),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "comments",
+        "content_id",
+        existing_type=mysql.VARCHAR(length=500),
+        type_=sa.String(length=255),
+        existing_nullable=False,
+    )
+
+    op.create_index(
+        "ix_user_page_visits_user_id_visited_at",
+        "user_page_visits",
+        ["user_id", "visited_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_similarity_scores_source_bill_id_similarity_score",
+        "similarity_scores",
+        ["source_bill_id", "similarity_score"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_contents_content_id"), "contents", ["content_id"], unique=False
+    )
+    op.create_index(
+        "ix_likes_user_id_content_id", "likes", ["user_id", "content_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_comments_content_id"), "comments", ["content_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_comments_content_id"), table_name="comments")
+    op.drop_index("ix_likes_user_id_content_id", table_name="likes")
+    op.drop_index(op.f("ix_contents_content_id"), table_name="contents")
+    op.drop_index(
+        "ix_similarity_scores_source_bill_id_similarity_score",
+        table_name="similarity_scores",
+    )
+    op.drop_index("ix_user_page_visits_user_id_visited_at", table_name="user_page_visits")
+
+    op.alter_column(
+        "comments",
+        "content_id",
+        existing_type=sa.String(length=255),
+        type_=mysql.VARCHAR(length=500),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "likes",
+        "content_id",
+        existing_type=sa.String(length=255),
+        type_=mysql.VARCHAR(length=500),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "user_page_visits",
+        "page_id",
+        existing_type=sa.String(length=255),
+        type_=mysql.TEXT(),
+        existing_nullable=False,
+    )
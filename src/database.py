@@ -4,7 +4,8 @@ from sqlalchemy.exc import OperationalError
 from contextlib import contextmanager
 import os
 from dotenv import load_dotenv
-from dna_logger import logger
+from src.dna_logger import logger
+from src.query_metrics import query_metrics
 
 # 환경변수를 사용하여 비밀번호 가져오기
 load_dotenv()
@@ -18,9 +19,13 @@ SQLALCHEMY_DATABASE_URL = (
 
 
 # Creating the engine
+# SQL 로그 출력은 DB_ECHO=1일 때만 (모든 쿼리를 동기로 출력하므로 느려진다)
+# 쿼리 수/시간은 DB_QUERY_METRICS=1로 src.query_metrics에서 수집한다
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, echo=True  # echo=True to show SQL log output
+    SQLALCHEMY_DATABASE_URL,
+    echo=os.getenv("DB_ECHO", "0").lower() in ("1", "true"),
 )
+query_metrics.install(engine)
 
 # Creating session local
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -1,10 +1,16 @@
 from fastapi import Depends
 
-from sqlalchemy import text
+import functools
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+
+from sqlalchemy import func, insert, select, text, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, NoResultFound
 from src.dna_logger import logger
 from src.database import get_db
+from src.recent_visits import recent_visits
 from src.models import (
     Bill,
     BillSummary,
@@ -13,25 +19,186 @@ from src.models import (
     Conf,
     UserPageVisit,
     Content,
+    DateChecker,
+    TranslationJob,
 )  # Bill 모델 클래스 정의가 필요합니다
 
 
-def catch_sql_except(func):
-    def wrapper(*args, **kwargs):
+# save_bill / save_bills 가 저장하는 bills 컬럼
+BILL_RECORD_COLUMNS = (
+    "bill_id",
+    "bill_no",
+    "bill_title",
+    "bill_body",
+    "ppsr_name",
+    "ppsl_date",
+    "jrcmit_name",
+    "rgs_rsln_date",
+    "rgs_rsln_rslt",
+    "ord_num",
+    "bill_url",
+    "pdf_url",
+)
+
+
+def _normalize(value):
+    """DB 값(date, int)과 파싱된 값(str)을 비교하기 위해 문자열로 맞춘다"""
+    return None if value is None or value == "" else str(value)
+
+
+def catch_sql_except(func=None, *, write=False):
+    """
+    SQL 에러를 로그로 남기고 rollback한 뒤 None을 반환하게 하는 decorator.
+    write=True인 메서드는 batch() 안에서 SAVEPOINT로 감싸 실행한다 (_batch_write).
+    읽기 메서드는 batch() 안에서도 SAVEPOINT 없이 실행하고, 에러가 나도 쌓인 write를
+    rollback하지 않는다.
+    """
+    if func is None:
+        return functools.partial(catch_sql_except, write=write)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self._batch is not None:
+            if write:
+                return self._batch_write(func, self, *args, **kwargs)
+            if self._in_savepoint:
+                # write 메서드 안에서 호출된 경우, 에러는 그 write의 SAVEPOINT가 처리한다
+                return func(self, *args, **kwargs)
         try:
-            return func(*args, **kwargs)
+            return func(self, *args, **kwargs)
         except SQLAlchemyError as err:
-            args[0].db.rollback()
+            if self._batch is None:
+                self._rollback()
             logger.error(f"error: SQLAlchemy error occurred {err}")
 
     return wrapper
 
 
+class WriteBatch:
+    """Counters of a DBHandler.batch() block."""
+
+    def __init__(self, max_size: int, max_interval: float):
+        self.max_size = max_size
+        self.max_interval = max_interval
+        self.pending = 0  # commit되지 않은 write 수
+        self.committed = 0
+        self.rolled_back = 0  # SAVEPOINT까지 rollback된 write 수
+        self.commits = 0
+        self.last_commit = time.monotonic()
+
+
 class DBHandler:
     def __init__(self, db_session: Session):
         self.db = db_session
+        self._batch: WriteBatch | None = None
+        self._in_savepoint = False
 
-    @catch_sql_except
+    # unit of work
+    @contextmanager
+    def batch(self, max_size: int = 500, max_interval: float = 5.0):
+        """
+        write 메서드의 commit을 모아서 처리하는 context.
+        블록 안에서는 write마다 flush만 하고, max_size개가 쌓이거나 마지막 commit 후
+        max_interval초가 지나면 commit한다. 블록이 끝나면 남은 write를 commit하고,
+        예외로 끝나면 commit되지 않은 write를 rollback한다.
+        write 메서드는 각각 SAVEPOINT 안에서 실행되므로, SQL 에러가 난 write는
+        그 write만 rollback되고 앞서 쌓인 write는 그대로 commit된다.
+        읽기 메서드는 SAVEPOINT 없이 실행된다.
+        중첩된 batch()는 바깥 batch에 합쳐진다.
+
+        Args:
+            max_size (int): 한 번에 commit할 write 수
+            max_interval (float): commit 사이 최대 시간(초)
+
+        Yields:
+            WriteBatch: commit / rollback 통계
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+        self._batch = WriteBatch(max_size, max_interval)
+        try:
+            yield self._batch
+            self.flush_batch()
+        except BaseException:
+            self._rollback()
+            raise
+        finally:
+            batch, self._batch = self._batch, None
+            logger.info(
+                f"db batch: {batch.committed} writes in {batch.commits} commits, "
+                f"{batch.rolled_back} rolled back"
+            )
+
+    def flush_batch(self):
+        """batch() 안에서 쌓인 write를 바로 commit한다."""
+        batch = self._batch
+        if batch is None or batch.pending == 0:
+            return
+        self.db.commit()
+        batch.committed += batch.pending
+        batch.commits += 1
+        batch.pending = 0
+        batch.last_commit = time.monotonic()
+
+    def _flush_batch_if_due(self):
+        batch = self._batch
+        if (
+            batch.pending >= batch.max_size
+            or time.monotonic() - batch.last_commit >= batch.max_interval
+        ):
+            self.flush_batch()
+
+    def _commit(self):
+        """write 메서드의 commit. batch() 안에서는 기준을 넘을 때만 commit한다."""
+        batch = self._batch
+        if batch is None:
+            self.db.commit()
+            return
+        # 에러가 원인이 된 write 메서드 안에서 드러나도록 flush는 바로 한다
+        self.db.flush()
+        batch.pending += 1
+        if not self._in_savepoint:
+            self._flush_batch_if_due()
+
+    def _batch_write(self, func, *args, **kwargs):
+        """
+        batch() 안에서 write 메서드를 SAVEPOINT로 감싸 실행하는 함수.
+        SQL 에러가 나면 이 write만 SAVEPOINT까지 rollback하고 None을 반환한다.
+        write 메서드 안에서 호출된 메서드는 바깥 SAVEPOINT를 함께 쓴다.
+        """
+        if self._in_savepoint:
+            return func(*args, **kwargs)
+        batch = self._batch
+        pending = batch.pending
+        savepoint = self.db.begin_nested()
+        self._in_savepoint = True
+        try:
+            result = func(*args, **kwargs)
+            savepoint.commit()
+        except SQLAlchemyError as err:
+            savepoint.rollback()
+            batch.pending = pending
+            batch.rolled_back += 1
+            logger.error(f"error: SQLAlchemy error occurred {err}")
+            return None
+        except BaseException:
+            savepoint.rollback()
+            raise
+        finally:
+            self._in_savepoint = False
+        self._flush_batch_if_due()
+        return result
+
+    def _rollback(self):
+        self.db.rollback()
+        batch = self._batch
+        if batch is not None and batch.pending:
+            logger.error(f"error: {batch.pending} batched writes rolled back")
+            batch.rolled_back += batch.pending
+            batch.pending = 0
+
+    @catch_sql_except(write=True)
     def save_conf(self, params):
         conf = Conf(
             id=params["id"],
@@ -43,17 +210,50 @@ class DBHandler:
             ord_num=params["ord_num"],
         )
         self.db.add(conf)
-        self.db.commit()
+        self._commit()
         return conf
 
-    @catch_sql_except
+    @catch_sql_except(write=True)
     def save_embedding(self, params):
         billsEmbedding = BillsEmbedding(
             bill_id=params["bill_id"],
             embedding=params["embedding"],
         )
         self.db.add(billsEmbedding)
-        self.db.commit()
+        self._commit()
+
+    @catch_sql_except
+    def get_embedding_hashes(self, bill_ids) -> dict:
+        """주어진 bill_id들에 저장된 임베딩의 text_hash를 한 번의 쿼리로 가져오는 함수"""
+        if not bill_ids:
+            return {}
+        rows = (
+            self.db.query(BillsEmbedding.bill_id, BillsEmbedding.text_hash)
+            .filter(BillsEmbedding.bill_id.in_(list(bill_ids)))
+            .all()
+        )
+        return {row.bill_id: row.text_hash for row in rows}
+
+    @catch_sql_except(write=True)
+    def save_embeddings(self, rows) -> int:
+        """
+        임베딩을 한 트랜잭션으로 일괄 저장하는 함수.
+        같은 bill_id의 이전 버전 임베딩은 삭제 후 다시 저장한다.
+
+        Args:
+            rows (list): bill_id, embedding(bytes), text_hash 를 가진 dict 리스트
+
+        Returns:
+            int: 저장한 행 수
+        """
+        if not rows:
+            return 0
+        self.db.query(BillsEmbedding).filter(
+            BillsEmbedding.bill_id.in_([row["bill_id"] for row in rows])
+        ).delete(synchronize_session=False)
+        self.db.execute(insert(BillsEmbedding), rows)
+        self._commit()
+        return len(rows)
 
     # functions regarding bills
     @catch_sql_except
@@ -63,6 +263,28 @@ class DBHandler:
         return bill is not None
 
     @catch_sql_except
+    def get_stored_summaries(self, bill_ids) -> dict:
+        """
+        주어진 bill_id 중 요약(bill_body)이 이미 저장된 법안을 한 번의 쿼리로 가져오는 함수.
+        요약이 없어 제목으로 대체된 법안은 제외한다.
+
+        Returns:
+            dict: bill_id -> (bill_body, pdf_url)
+        """
+        if not bill_ids:
+            return {}
+        rows = (
+            self.db.query(Bill.bill_id, Bill.bill_title, Bill.bill_body, Bill.pdf_url)
+            .filter(Bill.bill_id.in_(list(bill_ids)))
+            .all()
+        )
+        return {
+            row.bill_id: (row.bill_body, row.pdf_url)
+            for row in rows
+            if row.bill_body and row.bill_body != row.bill_title
+        }
+
+    @catch_sql_except(write=True)
     def save_bill(self, params):
         bill = Bill(
             bill_id=params["bill_id"],
@@ -82,17 +304,98 @@ class DBHandler:
             print("save_bill = bill_id: ", bill.bill_id)
             self.db.add(bill)
             print("save_bill: ", bill)
-            self.db.commit()
+            self._commit()
         return bill
 
-    @catch_sql_except
+    @catch_sql_except(write=True)
+    def save_bills(self, records) -> dict[str, int]:
+        """
+        파싱된 법안 레코드를 한 트랜잭션으로 일괄 저장하는 함수.
+        기존 법안은 IN 쿼리 한 번으로 찾고, 새 법안은 multi-row INSERT,
+        내용이 바뀐 기존 법안은 executemany UPDATE 한 번으로 저장한다.
+        제목이나 내용이 바뀐 법안은 영어 번역을 지우고 번역 작업을 pending으로 되돌린다.
+
+        Args:
+            records (list): save_bill과 같은 key를 가진 dict 리스트
+
+        Returns:
+            dict: inserted / updated / unchanged 개수
+        """
+        by_id = {}
+        for record in records:
+            if record.get("bill_id"):
+                by_id[record["bill_id"]] = {
+                    column: record.get(column) for column in BILL_RECORD_COLUMNS
+                }
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+        if not by_id:
+            return counts
+
+        columns = [getattr(Bill, column) for column in BILL_RECORD_COLUMNS]
+        existing = {
+            row.bill_id: row
+            for row in self.db.query(Bill.id, *columns).filter(
+                Bill.bill_id.in_(list(by_id))
+            )
+        }
+
+        new_rows, changed_rows, retranslate_rows = [], [], []
+        for bill_id, values in by_id.items():
+            row = existing.get(bill_id)
+            if row is None:
+                new_rows.append(values)
+            elif any(
+                _normalize(getattr(row, column)) != _normalize(values[column])
+                for column in ("bill_title", "bill_body")
+            ):
+                # 제목이나 내용이 바뀌면 기존 번역은 더 이상 맞지 않으므로 지우고 다시 번역한다
+                retranslate_rows.append(
+                    {"id": row.id, **values, "bill_title_eng": None, "bill_body_eng": None}
+                )
+            elif any(
+                _normalize(getattr(row, column)) != _normalize(values[column])
+                for column in BILL_RECORD_COLUMNS
+            ):
+                changed_rows.append({"id": row.id, **values})
+            else:
+                counts["unchanged"] += 1
+
+        if new_rows:
+            self.db.execute(insert(Bill), new_rows)
+        if changed_rows:
+            self.db.execute(update(Bill), changed_rows)
+        if retranslate_rows:
+            self.db.execute(update(Bill), retranslate_rows)
+            # 번역 작업이 있으면 pending으로 되돌리고, 없으면 enqueue_missing이 새로 추가한다
+            self.db.execute(
+                update(TranslationJob)
+                .where(
+                    TranslationJob.bill_id.in_(
+                        [row["bill_id"] for row in retranslate_rows]
+                    )
+                )
+                .values(
+                    status="pending",
+                    attempts=0,
+                    last_error=None,
+                    worker_id=None,
+                    claimed_at=None,
+                    updated_at=datetime.now(),
+                )
+            )
+        self._commit()
+        counts["inserted"] = len(new_rows)
+        counts["updated"] = len(changed_rows) + len(retranslate_rows)
+        return counts
+
+    @catch_sql_except(write=True)
     def save_bill_translation(self, bill_id, translated_title, translated_summary):
         """법안의 영어 제목과 내용을 업데이트하는 함수"""
         bill = self.db.query(Bill).filter(Bill.bill_id == bill_id).first()
         if bill:
             bill.bill_title_eng = translated_title
             bill.bill_body_eng = translated_summary
-            self.db.commit()
+            self._commit()
         else:
             logger.warning(f"Bill with ID {bill_id} not found for translation update.")
 
@@ -105,20 +408,32 @@ class DBHandler:
             return logger.info("Bill not found")
 
     @catch_sql_except
-    def get_all_bills(self):
-        bills = self.db.query(Bill).all()
-        return bills
+    def get_all_bills(
+        self, columns=("bill_id", "bill_title", "bill_body"), chunk_size=1000
+    ):
+        """
+        bills 테이블의 필요한 컬럼만 id 순으로 모두 가져오는 함수.
+        ORM 객체 대신 Row를 iter_bill_rows로 chunk마다 읽어 모은다.
+        """
+        return [
+            row for rows in self.iter_bill_rows(columns, chunk_size) for row in rows
+        ]
 
-    @catch_sql_except
+    @catch_sql_except(write=True)
     def del_bill(self, bill_id):
         bill = self.db.query(Bill).filter(Bill.bill_id == bill_id).first()
         if bill:
             self.db.delete(bill)
-            self.db.commit()
+            self._commit()
 
     @catch_sql_except
-    def get_all_value_tables(self):
-        results = self.db.query(Bill).all()
+    def get_all_value_tables(self, column="bill_id", chunk_size=1000):
+        """bills 테이블의 한 컬럼 값을 id 순으로 모두 가져오는 함수"""
+        results = [
+            getattr(row, column)
+            for rows in self.iter_bill_rows((column,), chunk_size)
+            for row in rows
+        ]
         logger.debug(f"Findings number: {len(results)}")
         return results
 
@@ -127,34 +442,97 @@ class DBHandler:
         result = self.db.query(Bill).filter(Bill.bill_id == bill_id).first()
         return result
 
-    @catch_sql_except
+    @catch_sql_except(write=True)
     def update_bill_value(self, bill_id, set_column, set_value):
         bill = self.db.query(Bill).filter(Bill.bill_id == bill_id).first()
         if bill:
             setattr(bill, set_column, set_value)
-            self.db.commit()
+            self._commit()
 
     # 만약 코사인 유사도 계산에 추가적인 정보를 사용한다면 이 함수에서 return해줄 필요가 있음.
     @catch_sql_except
     def get_bills_content(self):
         """bills 테이블에서 모든 content를 추출하는 함수"""
         try:
-            # 모든 법안의 summary를 가져옴
-            summaries = self.db.query(Bill).all()
-            return [
-                {
-                    "bill_id": bill.bill_id,
-                    "bill_title": bill.bill_title,
-                    "bill_summary": bill.bill_body,
-                }
-                for bill in summaries
-            ]  # 딕셔너리 리스트로 변환
+            # 필요한 컬럼만 chunk 단위로 읽어 딕셔너리 리스트로 변환
+            return [bill for chunk in self.iter_bills_content() for bill in chunk]
         except Exception as e:
             print(f"Error extracting summaries: {str(e)}")
             return []
         finally:
             self.db.close()
 
+    def iter_bill_rows(
+        self, columns=("bill_id", "bill_title", "bill_body"), chunk_size=1000, where=()
+    ):
+        """
+        bills 테이블의 필요한 컬럼만 chunk 단위로 읽어 반환하는 generator.
+        ORM 객체를 만들지 않고 한 번에 chunk_size 행만 메모리에 둔다.
+
+        mysqlconnector는 server-side cursor를 지원하지 않아 yield_per도 결과 전체를
+        받아 두므로, id 기준 keyset pagination(WHERE id > :last ORDER BY id LIMIT :n)
+        으로 chunk마다 쿼리를 보낸다. chunk 사이에는 같은 세션으로 저장해도 된다.
+
+        Args:
+            columns (tuple): Bill 컬럼 이름
+            chunk_size (int): 한 번에 가져올 행 수
+            where (tuple): 추가 WHERE 조건
+
+        Yields:
+            list: Row(tuple) 리스트. id 컬럼이 함께 들어 있다.
+
+        Raises:
+            SQLAlchemyError: rollback한 뒤 다시 발생시킨다
+        """
+        statement = (
+            select(Bill.id, *(getattr(Bill, column) for column in columns))
+            .where(*where)
+            .order_by(Bill.id)
+            .limit(chunk_size)
+        )
+        last_id = 0
+        while True:
+            try:
+                rows = self.db.execute(statement.where(Bill.id > last_id)).all()
+            except SQLAlchemyError as err:
+                self._rollback()
+                logger.error(f"error: SQLAlchemy error occurred {err}")
+                raise
+            if not rows:
+                return
+            yield rows
+            if len(rows) < chunk_size:
+                return
+            last_id = rows[-1].id
+
+    def iter_bills_content(self, chunk_size=1000):
+        """get_bills_content와 같은 형식의 dict를 chunk 단위로 반환하는 generator"""
+        for rows in self.iter_bill_rows(chunk_size=chunk_size):
+            yield [
+                {
+                    "bill_id": row.bill_id,
+                    "bill_title": row.bill_title,
+                    "bill_summary": row.bill_body,
+                }
+                for row in rows
+            ]
+
+    def iter_translated_contents(self, chunk_size=1000):
+        """get_translated_contents와 같은 형식의 dict를 chunk 단위로 반환하는 generator"""
+        for rows in self.iter_bill_rows(
+            ("bill_id", "bill_title_eng", "bill_body_eng"),
+            chunk_size,
+            where=(Bill.bill_title_eng.isnot(None), Bill.bill_body_eng.isnot(None)),
+        ):
+            yield [
+                {
+                    "id": row.bill_id,
+                    "translated_bill_title": row.bill_title_eng,
+                    "translated_bill_summary": row.bill_body_eng,
+                }
+                for row in rows
+            ]
+
     def get_existing_translation(self, bill_id):
         """Retrieve existing translation for a given bill_id from the database."""
         query = text(
@@ -173,8 +551,60 @@ class DBHandler:
             }
         return None
 
-    # functions regarding summaries
     @catch_sql_except
+    def get_translated_contents(self):
+        """번역이 완료된 모든 법안의 영어 제목과 내용을 가져오는 함수"""
+        return [content for chunk in self.iter_translated_contents() for content in chunk]
+
+    @catch_sql_except
+    def get_bills_without_pdf_text(self, limit=None):
+        """PDF 주소는 있지만 본문이 아직 추출되지 않은 법안을 가져오는 함수"""
+        query = (
+            self.db.query(Bill.bill_id, Bill.pdf_url)
+            # 주소를 찾지 못한 법안은 pdf_url에 "PDF URL not found." 같은 문구가 저장된다
+            .filter(Bill.pdf_url.like("http%"))
+            .filter(Bill.pdf_text.is_(None))
+            .order_by(Bill.id)
+        )
+        if limit:
+            query = query.limit(limit)
+        return [{"bill_id": row.bill_id, "pdf_url": row.pdf_url} for row in query]
+
+    @catch_sql_except(write=True)
+    def save_pdf_texts(self, rows) -> int:
+        """
+        법안 PDF의 해시와 추출한 본문을 한 트랜잭션으로 저장하는 함수.
+
+        Args:
+            rows (list): bill_id, pdf_hash, pdf_text 를 가진 dict 리스트
+
+        Returns:
+            int: 저장한 행 수
+        """
+        if not rows:
+            return 0
+        ids = dict(
+            self.db.query(Bill.bill_id, Bill.id).filter(
+                Bill.bill_id.in_([row["bill_id"] for row in rows])
+            )
+        )
+        self.db.execute(
+            update(Bill),
+            [
+                {
+                    "id": ids[row["bill_id"]],
+                    "pdf_hash": row["pdf_hash"],
+                    "pdf_text": row["pdf_text"],
+                }
+                for row in rows
+                if row["bill_id"] in ids
+            ],
+        )
+        self._commit()
+        return len(rows)
+
+    # functions regarding summaries
+    @catch_sql_except(write=True)
     def save_summary(self, summarizer):
         summary = BillSummary(
             headline=summarizer.get_headline(),
@@ -183,7 +613,7 @@ class DBHandler:
             conf_id=summarizer.conf_id,
         )
         self.db.add(summary)
-        self.db.commit()
+        self._commit()
         return summary
 
     @catch_sql_except
@@ -212,7 +642,7 @@ class DBHandler:
             logger.error(f"Error reading summary: {str(e)}")
             return None
 
-    @catch_sql_except
+    @catch_sql_except(write=True)
     def save_similarity_score(self, target_bill_id, source_bill_id, similarity_score):
         try:
             # 이미 있는 쌍에 대한 데이터면 새로운 데이터로 덮어쓰기
@@ -226,7 +656,7 @@ class DBHandler:
                 existing_record.similarity_score = (
                     similarity_score  # Update the existing score
                 )
-                self.db.commit()  # Commit the transaction
+                self._commit()
             else:
                 # 없는 쌍에 대해서는 새로운 행을 추가
                 new_record = SimilarityScore(
@@ -235,9 +665,11 @@ class DBHandler:
                     similarity_score=similarity_score,
                 )
                 self.db.add(new_record)
-                self.db.commit()  # Commit the transaction
+                self._commit()
         except Exception as e:
-            self.db.rollback()  # Roll back the transaction on error
+            if self._batch is not None:
+                raise  # batch() 안에서는 _batch_write가 이 write의 SAVEPOINT만 rollback한다
+            self._rollback()  # Roll back the transaction on error
             logger.error(f"Error saving similarity score: {str(e)}")
 
     @catch_sql_except
@@ -253,18 +685,13 @@ class DBHandler:
             list: 최근 방문한 페이지 ID 목록
         """
         try:
-            # user_page_visits 테이블에서 최근 방문 순으로 페이지 조회
-            recent_visits = (
-                self.db.query(UserPageVisit.page_id)
-                .filter(UserPageVisit.user_id == user_id)
-                .order_by(UserPageVisit.visited_at.desc())
-                .limit(n_items)
-                .all()
+            # 사용자별 최근 방문 캐시에서 조회하고, 캐시에 없을 때만 DB를 조회
+            recent_page_ids = recent_visits.get(
+                user_id,
+                n_items,
+                lambda limit: self._query_recent_visits(user_id, limit),
             )
 
-            # 결과를 리스트로 변환 (튜플에서 page_id만 추출)
-            recent_page_ids = [visit[0] for visit in recent_visits]
-
             # 유저가 access했던 컨텐츠가 5개보다 적을 때 False를 반환
             if len(recent_page_ids) < 5:
                 return False
@@ -275,6 +702,33 @@ class DBHandler:
             logger.error(f"Error fetching recent contents for user {user_id}: {str(e)}")
             return []
 
+    def _query_recent_visits(self, user_id, limit):
+        """user_page_visits 테이블에서 최근 방문 순으로 (page_id, visited_at) 조회"""
+        return (
+            self.db.query(UserPageVisit.page_id, UserPageVisit.visited_at)
+            .filter(UserPageVisit.user_id == user_id)
+            .order_by(UserPageVisit.visited_at.desc())
+            .limit(limit)
+            .all()
+        )
+
+    @catch_sql_except(write=True)
+    def add_page_visits(self, visits) -> int:
+        """
+        방문 기록 여러 건을 한 번의 multi-row INSERT로 저장하는 함수.
+
+        Args:
+            visits (list[dict]): user_id, page_id, visit_time, visited_at을 담은 dict 목록
+
+        Returns:
+            int: 저장한 방문 기록 수
+        """
+        if not visits:
+            return 0
+        self.db.execute(insert(UserPageVisit).values(visits))
+        self._commit()
+        return len(visits)
+
     @catch_sql_except
     def get_content(self, content_id):
         content = (
@@ -290,27 +744,84 @@ class DBHandler:
         )
         return content is not None
 
-    @catch_sql_except
-    def increment_content_views(self, content_id):
-        """특정 content의 조회수를 1 증가시키는 함수"""
+    @catch_sql_except(write=True)
+    def increment_content_views(self, content_id, n=1):
+        """특정 content의 조회수를 n 증가시키는 함수 (DB에서 원자적으로 증가)"""
         try:
-            content = (
-                self.db.query(Content).filter(Content.content_id == content_id).first()
+            result = self.db.execute(
+                text(
+                    "UPDATE contents SET views = views + :n "
+                    "WHERE content_id = :content_id"
+                ),
+                {"n": n, "content_id": content_id},
             )
-            if content:
-                content.views += 1
-                self.db.commit()
-                return True
-            else:
+            self._commit()
+            if result.rowcount == 0:
                 logger.warning(
                     f"Content with ID {content_id} not found for view increment."
                 )
                 return False
+            return True
         except Exception as e:
+            if self._batch is not None:
+                raise  # batch() 안에서는 _batch_write가 이 write의 SAVEPOINT만 rollback한다
             logger.error(f"Error incrementing views for content {content_id}: {str(e)}")
-            self.db.rollback()
+            self._rollback()
             return False
 
+    @catch_sql_except(write=True)
+    def add_content_views(self, counts) -> int:
+        """
+        content별 조회수 증가분을 한 트랜잭션으로 반영하는 함수.
+
+        Args:
+            counts (dict): content_id -> 증가분
+
+        Returns:
+            int: 반영한 content 수
+        """
+        if not counts:
+            return 0
+        self.db.execute(
+            text(
+                "UPDATE contents SET views = views + :n "
+                "WHERE content_id = :content_id"
+            ),
+            [{"content_id": content_id, "n": n} for content_id, n in counts.items()],
+        )
+        self._commit()
+        return len(counts)
+
+    # functions regarding date_checker (incremental ingestion watermark)
+    @catch_sql_except
+    def get_last_processed_date(self):
+        """수집이 완료된 마지막 날짜(content_date)를 반환하는 함수, 없으면 None"""
+        return self.db.query(func.max(DateChecker.content_date)).scalar()
+
+    @catch_sql_except(write=True)
+    def mark_date_processed(self, content_date) -> bool:
+        """
+        content_date의 수집 완료를 한 트랜잭션으로 기록하는 함수.
+        이미 기록된 날짜면 다시 추가하지 않는다.
+
+        Args:
+            content_date (date | str): 수집한 날짜 (YYYY-MM-DD)
+
+        Returns:
+            bool: 새로 기록했으면 True
+        """
+        result = self.db.execute(
+            text(
+                "INSERT INTO date_checker (content_date, execute_date) "
+                "SELECT :content_date, :execute_date FROM DUAL "
+                "WHERE NOT EXISTS "
+                "(SELECT 1 FROM date_checker WHERE content_date = :content_date)"
+            ),
+            {"content_date": content_date, "execute_date": date.today()},
+        )
+        self._commit()
+        return result.rowcount > 0
+
 
 # Dependency for DB connection
 def get_db_handler(db: Session = Depends(get_db)):
@@ -0,0 +1,178 @@
+import hashlib
+import threading
+import time
+from array import array
+
+from src.db_handler import DBHandler
+from src.dna_logger import logger
+from src.llm_backend import LLMBackend, get_llm_backend
+from src.rate_limit import RateLimitedExecutor, retry_call
+
+# embed_content 한 번에 보낼 수 있는 최대 텍스트 수
+MAX_EMBED_BATCH = 100
+
+
+def text_hash(text: str) -> str:
+    """Returns the sha256 hex digest identifying a text version."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def encode_embedding(embedding: list[float]) -> bytes:
+    """Packs an embedding vector as float32 bytes for the LargeBinary column."""
+    return array("f", embedding).tobytes()
+
+
+def decode_embedding(data: bytes) -> list[float]:
+    """Unpacks float32 bytes written by encode_embedding."""
+    vector = array("f")
+    vector.frombytes(data)
+    return vector.tolist()
+
+
+def bill_text(bill: dict) -> str:
+    """Text embedded for a bill: title and summary."""
+    return f"{bill.get('bill_title') or ''}\n{bill.get('bill_summary') or ''}"
+
+
+class EmbeddingStage:
+    """
+    Computes bill embeddings once per text version.
+
+    Bills whose stored text_hash matches the current text are skipped. The rest
+    are sent to the backend in batches of up to `batch_size` texts through a
+    RateLimitedExecutor and written to bills_embedding in bulk.
+
+    The executor (and its rate limiter) is created on first use and shared by
+    every call, so repeated calls neither start new threads nor reset the rate
+    limit. close() shuts it down.
+    """
+
+    def __init__(
+        self,
+        db_handler: DBHandler | None = None,
+        backend: LLMBackend | None = None,
+        batch_size: int = MAX_EMBED_BATCH,
+        max_workers: int = 2,
+        rate: float = 1.0,
+        attempts: int = 3,
+    ):
+        """
+        Parameters:
+            db_handler (DBHandler): Handler used to read hashes and save vectors.
+            backend (LLMBackend): Embedding backend. Defaults to get_llm_backend().
+            batch_size (int): Texts per embed request, capped at MAX_EMBED_BATCH.
+            max_workers (int): Concurrent embed requests.
+            rate (float): Embed requests per second.
+            attempts (int): Tries per batch before it is reported as failed.
+        """
+        self.db_handler = db_handler
+        self.backend = backend or get_llm_backend()
+        self.batch_size = min(batch_size, MAX_EMBED_BATCH)
+        self.max_workers = max_workers
+        self.rate = rate
+        self.attempts = attempts
+        self._executor: RateLimitedExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def executor(self) -> RateLimitedExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = RateLimitedExecutor(self.max_workers, rate=self.rate)
+            return self._executor
+
+    def close(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return retry_call(self.backend.embed, texts, attempts=self.attempts)
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embeds texts in batches without touching the database.
+
+        Returns:
+            list: One vector per text, in input order.
+        """
+        batches = [
+            texts[i : i + self.batch_size]
+            for i in range(0, len(texts), self.batch_size)
+        ]
+        results = self.executor.map(self._embed_batch, batches)
+        return [vector for batch in results for vector in batch]
+
+    def run(
+        self, bills: list[dict], db_handler: DBHandler | None = None
+    ) -> dict[str, int]:
+        """
+        Embeds the bills whose text changed since their last stored vector.
+
+        Parameters:
+            bills (list): Dicts with bill_id, bill_title and bill_summary
+                (the format of DBHandler.get_bills_content).
+            db_handler (DBHandler): Handler for this call. Defaults to the
+                handler given to the constructor.
+
+        Returns:
+            dict: Counts of skipped, embedded and failed bills.
+        """
+        db_handler = db_handler or self.db_handler
+        started = time.perf_counter()
+        pending = []
+        for bill in bills:
+            text = bill_text(bill)
+            pending.append((bill["bill_id"], text, text_hash(text)))
+
+        stored = db_handler.get_embedding_hashes([p[0] for p in pending]) or {}
+        pending = [p for p in pending if stored.get(p[0]) != p[2]]
+        skipped = len(bills) - len(pending)
+
+        embedded, failed = 0, 0
+        batches = [
+            pending[i : i + self.batch_size]
+            for i in range(0, len(pending), self.batch_size)
+        ]
+        futures = [
+            (batch, self.executor.submit(self._embed_batch, [p[1] for p in batch]))
+            for batch in batches
+        ]
+        for batch, future in futures:
+            try:
+                vectors = future.result()
+            except Exception as e:
+                logger.error(f"Error: embedding batch failed - {str(e)}")
+                failed += len(batch)
+                continue
+            rows = [
+                {
+                    "bill_id": bill_id,
+                    "embedding": encode_embedding(vector),
+                    "text_hash": digest,
+                }
+                for (bill_id, _, digest), vector in zip(batch, vectors)
+            ]
+            embedded += db_handler.save_embeddings(rows) or 0
+
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"embedding: {embedded} embedded, {skipped} skipped, {failed} failed "
+            f"in {elapsed:.1f}s"
+        )
+        return {"skipped": skipped, "embedded": embedded, "failed": failed}
+
+
+if __name__ == "__main__":
+    from src.database import get_db
+    from src.query_metrics import query_metrics
+
+    # 법안은 chunk 단위로 읽고, chunk 사이에 같은 세션으로 해시 조회와 저장을 한다
+    with query_metrics.track("embedding"):
+        with get_db() as db:
+            db_handler = DBHandler(db)
+            stage = EmbeddingStage(db_handler)
+            for bills in db_handler.iter_bills_content(chunk_size=MAX_EMBED_BATCH * 10):
+                stage.run(bills)
+            stage.close()
@@ -1,5 +1,5 @@
 from src.dna_logger import logger
-import google.generativeai as genai
+from src.embedding import EmbeddingStage
 from sklearn.metrics.pairwise import cosine_similarity
 import pandas as pd
 from src.experiments.run_bill_recommendation import (
@@ -7,16 +7,22 @@ from src.experiments.run_bill_recommendation import (
     extract_bills_summary,
     translate_summaries,
 )
-from src.load import api_keyManager
 
-# Gemini API 키 설정
-API_KEY = api_keyManager.get_ggl_api_key()  # 여기에 API 키를 입력하세요
-genai.configure(api_key=API_KEY)
+
+_stage: EmbeddingStage | None = None
+
+
+def get_stage() -> EmbeddingStage:
+    # 호출마다 스레드 풀을 만들지 않도록 하나의 EmbeddingStage를 재사용
+    global _stage
+    if _stage is None:
+        _stage = EmbeddingStage()
+    return _stage
 
 
 def get_embedding(text):
-    result = genai.embed_content(model="models/text-embedding-004", content=text)
-    return result["embedding"]
+    # LLM_BACKEND=stub 으로 오프라인 실행 가능
+    return get_stage().embed_texts([text])[0]
 
 
 def cosine_similarity_compute(tfidf_matrix, bills_id):
@@ -56,7 +62,8 @@ def generate_all_recommendations(summaries):
         # TF-IDF 벡터라이저 설정
         # for bill in bills:
         #     print(bill)
-        imbeding_matrix = [get_embedding(bill) for bill in bills]
+        # 법안별로 한 번씩 요청하지 않고 embed_content 리스트 API로 일괄 요청
+        imbeding_matrix = get_stage().embed_texts(bills)
 
         bills_id = extract_bills_id()
         print(bills_id)
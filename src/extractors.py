@@ -1,61 +1,128 @@
 from typing import Any
 from src.load import api_keyManager
-import requests
-from bs4 import BeautifulSoup
+from src.http_cache import date_ttl
+from src.http_client import http_client
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import EncodingDetector
 from datetime import datetime
 import xml.etree.ElementTree as ET
 import re
+import requests
 from src.dna_logger import logger
 from src.database import get_db
 from src.db_handler import DBHandler
-import google.generativeai as genai
+from src.llm_backend import LLMBackend, get_llm_backend
+from src.open_api import OpenAPIError, is_success, iter_rows
+from src.schedule_store import ScheduleStore
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
 
 
 # DB Connection
 @contextmanager
 def get_handler():
-    db = next(get_db())
-    try:
+    with get_db() as db:
         yield DBHandler(db)
-    finally:
-        db.close()
+
+
+CONF_FIELDS = [
+    "CONFER_NUM",
+    "TITLE",
+    "CLASS_NAME",
+    "CONF_DATE",
+    "VOD_LINK_URL",
+    "CONF_LINK_URL",
+    "PDF_LINK_URL",
+]
+
+
+class LinkDeduplicator:
+    """
+    Thread-safe set of bill links already handed out, shared across
+    conferences and days so the same bill is fetched only once.
+    Links whose fetch or save failed are released so a later day or run
+    can claim them again.
+    """
+
+    def __init__(self):
+        self._seen: set[str] = set()
+        self._lock = threading.Lock()
+
+    def claim(self, links) -> list[str]:
+        """
+        Returns the links not claimed before, in order, and marks them as seen.
+        """
+        new_links = []
+        with self._lock:
+            for link in links:
+                if link not in self._seen:
+                    self._seen.add(link)
+                    new_links.append(link)
+        return new_links
+
+    def release(self, links) -> None:
+        """Forgets claimed links, e.g. the ones that could not be saved."""
+        with self._lock:
+            self._seen.difference_update(links)
+
+    def __len__(self):
+        return len(self._seen)
 
 
 class ConfExtractor:
     """
     Extracts conference details from the National Assembly API using DAE_NUM and CONF_DATE.
+
+    Every conference of the day is kept. Bill links of all conferences are
+    fetched concurrently and deduplicated, also against `seen_links` when a
+    shared LinkDeduplicator is given.
     """
 
-    def __init__(self, dae_num: str, date: str):
+    def __init__(
+        self,
+        dae_num: str,
+        date: str,
+        seen_links: LinkDeduplicator | None = None,
+        max_workers: int = 4,
+    ):
         """
-        Initializes the ConfExtractor by fetching the first conference ID and its details
-        from the National Assembly API based on the DAE_NUM and CONF_DATE.
+        Initializes the ConfExtractor by fetching all conferences of the day and
+        the bill links of each of them from the National Assembly API.
+        Raises OpenAPIError when the conferences could not be fetched.
 
         Parameters:
             dae_num (str): The National Assembly number (DAE_NUM).
             date (str): The date of the conference (CONF_DATE).
+            seen_links (LinkDeduplicator): Links already collected on other days.
+            max_workers (int): Number of VCONFBILLLIST requests sent concurrently.
         """
         self.dae_num = dae_num
         self.date = date
         self.na_api_key = api_keyManager.get_na_api_key()
         self.conf_ids: list[str] = []  # To store conference IDs
-        self.links: list[str] = []  # Store relevant links like VOD or PDF links
+        self.conferences: list[dict[str, str | None]] = []  # All conferences of the day
+        self.links: list[str] = []  # Bill links of all conferences, deduplicated
         self.conf_info: dict[str, str | None] = (
             {}
         )  # Store information about the first conference
+        # 최근 날짜의 회의/안건 목록은 아직 바뀔 수 있으므로 캐시를 쓰지 않는다
+        self.cache_ttl = date_ttl(date)
 
-        self.get_conf_info(dae_num, date)  # Fetch the first conference entry
+        self.get_conf_info(dae_num, date)
 
         if self.conf_ids:
             print("conf_ids: ", self.conf_ids)
-            self.get_link_from_conf_id(self.conf_ids[0])
+            self.get_links(max_workers)
+            if seen_links is not None:
+                self.links = seen_links.claim(self.links)
 
     def get_conf_info(
         self, dae_num: str, date: str
-    ) -> tuple[list[str], dict[str, str]]:
+    ) -> tuple[list[str], list[dict[str, str]]]:
         """
-        Retrieves the first conference ID and relevant details from the National Assembly API.
+        Retrieves all conference IDs and their details from the National Assembly API.
 
         Parameters:
             dae_num (str): The DAE_NUM to search for.
@@ -63,214 +130,428 @@ class ConfExtractor:
 
         Returns:
             tuple: A tuple containing a list of conference IDs and a list of conference details.
+            Both are empty only when the day had no conference.
+
+        Raises:
+            OpenAPIError: When the conferences could not be fetched, so the day
+                is retried instead of being taken for a day without conferences.
         """
-        base_url = "https://open.assembly.go.kr/portal/openapi/nzbyfwhwaoanttzje"
         self.params_dict = {
-            "KEY": self.na_api_key,
-            "Type": "xml",  # Assuming you are receiving XML data
-            "pSize": 1000,
             "DAE_NUM": dae_num,
             "CONF_DATE": date,
         }
-        response = requests.get(base_url, params=self.params_dict)
-
-        if response.status_code != 200:
-            logger.error(
-                f"Error: Failed to fetch data, status code {response.status_code}"
-            )
-            return [], {}
-
         try:
-            root = ET.fromstring(response.content)
-            result_code = root.find(".//CODE")
-            if result_code is None or result_code.text != "INFO-000":
-                message = root.find(".//MESSAGE")
-                error_msg = message.text if message is not None else "Unknown error"
-                logger.error(f"Error: {error_msg}")
-                return [], {}
-
-            # Extract the first conference information
-            row = root.find(".//row")
-            if row is not None:
-                conference = {}
-                for field in [
-                    "CONFER_NUM",
-                    "TITLE",
-                    "CLASS_NAME",
-                    "CONF_DATE",
-                    "VOD_LINK_URL",
-                    "CONF_LINK_URL",
-                    "PDF_LINK_URL",
-                ]:
-                    element = row.find(field)
-                    conference[field] = element.text if element is not None else ""
-
-                self.conf_info = conference
-                self.conf_ids = [conference["CONFER_NUM"]]
-                return self.conf_ids, self.conf_info
-
-            return [], {}
-
-        except ET.ParseError as e:
-            logger.error(f"Error: Failed to parse XML - {str(e)}")
-            logger.error("Response content:", response.text)
-            return [], {}
+            # 같은 날 여러 회의가 있을 수 있으므로 모든 row를 저장
+            for row in iter_rows(
+                "nzbyfwhwaoanttzje",
+                self.params_dict,
+                fmt="xml",
+                cache_ttl=self.cache_ttl,
+            ):
+                conference = {field: row.get(field) or "" for field in CONF_FIELDS}
+                if conference["CONFER_NUM"] in self.conf_ids:
+                    continue
+                self.conferences.append(conference)
+                self.conf_ids.append(conference["CONFER_NUM"])
+        except (OpenAPIError, ET.ParseError, requests.RequestException) as e:
+            logger.error(f"Error: Failed to fetch conferences - {str(e)}")
+            self.conf_ids, self.conferences = [], []
+            raise OpenAPIError(f"conferences of {date} could not be fetched") from e
+
+        if self.conferences:
+            self.conf_info = self.conferences[0]
+        return self.conf_ids, self.conferences
 
     def get_conf_id(self):
         if not self.conf_ids:
             return ""
         return self.conf_ids[0]
 
-    def get_link_from_conf_id(self, conf_id: str):
+    def get_links(self, max_workers: int = 4) -> list[str]:
+        """
+        Fetches the bill links of every conference concurrently into self.links,
+        keeping the first occurrence of each link.
+        """
+        with ThreadPoolExecutor(max_workers) as executor:
+            results = list(executor.map(self.fetch_links, self.conf_ids))
+        self.links = list(dict.fromkeys(link for links in results for link in links))
+        return self.links
+
+    def fetch_links(self, conf_id: str) -> list[str]:
         """
         Retrieves bill links associated with a specific conference ID from the National Assembly API.
 
         Parameters:
             conf_id (str): The conference ID to fetch the bill links for.
 
-        Appends the bill links to the self.links list.
+        Returns:
+            list: The bill links of the conference.
+
+        Raises:
+            OpenAPIError: When the links could not be fetched, so the day fails
+                instead of silently missing the conference's bills.
         """
-        base_url = "https://open.assembly.go.kr/portal/openapi/VCONFBILLLIST"
-        params_dict = {
-            "KEY": self.na_api_key,
-            "Type": "json",
-            "pSize": 1000,
-            "CONF_ID": conf_id,
-        }
-        response = requests.get(base_url, params=params_dict)
-
-        if response.status_code == 200:
-            try:
-                for row in response.json()["VCONFBILLLIST"][1]["row"]:
-                    self.links.append(row["LINK_URL"])
-            except Exception as e:
-                logger.error(f"Error: {str(e)}")
-                logger.error(f"conf_id: {conf_id}")
-        else:
-            logger.error(
-                f"Error: Failed to retrieve links, status code {response.status_code}"
-            )
+        try:
+            return [
+                row["LINK_URL"]
+                for row in iter_rows(
+                    "VCONFBILLLIST",
+                    {"CONF_ID": conf_id},
+                    fmt="json",
+                    cache_ttl=self.cache_ttl,
+                )
+            ]
+        except (OpenAPIError, ValueError, KeyError, requests.RequestException) as e:
+            logger.error(f"Error: {str(e)}")
+            logger.error(f"conf_id: {conf_id}")
+            raise OpenAPIError(f"bill links of {conf_id} could not be fetched") from e
+
+    def get_link_from_conf_id(self, conf_id: str):
+        """
+        Appends the bill links of a single conference to the self.links list.
+
+        Parameters:
+            conf_id (str): The conference ID to fetch the bill links for.
+        """
+        self.links.extend(
+            link for link in self.fetch_links(conf_id) if link not in self.links
+        )
 
     def save_conf(self, host, user, password):
         """
-        Save to Database.
+        Save every conference of the day to Database.
 
         Parameters:
             host (str): Database host ip ex) localhost.
             user (str): User name in database ex) root.
             password (str): Password for user.
         """
-
-        params = {
-            "id": self.conf_info["CONFER_NUM"],
-            "url": self.conf_info["CONF_LINK_URL"],
-            "num": self.conf_info["CONFER_NUM"],
-            "title": self.conf_info["TITLE"],
-            "pdf_url": self.conf_info["PDF_LINK_URL"],
-            "date": self.conf_info["CONF_DATE"],
-            "ord_num": self.params_dict["DAE_NUM"],
-        }
         with get_handler() as db_handler:
-            db_handler.save_conf(params=params)
+            for conference in self.conferences:
+                params = {
+                    "id": conference["CONFER_NUM"],
+                    "url": conference["CONF_LINK_URL"],
+                    "num": conference["CONFER_NUM"],
+                    "title": conference["TITLE"],
+                    "pdf_url": conference["PDF_LINK_URL"],
+                    "date": conference["CONF_DATE"],
+                    "ord_num": self.params_dict["DAE_NUM"],
+                }
+                db_handler.save_conf(params=params)
 
 
 ## ConfExtractor that takes into account for multiple conference for a day.
-class MultiConfExtractor:
-    def __init__(self, dae_num, date):
-        self.na_api_key = self.api_km.get_na_api_key()
-        self.conf_ids = None
-        self.links = []
-        self.conf_info = []
-        self.get_conf_id_from_date(dae_num, date)
-        if self.conf_ids:
-            self.get_link_from_conf_id(self.conf_ids[0])
+class MultiConfExtractor(ConfExtractor):
+    """
+    ConfExtractor whose conf_info is the list of every conference of the day.
+    Kept for callers written against the list interface.
+    """
 
-    def get_conf_id_from_date(self, dae_num, date):
-        """
-        Retrieves conference IDs and relevant details from the 열린국회 API based on the provided dae_num and date.
+    def __init__(self, dae_num, date, seen_links: LinkDeduplicator | None = None):
+        super().__init__(dae_num, date, seen_links=seen_links)
+        self.conf_info = self.conferences
 
-        Parameters:
-        dae_num (str): The DAE_NUM to search for.
-        date (str): The CONF_DATE to search for.
 
-        Returns:
-        list: A list of conference details including CONFER_NUM, TITLE, CLASS_NAME, CONF_DATE, VOD_LINK_URL, CONF_LINK_URL, and PDF_LINK_URL.
-        """
-        base_url = "https://open.assembly.go.kr/portal/openapi/nzbyfwhwaoanttzje"
-        params_dict = {
-            "KEY": self.na_api_key,
-            "Type": "xml",  # Assuming you are receiving XML data
-            "pSize": 1000,
-            "DAE_NUM": dae_num,
-            "CONF_DATE": date,
-        }
-        response = requests.get(base_url, params=params_dict)
+# bill 상세 페이지에서 실제로 읽는 영역만 파싱 (lxml이 있으면 lxml 사용)
+try:
+    import lxml  # noqa: F401
 
-        if response.status_code != 200:
-            print(f"Error: Failed to fetch data, status code {response.status_code}")
-            return None
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
-        try:
-            # Parse the XML response
-            root = ET.fromstring(response.content)
-
-            # Check for the result code
-            result_code = root.find(".//CODE").text
-            if result_code != "INFO-000":
-                print(f"Error: {root.find('.//MESSAGE').text}")
-                return None
-
-            # Extract conference information
-            ids = []
-            for row in root.findall(".//row"):
-                conference = {
-                    "CONFER_NUM": row.find("CONFER_NUM").text,
-                    "TITLE": row.find("TITLE").text,
-                    "CLASS_NAME": row.find("CLASS_NAME").text,
-                    "CONF_DATE": row.find("CONF_DATE").text,
-                    "VOD_LINK_URL": row.find("VOD_LINK_URL").text,
-                    "CONF_LINK_URL": row.find("CONF_LINK_URL").text,
-                    "PDF_LINK_URL": row.find("PDF_LINK_URL").text,
-                }
-                ids.append(conference["CONFER_NUM"])
-                self.conf_info.append(conference)
+SUMMARY_STRAINER = SoupStrainer("div", attrs={"id": "summaryContentDiv"})
+BILL_TABLE_STRAINER = SoupStrainer("div", attrs={"class": "tableCol01"})
+
+
+def extract_bill_summary(soup: BeautifulSoup) -> str:
+    """
+    Extracts the bill summary from a parsed bill webpage.
+
+    Parameters:
+        soup (BeautifulSoup): The parsed page (full or restricted to summaryContentDiv).
 
-            self.conf_ids = list(set(ids))
+    Returns:
+        str: The summary of the bill.
+    """
+    try:
+        return soup.find("div", {"id": "summaryContentDiv"}).text.strip()
+    except Exception as e:
+        logger.info(f"info: This bill url does not contain summary - {str(e)}")
+        return ""
+
+
+def extract_bill_no_pdf_url(soup: BeautifulSoup) -> tuple:
+    """
+    Extracts the BILL_NO and PDF URL from a parsed bill webpage.
+
+    Parameters:
+        soup (BeautifulSoup): The parsed page (full or restricted to div.tableCol01).
+
+    Returns:
+        tuple: A tuple containing the BILL_NO and the PDF URL of the bill.
+    """
+    # Find the div element with the class "tableCol01" that contains the table
+    table_div = soup.find("div", class_="tableCol01")
+    if table_div is None:
+        logger.error("Error: Div with class 'tableCol01' not found.")
+        return "", None
+
+    table = table_div.find(
+        "table",
+        summary="의안접수정보의 의안번호, 제안일자, 제안자, 문서, 제안회기 정보",
+    )
+    if not table:
+        return "Table not found.", None
+
+    tbody = table.find("tbody")
+    if not tbody:
+        return "Table body not found.", None
+
+    rows = tbody.find_all("tr")
+    if not rows:
+        return "No rows found in the table.", None
+
+    # Extract bill_no from the first <td> in the first row
+    bill_no_td = rows[0].find_all("td")[0]
+    bill_no = bill_no_td.text.strip()  # Remove extra spaces or newlines
+
+    # Find the 4th <td> element in the first row that contains the PDF link
+    target_td = rows[0].find_all("td")[3]
+    links = target_td.find_all("a")
+    if len(links) < 2:
+        return bill_no, "PDF URL not found."
+
+    # Handle JavaScript link that contains the PDF file information
+    javascript_link = links[1].get("href")
+    # Use regex to extract the file ID from the JavaScript function call
+    match = re.search(
+        r"openBillFile\s*\(\s*['\"]([^'\"]+)['\"]\s*,\s*['\"]([^'\"]+)['\"]\s*,\s*['\"]([^'\"]+)['\"]\s*\)",
+        javascript_link,
+    )
+    if not match:
+        logger.error(
+            f"error: PDF URL extraction failed. Regex did not match. {str(table)}"
+        )
+        return bill_no, "PDF URL extraction failed. Regex did not match."
 
-        except ET.ParseError as e:
-            print(f"Error: Failed to parse XML - {str(e)}")
-            print("Response content:", response.text)
+    file_id = match.group(2)
+    pdf_url = f"https://likms.assembly.go.kr/filegate/sender24?dummy=dummy&bookId={file_id}&type=1"
+    # Return both the bill number and the PDF URL
+    return bill_no, pdf_url
+
+
+SUMMARY_DIV_PATTERN = re.compile(
+    rb"<div\b[^>]*\bid\s*=\s*[\"']summaryContentDiv[\"']", re.IGNORECASE
+)
+BILL_TABLE_DIV_PATTERN = re.compile(
+    rb"<div\b[^>]*\bclass\s*=\s*[\"'][^\"']*\btableCol01\b", re.IGNORECASE
+)
+DIV_TAG_PATTERN = re.compile(rb"<(/?)div\b", re.IGNORECASE)
+
+
+def slice_div(content: bytes, pattern: re.Pattern) -> bytes | None:
+    """
+    Cuts the first <div> whose opening tag matches `pattern` out of the raw page,
+    including its nested divs.
+
+    Returns:
+        bytes: The div markup, or None if no opening tag matches.
+    """
+    match = pattern.search(content)
+    if match is None:
+        return None
+    depth = 0
+    for tag in DIV_TAG_PATTERN.finditer(content, match.start()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            return content[match.start() : content.find(b">", tag.end()) + 1]
+    return content[match.start() :]
+
+
+def parse_page_region(
+    content: bytes,
+    marker: bytes,
+    pattern: re.Pattern,
+    strainer: SoupStrainer,
+    parser: str,
+    encoding: str | None,
+) -> BeautifulSoup:
+    """
+    Parses one region of a page. The region is sliced out of the raw bytes when
+    its opening tag is recognized, otherwise the page is parsed with `strainer`.
+    """
+    if marker not in content:
+        return BeautifulSoup(b"", parser)
+    fragment = slice_div(content, pattern)
+    if fragment is None:
+        return BeautifulSoup(
+            content, parser, parse_only=strainer, from_encoding=encoding
+        )
+    return BeautifulSoup(fragment, parser, from_encoding=encoding)
+
+
+def parse_bill_page(content: bytes | None, parser: str = HTML_PARSER) -> tuple:
+    """
+    Parses only div#summaryContentDiv and div.tableCol01 of a billDetail.do page.
+
+    Parameters:
+        content (bytes): The raw page content.
+        parser (str): BeautifulSoup tree builder.
+
+    Returns:
+        tuple: (bill_summary, bill_no, pdf_url).
+    """
+    if not content:
+        return "", "", None
+    # 잘라낸 조각에는 meta charset이 없으므로 문서의 인코딩을 넘겨준다
+    encoding = EncodingDetector.find_declared_encoding(content, is_html=True) or "utf-8"
+    summary_soup = parse_page_region(
+        content,
+        b"summaryContentDiv",
+        SUMMARY_DIV_PATTERN,
+        SUMMARY_STRAINER,
+        parser,
+        encoding,
+    )
+    table_soup = parse_page_region(
+        content,
+        b"tableCol01",
+        BILL_TABLE_DIV_PATTERN,
+        BILL_TABLE_STRAINER,
+        parser,
+        encoding,
+    )
+    bill_no, pdf_url = extract_bill_no_pdf_url(table_soup)
+    return extract_bill_summary(summary_soup), bill_no, pdf_url
+
+
+ALLBILL_URL = "https://open.assembly.go.kr/portal/openapi/ALLBILL"
+ALLBILL_FIELDS = [
+    "BILL_NO",
+    "BILL_ID",
+    "BILL_NM",
+    "PPSR_NM",
+    "PPSL_DT",
+    "JRCMIT_NM",
+    "RGS_RSLN_DT",
+    "RGS_CONF_RSLT",
+    "LINK_URL",
+]
+
+
+def parse_bill_info(content: bytes | None) -> dict[str, str | None] | None:
+    """
+    Parses an ALLBILL API response.
+
+    Parameters:
+        content (bytes): The raw XML response.
+
+    Returns:
+        dict: A dictionary containing bill details such as BILL_NO, BILL_NM, and LINK_URL,
+        or None if the response is an error.
+    """
+    if not content:
+        return None
+    try:
+        root = ET.fromstring(content)
+        result_code = root.find(".//CODE")
+        if result_code is None or result_code.text != "INFO-000":
+            message = root.find(".//MESSAGE")
+            logger.error(
+                f"Error: {message.text if message is not None else 'Unknown error'}"
+            )
             return None
+        return {field: root.find(f".//{field}").text for field in ALLBILL_FIELDS}
+    except (ET.ParseError, AttributeError) as e:
+        logger.error(f"Error: Failed to parse XML - {str(e)}")
+        return None
 
-    def get_link_from_conf_id(self, CONF_ID):
-        """
-        Retrieves bill links associated with a specific conference ID.
 
-        Parameters:
-        CONF_ID (str): The conference ID to fetch the bill links for.
+def build_bill_record(
+    bill_info: dict, bill_summary: str, pdf_url: str | None
+) -> dict[str, str | None]:
+    """
+    Builds the DBHandler.save_bill params of a bill.
 
-        Appends the bill links to the self.links list.
-        """
-        # base_url (기본 URL)
-        base_url = "https://open.assembly.go.kr/portal/openapi/VCONFBILLLIST"
-        params_dict = {
-            "KEY": self.na_api_key,
-            "Type": "json",
-            "pSize": 1000,
-            "CONF_ID": CONF_ID,
-        }
-        response = requests.get(base_url, params=params_dict)
+    Parameters:
+        bill_info (dict): Parsed ALLBILL row.
+        bill_summary (str): Summary scraped from the bill webpage.
+        pdf_url (str): PDF URL scraped from the bill webpage.
+
+    Returns:
+        dict: The bill record.
+    """
+    return {
+        "bill_id": bill_info["BILL_ID"],
+        "bill_no": bill_info["BILL_NO"],
+        "bill_title": bill_info["BILL_NM"],
+        # bill_summary가 공란이면 BILL_NM으로 대체
+        "bill_body": bill_summary or bill_info["BILL_NM"],
+        "ppsr_name": bill_info["PPSR_NM"],
+        "ppsl_date": bill_info["PPSL_DT"],
+        "jrcmit_name": bill_info["JRCMIT_NM"],
+        "rgs_rsln_date": bill_info["RGS_RSLN_DT"],
+        "rgs_rsln_rslt": bill_info["RGS_CONF_RSLT"],
+        "ord_num": bill_info["BILL_NO"][:2],
+        "bill_url": bill_info["LINK_URL"],
+        "pdf_url": pdf_url,
+    }
+
+
+def parse_bill(page_fields: tuple, info: bytes | None) -> dict[str, str | None] | None:
+    """
+    Pure parse stage: builds a bill record from the page fields and the raw
+    ALLBILL response returned by BillExtractor.fetch(). The page itself was
+    already parsed by fetch(), so only the ALLBILL XML is parsed here.
+
+    Parameters:
+        page_fields (tuple): (bill_summary, bill_no, pdf_url) of parse_bill_page.
+        info (bytes): The raw ALLBILL response.
+
+    Returns:
+        dict: The bill record, or None if the bill info could not be parsed.
+    """
+    bill_summary, _, pdf_url = page_fields
+    bill_info = parse_bill_info(info)
+    if bill_info is None:
+        return None
+    return build_bill_record(bill_info, bill_summary, pdf_url)
+
+
+def save_bills(records: list[dict]) -> dict[str, int]:
+    """
+    Save stage: saves a batch of bill records in a single transaction.
+
+    Parameters:
+        records (list): Records built by parse_bill / build_bill_record.
+
+    Returns:
+        dict: inserted / updated / unchanged counts of the batch.
 
-        if response.status_code == 200:
-            for row in response.json()["VCONFBILLLIST"][1]["row"]:
-                self.links.append(row["LINK_URL"])
-        else:
-            print("GET 요청 실패:", response.status_code)
+    Raises:
+        RuntimeError: If the batch could not be saved (rolled back).
+    """
+    with get_handler() as db_handler:
+        counts = db_handler.save_bills(records)
+    if counts is None:
+        raise RuntimeError(f"failed to save a batch of {len(records)} bills")
+    logger.info(
+        f"Saved {len(records)} bills: {counts['inserted']} inserted, "
+        f"{counts['updated']} updated, {counts['unchanged']} unchanged"
+    )
+    return counts
 
 
 class BillExtractor:
     """
     Extracts bill information and details from the National Assembly API and bill web pages.
+
+    Construction does no I/O. fetch() downloads the bill webpage (parsed once,
+    since its BILL_NO is needed for the ALLBILL call) and the raw ALLBILL
+    response, parse_bill() turns them into a record and save_bills() stores
+    records in batches, so the stages can run with separate concurrency.
+    extract() runs fetch and parse for a single bill.
     """
 
     def __init__(self, bill_url: str):
@@ -282,217 +563,132 @@ class BillExtractor:
         """
         self.na_api_key = api_keyManager.get_na_api_key()
         self.bill_url = bill_url
-        self.bill_soup = self.get_soup(self.bill_url)
-        self.bill_summary = self.get_bill_summary()
-        self.bill_no, self.pdf_url = self.get_bill_no_pdf_url()
-        self.bill_info = self.get_bill_info(self.bill_no)
+        self.bill_page: bytes | None = None
+        self.bill_summary = ""
+        self.bill_no = ""
+        self.pdf_url: str | None = None
+        self.bill_info: dict[str, str | None] | None = None
 
-    def get_bill_info(self, bill_no: str) -> dict[str, str | Any | None] | None:
+    def fetch(self) -> tuple[tuple, bytes | None]:
         """
-        Retrieves detailed bill information from the National Assembly API.
+        Fetch stage: downloads the bill webpage and its ALLBILL response.
+
+        Returns:
+            tuple: ((bill_summary, bill_no, pdf_url) of the webpage, raw ALLBILL
+            XML). The XML is None on failure.
+        """
+        self.bill_page = self.get_page(self.bill_url)
+        # 의안번호는 ALLBILL 조회에 필요하므로 페이지에서 바로 읽고, 결과를 parse_bill에 넘긴다
+        page_fields = parse_bill_page(self.bill_page)
+        self.bill_summary, self.bill_no, self.pdf_url = page_fields
+        if not self.bill_no:
+            return page_fields, None
+        return page_fields, self.get_bill_info_raw(self.bill_no)
+
+    def extract(self) -> dict[str, str | None] | None:
+        """
+        Fetches and parses the bill.
+
+        Returns:
+            dict: The bill record ready for save_bills, or None on failure.
+        """
+        _, info = self.fetch()
+        self.bill_info = parse_bill_info(info)
+        if self.bill_info is None:
+            return None
+        return build_bill_record(self.bill_info, self.bill_summary, self.pdf_url)
+
+    def get_bill_info_raw(self, bill_no: str) -> bytes | None:
+        """
+        Retrieves the raw ALLBILL response of a bill.
 
         Parameters:
             bill_no (str): The BILL_NO of the bill to fetch information for.
 
         Returns:
-            dict: A dictionary containing bill details such as BILL_NO, BILL_NM, and LINK_URL.
+            bytes: The XML response, or None if the request failed.
         """
-        api_url = f"https://open.assembly.go.kr/portal/openapi/ALLBILL?KEY={self.na_api_key}&BILL_NO={bill_no}"
-        response = requests.get(api_url)
+        params_dict = {"KEY": self.na_api_key, "BILL_NO": bill_no}
+        response = http_client.get(
+            ALLBILL_URL, params=params_dict, validate=is_success
+        )
 
         if response.status_code != 200:
             logger.error(
                 f"Error: Failed to fetch data, status code {response.status_code}"
             )
             return None
-        try:
-            root = ET.fromstring(response.content)
-            result_code = root.find(".//CODE").text
-            if result_code != "INFO-000":
-                logger.error(f"Error: {root.find('.//MESSAGE').text}")
-                return None
-
-            bill_info = {
-                "BILL_NO": root.find(".//BILL_NO").text,
-                "BILL_ID": root.find(".//BILL_ID").text,
-                "BILL_NM": root.find(".//BILL_NM").text,
-                "PPSR_NM": root.find(".//PPSR_NM").text,
-                "PPSL_DT": root.find(".//PPSL_DT").text,
-                "JRCMIT_NM": root.find(".//JRCMIT_NM").text,
-                "RGS_RSLN_DT": root.find(".//RGS_RSLN_DT").text,
-                "RGS_CONF_RSLT": root.find(".//RGS_CONF_RSLT").text,
-                "LINK_URL": root.find(".//LINK_URL").text,
-            }
-            print("get_bill_info = bill_id: ", bill_info["BILL_ID"])
-            self.bill_info = bill_info
-            self._save()
-            print("after get_bill_info = bill_id: ", bill_info["BILL_ID"])
-            return bill_info
-
-        except ET.ParseError as e:
-            logger.error(f"Error: Failed to parse XML - {str(e)}")
-            logger.error(f"Error: Response content - {response.text}")
-            return None
+        return response.content
 
-    def get_bill_id(self):
-        return self.bill_info["BILL_ID"]
-
-    def get_soup(self, bill_link: str) -> BeautifulSoup:
+    def get_bill_info(self, bill_no: str) -> dict[str, str | Any | None] | None:
         """
-        Retrieves and parses the HTML content of the bill webpage.
+        Retrieves detailed bill information from the National Assembly API.
 
         Parameters:
-            bill_link (str): The URL of the bill webpage.
+            bill_no (str): The BILL_NO of the bill to fetch information for.
 
         Returns:
-            BeautifulSoup: Parsed HTML content of the bill's webpage.
+            dict: A dictionary containing bill details such as BILL_NO, BILL_NM, and LINK_URL.
         """
-        response = requests.get(bill_link)
+        self.bill_info = parse_bill_info(self.get_bill_info_raw(bill_no))
+        return self.bill_info
 
-        if response.status_code != 200:
-            return None
-        return BeautifulSoup(response.content, "html.parser")
+    def get_bill_id(self):
+        return self.bill_info["BILL_ID"]
 
-    def get_bill_summary(self) -> str:
+    def get_page(self, bill_link: str) -> bytes | None:
         """
-        Extracts the bill summary from the bill's webpage.
+        Retrieves the raw HTML of the bill webpage.
 
-        Returns:
-            str: The summary of the bill.
-        """
-        try:
-            return self.bill_soup.find("div", {"id": "summaryContentDiv"}).text.strip()
-        except Exception as e:
-            logger.info(f"info: This bill url does not contain summary - {str(e)}")
-            return ""
-
-    def get_bill_no_pdf_url(self) -> tuple:
-        """
-        Extracts the BILL_NO and PDF URL from the bill's webpage.
+        Parameters:
+            bill_link (str): The URL of the bill webpage.
 
         Returns:
-            tuple: A tuple containing the BILL_NO and the PDF URL of the bill.
+            bytes: The page content, or None if the request failed.
         """
-        # Find the div element with the class "tableCol01" that contains the table
-
-        try:
-            table_div = self.bill_soup.find("div", class_="tableCol01")
-        except Exception as e:
-            logger.error(f"Error: Div with class 'tableCol01' not found. - {str(e)}")
-            return ""
-
-        table = table_div.find(
-            "table",
-            summary="의안접수정보의 의안번호, 제안일자, 제안자, 문서, 제안회기 정보",
-        )
-        if not table:
-            return "Table not found.", None
-
-        tbody = table.find("tbody")
-        if not tbody:
-            return "Table body not found.", None
-
-        rows = tbody.find_all("tr")
-        if not rows:
-            return "No rows found in the table.", None
-
-        # Extract bill_no from the first <td> in the first row
-        bill_no_td = rows[0].find_all("td")[0]
-        bill_no = bill_no_td.text.strip()  # Remove extra spaces or newlines
-
-        # Find the 4th <td> element in the first row that contains the PDF link
-        target_td = rows[0].find_all("td")[3]
-        links = target_td.find_all("a")
-        if len(links) < 2:
-            return bill_no, "PDF URL not found."
-
-        # Handle JavaScript link that contains the PDF file information
-        javascript_link = links[1].get("href")
-        # Use regex to extract the file ID from the JavaScript function call
-        match = re.search(
-            r"openBillFile\s*\(\s*['\"]([^'\"]+)['\"]\s*,\s*['\"]([^'\"]+)['\"]\s*,\s*['\"]([^'\"]+)['\"]\s*\)",
-            javascript_link,
-        )
-        if not match:
-            logger.error(
-                f"error: PDF URL extraction failed. Regex did not match. {str(table)}"
-            )
-            return bill_no, "PDF URL extraction failed. Regex did not match."
+        response = http_client.get(bill_link)
 
-        file_id = match.group(2)
-        self.bill_no = bill_no
-        self.pdf_url = f"https://likms.assembly.go.kr/filegate/sender24?dummy=dummy&bookId={file_id}&type=1"
-        # Return both the bill number and the PDF URL
-        return bill_no, self.pdf_url
+        if response.status_code != 200:
+            return None
+        return response.content
 
     def _save(self):
         """
         Save to Database.
-
-        Parameters:
-            host (str): Database host ip ex) localhost.
-            user (str): User name in database ex) root.
-            password (str): Password for user.
         """
-        # bill_summary가 공란이면 BILL_NM으로 대체
-        if self.bill_summary == "":
-            self.bill_summary = self.bill_info["BILL_NM"]
-        params = {
-            "bill_id": self.bill_info["BILL_ID"],
-            "bill_no": self.bill_info["BILL_NO"],
-            "bill_title": self.bill_info["BILL_NM"],
-            "bill_body": self.bill_summary,
-            "ppsr_name": self.bill_info["PPSR_NM"],
-            "ppsl_date": self.bill_info["PPSL_DT"],
-            "jrcmit_name": self.bill_info["JRCMIT_NM"],
-            "rgs_rsln_date": self.bill_info["RGS_RSLN_DT"],
-            "rgs_rsln_rslt": self.bill_info["RGS_CONF_RSLT"],
-            "ord_num": self.bill_info["BILL_NO"][:2],
-            "bill_url": self.bill_info["LINK_URL"],
-            "pdf_url": self.pdf_url,
-        }
-        print("_save = bill_id: ", params["bill_id"])
-        with get_handler() as db_handler:
-            db_handler.save_bill(params=params)
+        save_bills([build_bill_record(self.bill_info, self.bill_summary, self.pdf_url)])
 
     def save_bill(self):
         """
         Save to Database.
-
-        Parameters:
-            host (str): Database host ip ex) localhost.
-            user (str): User name in database ex) root.
-            password (str): Password for user.
         """
-        logger.error("save_bill function is deprecated. Use save instead.")
-        # bill_summary가 공란이면 BILL_NM으로 대체
+        logger.error("save_bill function is deprecated. Use save_bills instead.")
         self._save()
 
 
 class All_BillIdsExtractor:
     def __init__(self, host, user, password):
         with get_handler() as db_handler:
-            self.results = db_handler.get_all_value_tables("bill_summary", "bill_id")
-        print(db_handler.get_all_value_tables("bill_summary", "bill_id"))
+            self.results = db_handler.get_all_value_tables("bill_id") or []
+        print(self.results)
         logger.debug("All_BillIdsExtractor get:" + str(len(self.results)))
 
 
 class All_KeywordExtractor:
     def __init__(self, host, user, password):
-        self.results = []
-        keylist = ["keyword1", "keyword2", "keyword3"]
-        for column in keylist:
-            table = "bill"
-            with get_handler() as db_handler:
-                results = db_handler.get_all_value_tables(table, column)
-            if not results is None:
-                self.results += [reulst[0] for reulst in results]
-        self.results = list(set(self.results))
+        keylist = ("keyword1", "keyword2", "keyword3")
+        # 세 키워드 컬럼만 한 번에 읽는다
+        with get_handler() as db_handler:
+            rows = db_handler.get_all_bills(keylist) or []
+        self.results = list(
+            {getattr(row, column) for row in rows for column in keylist} - {None}
+        )
 
 
 class KeywordExtractor:
-    def __init__(self, bill_id):
+    def __init__(self, bill_id, backend: LLMBackend | None = None):
         self.bill_id = bill_id
+        self.backend = backend or get_llm_backend()
 
         table = "bill_summary"
         with get_handler() as db_handler:
@@ -507,19 +703,7 @@ class KeywordExtractor:
             return
         system_instructions = """주어진 문단을 분류하기 위해 사용하기 적절한 단어 3가지를 골라서 아래 예시와 같이 출력해줘
         예시 : 장애인, 복지, 교통"""
-        model = "gemini-1.5-flash"
-        temperature = 0
-        stop_sequence = "종료!"
-
-        self.ggl_api_key = api_keyManager.get_ggl_api_key()
-        genai.configure(api_key=self.ggl_api_key)
-
-        model = genai.GenerativeModel(model, system_instruction=system_instructions)
-        config = genai.GenerationConfig(
-            temperature=temperature, stop_sequences=[stop_sequence]
-        )
-        response = model.generate_content(contents=[text], generation_config=config)
-        sentence = response.text
+        sentence = self.backend.generate(text, system_instructions)
         extracted = [part.strip() for part in sentence.split(",")]
         self.get_keywords = extracted
         return extracted
@@ -532,163 +716,184 @@ class KeywordExtractor:
             "keyword2",
             "keyword3",
         ]
-        for index, set_column in enumerate(set_columns):
-            with get_handler() as db_handler:
+        with get_handler() as db_handler, db_handler.batch():
+            for index, set_column in enumerate(set_columns):
                 db_handler.update_bill_value(
                     table, column, self.bill_id, set_column, self.get_keywords[index]
                 )
 
 
+ALL_SCHEDULE_FIELDS = [
+    "SCH_KIND",
+    "SCH_CN",
+    "SCH_DT",
+    "SCH_TM",
+    "CONF_DIV",
+    "CMIT_NM",
+    "CONF_SESS",
+    "CONF_DGR",
+    "EV_INST_NM",
+    "EV_PLC",
+]
+
+CONF_SCHEDULE_FIELDS = [
+    "MEETINGSESSION",
+    "CHA",
+    "TITLE",
+    "MEETTING_DATE",
+    "MEETTING_TIME",
+    "LINK_URL",
+    "UNIT_CD",
+    "UNIT_NM",
+]
+
+# 회의 식별자 (위원회, 회기, 차수): 장소나 날짜/시간이 바뀐 회의는 같은 행으로 갱신한다
+ALL_SCHEDULE_KEY = ("SCH_KIND", "CMIT_NM", "CONF_SESS", "CONF_DGR")
+CONF_SCHEDULE_KEY = ("UNIT_CD", "MEETINGSESSION", "CHA")
+
+
 class AllScheduleExtractor:
-    def __init__(self):
+    """
+    Keeps the ALLSCHEDULE schedule in a ScheduleStore sorted by date, so the
+    past / future / latest queries are answered with bisect.
+    """
+
+    def __init__(self, store_path: str | None = None):
         """
         Initializes the AllScheduleExtractor class.
 
-        - Instantiates an APIKeyManager to handle API keys.
         - Retrieves the National Assembly API key.
-        - Initializes an empty list to store the full schedule.
-        - Calls the function to get all schedule data and sets up the latest schedule.
+        - Loads the persisted schedule from `store_path` if given.
+        - Refreshes the schedule from the API and sets up the latest schedule.
+
+        Parameters:
+        - store_path (str): JSON file the schedule is loaded from and saved to.
         """
         self.na_api_key = api_keyManager.get_na_api_key()
-        self.all_schedule = []
+        self.store_path = store_path
+        self.store = ScheduleStore("SCH_DT", "SCH_TM", ALL_SCHEDULE_KEY)
+        if store_path:
+            self.store.load(store_path)
         self.get_all_schedule()
         self.all_latest_schedule = self.get_latest_schedule()
 
+    @property
+    def all_schedule(self) -> list[dict]:
+        """All schedules in chronological order."""
+        return self.store.rows
+
     def get_all_schedule(self):
         """
-        Retrieves and stores all available schedule information from the National Assembly API.
-
-        This function sends a GET request to the API, retrieves schedule data, parses it,
-        and appends relevant information to the `self.all_schedule` list.
+        Retrieves the schedule from the National Assembly API and merges it
+        into the store. Every page is read, since ALLSCHEDULE is not ordered
+        newest first; rows already stored are skipped and changed ones are
+        overwritten.
 
         Returns:
         - list: A list of dictionaries, each containing schedule information.
         """
-        # Base URL for the API
-        base_url = "https://open.assembly.go.kr/portal/openapi/ALLSCHEDULE"
-
-        # Define the parameters to send to the API
-        params_dict = {
-            "KEY": self.na_api_key,
-            "Type": "json",  # Response type as JSON
-            "pSize": 1000,  # Adjust this parameter for desired no of schedules
-        }
-
-        # Send the GET request
-        response = requests.get(base_url, params=params_dict)
-
-        # Check if the request was successful
-        if response.status_code == 200:
-            # Parse the response JSON
-            schedule_data = response.json()
-
-            # Iterate through each row in the schedule and extract relevant information
-            for sch in schedule_data["ALLSCHEDULE"][1]["row"]:
-                schedule_info = {
-                    "SCH_KIND": sch.get("SCH_KIND", ""),
-                    "SCH_CN": sch.get("SCH_CN", ""),
-                    "SCH_DT": sch.get("SCH_DT", ""),
-                    "SCH_TM": sch.get("SCH_TM", ""),
-                    "CONF_DIV": sch.get("CONF_DIV", ""),
-                    "CMIT_NM": sch.get("CMIT_NM", ""),
-                    "CONF_SESS": sch.get("CONF_SESS", ""),
-                    "CONF_DGR": sch.get("CONF_DGR", ""),
-                    "EV_INST_NM": sch.get("EV_INST_NM", ""),
-                    "EV_PLC": sch.get("EV_PLC", ""),
-                }
-                # Append the schedule information to the list
-                self.all_schedule.append(schedule_info)
-
-            return self.all_schedule
-
-        else:
+        rows = (
+            {field: sch.get(field, "") for field in ALL_SCHEDULE_FIELDS}
+            for sch in iter_rows("ALLSCHEDULE", fmt="json", prefetch=True)
+        )
+        try:
+            added = self.store.refresh(rows, source="ALLSCHEDULE")
+        except (OpenAPIError, ValueError, requests.RequestException) as e:
             # Handle the error if the request was not successful
-            logger.error(
-                f"error: GET request failed with status code {response.status_code}"
-            )
+            logger.error(f"error: GET request failed - {str(e)}")
+            return None
+
+        logger.info(
+            f"info: {added} new or changed schedules, {len(self.store)} in total"
+        )
+        if self.store_path:
+            self.store.save(self.store_path)
+        return self.all_schedule
 
     def get_future_schedule(self):
         """
-        Filters and returns schedules that are set for future dates.
-
-        Uses the 'SCH_DT' field from the schedule and compares it with the current date.
+        Returns schedules that are set after the current time.
 
         Returns:
         - list: A list of dictionaries with schedules in the future.
         """
-        future_schedule_list = list(
-            filter(
-                lambda sch: datetime.strptime(sch["SCH_DT"], "%Y.%m.%d")
-                > datetime.now(),
-                self.all_schedule,
-            )
-        )
-
-        return future_schedule_list
+        return self.store.after()
 
     def get_past_schedule(self):
         """
-        Filters and returns schedules that are in the past.
-
-        Uses the 'SCH_DT' field from the schedule and compares it with the current date.
+        Returns schedules that are before the current time.
 
         Returns:
         - list: A list of dictionaries with schedules that are in the past.
         """
-        past_schedule_list = list(
-            filter(
-                lambda sch: datetime.strptime(sch["SCH_DT"], "%Y.%m.%d")
-                < datetime.now(),
-                self.all_schedule,
-            )
-        )
-
-        return past_schedule_list
+        return self.store.before()
 
     def get_latest_schedule(self):
         """
-        Retrieves and returns the latest past schedule.
-
-        Filters the schedule list for past schedules and returns the most recent one.
+        Returns the most recent past schedule.
 
         Returns:
         - dict: A dictionary containing the most recent past schedule.
         """
-        past_schedule_list = list(
-            filter(
-                lambda sch: datetime.strptime(sch["SCH_DT"], "%Y.%m.%d")
-                < datetime.now(),
-                self.all_schedule,
-            )
-        )
+        return self.store.latest()
+
+    def get_next_schedule(self):
+        """
+        Returns the first schedule after the current time.
+
+        Returns:
+        - dict: A dictionary containing the upcoming schedule.
+        """
+        return self.store.next()
+
+    def get_schedule_between(self, start: datetime, end: datetime):
+        """
+        Returns schedules with start <= date < end.
+
+        Returns:
+        - list: A list of dictionaries in chronological order.
+        """
+        return self.store.between(start, end)
+
 
-        return past_schedule_list[0]  # Returns the most recent past schedule
+def iter_conf_schedule(unit_cd: str):
+    """Yields the schedule rows of a committee from nekcaiymatialqlxr, all pages."""
+    for sch in iter_rows(
+        "nekcaiymatialqlxr", {"UNIT_CD": unit_cd}, fmt="json", prefetch=True
+    ):
+        yield {field: sch.get(field, "") for field in CONF_SCHEDULE_FIELDS}
 
 
 class ConfScheduleExtractor:
-    def __init__(self, unit_cd):
+    def __init__(self, unit_cd, store: ScheduleStore | None = None):
         """
         Initializes the ConfScheduleExtractor class.
 
-        - Instantiates an APIKeyManager to handle API keys.
         - Retrieves the National Assembly API key.
-        - Initializes an empty list to store conference-specific schedules.
-        - Calls the function to get schedules based on unit code and sets up the latest schedule.
+        - Fetches the schedules of the committee into a ScheduleStore and sets
+          up the latest schedule.
 
         Parameters:
         - unit_cd (str): The unit code for the desired conference.
+        - store (ScheduleStore): Store to merge into. A new store by default.
         """
         self.na_api_key = api_keyManager.get_na_api_key()
-        self.conf_schedule = []
+        self.unit_cd = unit_cd
+        self.store = store or ScheduleStore(
+            "MEETTING_DATE", "MEETTING_TIME", CONF_SCHEDULE_KEY
+        )
         self.get_conf_schedule(unit_cd)
         self.conf_latest_schedule = self.get_latest_schedule()
 
+    @property
+    def conf_schedule(self) -> list[dict]:
+        """Schedules of this committee in chronological order."""
+        return [row for row in self.store.rows if row["UNIT_CD"] == self.unit_cd]
+
     def get_conf_schedule(self, unit_cd):
         """
-        Retrieves and stores schedule information for a specific conference using its unit code.
-
-        Sends a GET request to the API with the provided unit code, retrieves data, and appends
-        relevant information to the `self.conf_schedule` list.
+        Retrieves schedule information for a specific conference using its unit
+        code and merges the new rows into the store.
 
         Parameters:
         - unit_cd (str): The unit code of the conference for which the schedule is being requested.
@@ -696,64 +901,125 @@ class ConfScheduleExtractor:
         Returns:
         - list: A list of dictionaries, each containing conference schedule information.
         """
-        # Base URL for the API
-        base_url = "https://open.assembly.go.kr/portal/openapi/nekcaiymatialqlxr"
+        try:
+            self.store.refresh(iter_conf_schedule(unit_cd), source=unit_cd)
+        except (OpenAPIError, ValueError, requests.RequestException) as e:
+            # Handle the error if the request was not successful
+            logger.error(f"error: GET request failed - {str(e)}")
+            return None
+        return self.conf_schedule
 
-        # Define the parameters to send to the API
-        params_dict = {
-            "KEY": self.na_api_key,
-            "Type": "json",  # Response type as JSON
-            "pSize": 100,  # Adjust this parameter for desired no of schedules
-            "UNIT_CD": unit_cd,
-        }
+    def get_latest_schedule(self):
+        """
+        Returns the most recent past schedule of the committee.
 
-        # Send the GET request
-        response = requests.get(base_url, params=params_dict)
-
-        # Check if the request was successful
-        if response.status_code == 200:
-            # Parse the response JSON
-            schedule_data = response.json()
-            # Iterate through each row in the schedule and extract relevant information
-            for sch in schedule_data["nekcaiymatialqlxr"][1]["row"]:
-                schedule_info = {
-                    "MEETINGSESSION": sch.get("MEETINGSESSION", ""),
-                    "CHA": sch.get("CHA", ""),
-                    "TITLE": sch.get("TITLE", ""),
-                    "MEETTING_DATE": sch.get("MEETTING_DATE", ""),
-                    "MEETTING_TIME": sch.get("MEETTING_TIME", ""),
-                    "LINK_URL": sch.get("LINK_URL", ""),
-                    "UNIT_CD": sch.get("UNIT_CD", ""),
-                    "UNIT_NM": sch.get("UNIT_NM", ""),
-                }
-                # Append the schedule information to the list
-                self.conf_schedule.append(schedule_info)
+        Returns:
+        - dict: A dictionary containing the most recent conference schedule.
+        """
+        return self.store.latest(where=lambda row: row["UNIT_CD"] == self.unit_cd)
 
-            return self.conf_schedule
 
-        else:
-            # Handle the error if the request was not successful
-            logger.error(
-                f"error: GET request failed with status code {response.status_code}"
-            )
+class MultiConfScheduleExtractor:
+    """
+    Builds one calendar across committees.
 
-    def get_latest_schedule(self):
+    Committee schedules are fetched concurrently through the pooled
+    http_client and merged into a single ScheduleStore. The store records the
+    refresh time of every committee (store.refreshed_at[unit_cd]), so refresh()
+    can skip committees refreshed recently.
+    """
+
+    def __init__(
+        self,
+        unit_cds: list[str],
+        store_path: str | None = None,
+        max_workers: int = 4,
+    ):
+        """
+        Parameters:
+            unit_cds (list): Unit codes of the committees.
+            store_path (str): JSON file the calendar is loaded from and saved to.
+            max_workers (int): Committees fetched concurrently.
+        """
+        self.unit_cds = list(dict.fromkeys(unit_cds))
+        self.store_path = store_path
+        self.max_workers = max_workers
+        self.store = ScheduleStore(
+            "MEETTING_DATE", "MEETTING_TIME", CONF_SCHEDULE_KEY
+        )
+        if store_path:
+            self.store.load(store_path)
+
+    def _refresh_one(self, unit_cd: str) -> int:
+        return self.store.refresh(iter_conf_schedule(unit_cd), source=unit_cd)
+
+    def refresh(self, max_age: float | None = None) -> dict[str, int | None]:
         """
-        Retrieves and returns the most recent conference schedule from the list.
+        Fetches the committees concurrently and merges their new rows.
+
+        Parameters:
+            max_age (float): Skip committees refreshed less than this many
+                seconds ago. None refreshes every committee.
 
         Returns:
-        - dict: A dictionary containing the most recent conference schedule.
+            dict: unit_cd -> rows added (None if the fetch failed). Skipped
+            committees are not included.
         """
-        return self.conf_schedule[0]  # Returns the most recent schedule
+        now = time.time()
+        due = [
+            unit_cd
+            for unit_cd in self.unit_cds
+            if max_age is None
+            or now - self.store.refreshed_at.get(unit_cd, 0) >= max_age
+        ]
+        results = {}
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            futures = {
+                unit_cd: executor.submit(self._refresh_one, unit_cd) for unit_cd in due
+            }
+            for unit_cd, future in futures.items():
+                try:
+                    results[unit_cd] = future.result()
+                except (OpenAPIError, ValueError, requests.RequestException) as e:
+                    # 한 위원회가 실패해도 나머지 위원회는 계속 갱신한다
+                    logger.error(f"error: schedule of {unit_cd} failed - {str(e)}")
+                    results[unit_cd] = None
+
+        logger.info(
+            f"info: refreshed {len(due)}/{len(self.unit_cds)} committees, "
+            f"{sum(n or 0 for n in results.values())} new schedules"
+        )
+        if self.store_path:
+            self.store.save(self.store_path)
+        return results
+
+    def get_schedule(self, unit_cd: str | None = None) -> list[dict]:
+        """Schedules in chronological order, optionally of one committee."""
+        rows = self.store.rows
+        if unit_cd is None:
+            return rows
+        return [row for row in rows if row["UNIT_CD"] == unit_cd]
+
+    def get_latest_schedule(self, unit_cd: str | None = None):
+        """The most recent past schedule, optionally of one committee."""
+        if unit_cd is None:
+            return self.store.latest()
+        return self.store.latest(where=lambda row: row["UNIT_CD"] == unit_cd)
+
+    def get_next_schedule(self, unit_cd: str | None = None):
+        """The first upcoming schedule, optionally of one committee."""
+        if unit_cd is None:
+            return self.store.next()
+        return self.store.next(where=lambda row: row["UNIT_CD"] == unit_cd)
 
 
 if __name__ == "__main__":
     # Example of using the AllScheduleExtractor class
     ase = AllScheduleExtractor()
-    print(ase.all_schedule[0])  # Print the first schedule
+    print(ase.all_schedule[-1])  # Print the last schedule
     print(ase.all_latest_schedule)  # Print the latest past schedule
 
     # Example of using the ConfScheduleExtractor class with a specific DAE unit code
     cse = ConfScheduleExtractor("100022")
-    print(cse.conf_schedule[0])  # Print the first conference schedule
+    print(cse.conf_schedule[-1])  # Print the last conference schedule
     print(cse.conf_latest_schedule)  # Print the latest conference schedule
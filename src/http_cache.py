@@ -0,0 +1,269 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import date, timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.dna_logger import logger
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# 엔드포인트(URL 마지막 경로)별 캐시 유지 시간(초)
+DEFAULT_TTLS = {
+    "nzbyfwhwaoanttzje": 6 * HOUR,  # 날짜별 회의 목록
+    "VCONFBILLLIST": 7 * DAY,  # 회의별 안건 목록
+    "ALLBILL": DAY,  # 의안 정보 (처리 결과가 바뀔 수 있음)
+    "billDetail.do": DAY,  # 의안 상세 페이지
+    "ALLSCHEDULE": HOUR,
+    "nekcaiymatialqlxr": HOUR,
+}
+
+# 캐시 키에서 제외할 파라미터 (API 키)
+IGNORED_PARAMS = {"key"}
+
+# 오늘부터 이 일수 전까지의 날짜별 목록은 아직 바뀔 수 있으므로 캐시하지 않는다
+RECENT_DAYS = 1
+
+
+def date_ttl(day) -> float | None:
+    """
+    TTL override of a request listing the data of one day.
+
+    Parameters:
+        day (str | date): The day, as YYYY-MM-DD or a date.
+
+    Returns:
+        float | None: 0 (no cache) for today and the last RECENT_DAYS days,
+        whose listings may still grow, otherwise None (the endpoint TTL).
+    """
+    if isinstance(day, str):
+        day = date.fromisoformat(day[:10])
+    if day >= date.today() - timedelta(days=RECENT_DAYS):
+        return 0
+    return None
+
+
+class CachedResponse:
+    """
+    Minimal stand-in for requests.Response served from the cache.
+
+    Provides the attributes the extractors read: status_code, content, text,
+    headers, url and json().
+    """
+
+    def __init__(self, url: str, status_code: int, content: bytes, headers: dict):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.from_cache = True
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def normalize_request(url: str, params: dict | None = None) -> str:
+    """
+    Builds the cache identity of a request: url plus sorted query parameters,
+    with the API key removed.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    query += [(k, str(v)) for k, v in (params or {}).items() if v is not None]
+    query = sorted((k, v) for k, v in query if k.lower() not in IGNORED_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+def endpoint_of(url: str) -> str:
+    """Returns the last path segment of `url`, e.g. ALLBILL or billDetail.do."""
+    return urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1]
+
+
+class ResponseCache:
+    """
+    Size-bounded on-disk cache of successful GET responses.
+
+    Each entry is a body file plus a json metadata file under `cache_dir`.
+    Fresh entries (younger than the endpoint TTL) are served without a request.
+    Stale entries carrying ETag / Last-Modified are revalidated with a
+    conditional request. Least recently used entries are evicted once the
+    total body size exceeds `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = "./.http_cache",
+        max_bytes: int = 512 * 1024 * 1024,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = 0,
+    ):
+        """
+        Parameters:
+            cache_dir (str): Directory holding the entries.
+            max_bytes (int): Upper bound of the total body size.
+            ttls (dict): Endpoint name -> seconds. Defaults to DEFAULT_TTLS.
+            default_ttl (float): TTL of endpoints not in `ttls`. 0 disables caching.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        # 디렉터리 생성과 크기 계산은 처음 저장할 때 한다 (import 시점에 하지 않도록)
+        self._sizes: dict[str, int] | None = None
+
+    @classmethod
+    def from_env(cls):
+        """
+        Creates the cache from HTTP_CACHE_DIR / HTTP_CACHE_MAX_MB, or returns None
+        when HTTP_CACHE=0.
+        """
+        if os.getenv("HTTP_CACHE", "1") == "0":
+            return None
+        return cls(
+            cache_dir=os.getenv("HTTP_CACHE_DIR", "./.http_cache"),
+            max_bytes=int(os.getenv("HTTP_CACHE_MAX_MB", "512")) * 1024 * 1024,
+        )
+
+    def _entry_sizes(self) -> dict[str, int]:
+        """Body size per key, scanned from disk on first use. Call under _lock."""
+        if self._sizes is None:
+            self._sizes = self._scan()
+        return self._sizes
+
+    def _scan(self) -> dict[str, int]:
+        sizes = {}
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".body"):
+                    sizes[name[:-5]] = os.path.getsize(os.path.join(root, name))
+        return sizes
+
+    def _paths(self, key: str) -> tuple[str, str]:
+        directory = os.path.join(self.cache_dir, key[:2])
+        return (
+            os.path.join(directory, key + ".json"),
+            os.path.join(directory, key + ".body"),
+        )
+
+    def key(self, url: str, params: dict | None = None) -> str:
+        return hashlib.sha256(normalize_request(url, params).encode()).hexdigest()
+
+    def ttl_for(self, url: str) -> float:
+        return self.ttls.get(endpoint_of(url), self.default_ttl)
+
+    def lookup(self, key: str) -> tuple[dict, bytes] | None:
+        """Returns (metadata, body) of an entry, or None."""
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        os.utime(body_path)  # LRU 순서 갱신
+        return meta, body
+
+    def is_fresh(self, meta: dict, ttl: float) -> bool:
+        return time.time() - meta["stored_at"] < ttl
+
+    def conditional_headers(self, meta: dict) -> dict:
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def store(self, key: str, url: str, response) -> None:
+        """Stores a 200 response."""
+        meta = {
+            "url": normalize_request(url),
+            "status_code": response.status_code,
+            "stored_at": time.time(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_type": response.headers.get("Content-Type"),
+        }
+        meta_path, body_path = self._paths(key)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        for path, data, mode in (
+            (body_path, response.content, "wb"),
+            (meta_path, json.dumps(meta), "w"),
+        ):
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, mode) as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        with self._lock:
+            self._entry_sizes()[key] = len(response.content)
+        self._evict()
+
+    def touch(self, key: str) -> None:
+        """Marks an entry as fresh again after a 304 Not Modified."""
+        meta_path, _ = self._paths(key)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            meta["stored_at"] = time.time()
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        except (OSError, ValueError):
+            pass
+
+    def response(self, url: str, meta: dict, body: bytes) -> CachedResponse:
+        headers = {}
+        if meta.get("content_type"):
+            headers["Content-Type"] = meta["content_type"]
+        return CachedResponse(url, meta["status_code"], body, headers)
+
+    def _evict(self) -> None:
+        with self._lock:
+            sizes = self._entry_sizes()
+            total = sum(sizes.values())
+            if total <= self.max_bytes:
+                return
+            entries = []
+            for key in sizes:
+                _, body_path = self._paths(key)
+                try:
+                    entries.append((os.path.getmtime(body_path), key))
+                except OSError:
+                    entries.append((0, key))
+            entries.sort()
+            for _, key in entries:
+                if total <= self.max_bytes:
+                    break
+                total -= sizes.pop(key)
+                for path in self._paths(key):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+            logger.debug(f"http cache evicted down to {total} bytes")
+
+    def count(self, outcome: str) -> None:
+        """Counts a lookup outcome: hits, revalidated or misses."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "entries": len(self._entry_sizes()),
+                "bytes": sum(self._entry_sizes().values()),
+            }
@@ -0,0 +1,237 @@
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.http_cache import ResponseCache
+from src.rate_limit import RateLimiter
+
+DEFAULT_TIMEOUT = (5, 30)  # (connect, read) seconds
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+
+class HostSlots:
+    """
+    Counting semaphore whose capacity can be changed while slots are held.
+    Requests already holding a slot release it into the same object, so a
+    resize never loses or duplicates slots.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.in_use = 0
+        self._condition = threading.Condition()
+
+    def resize(self, capacity: int) -> None:
+        with self._condition:
+            self.capacity = capacity
+            self._condition.notify_all()
+
+    def __enter__(self):
+        with self._condition:
+            while self.in_use >= self.capacity:
+                self._condition.wait()
+            self.in_use += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        with self._condition:
+            self.in_use -= 1
+            self._condition.notify()
+        return False
+
+
+class HTTPClient:
+    """
+    Shared HTTP layer for the National Assembly API and bill pages.
+
+    Keeps one keep-alive requests.Session per host, applies a default timeout,
+    retries connection errors and 5xx responses with exponential backoff, and
+    caps concurrent requests (and optionally the request rate) per host.
+    Successful responses are kept in an optional on-disk ResponseCache.
+    """
+
+    def __init__(
+        self,
+        timeout=DEFAULT_TIMEOUT,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_per_host: int = 4,
+        rate_per_host: float = 0,
+        cache: ResponseCache | None = None,
+    ):
+        """
+        Parameters:
+            timeout: Default (connect, read) timeout in seconds.
+            retries (int): Retries on connection errors and RETRY_STATUS responses.
+            backoff_factor (float): urllib3 backoff factor between retries.
+            max_per_host (int): Default concurrent requests per host, also the
+                connection pool size.
+            rate_per_host (float): Default requests per second per host. 0 disables.
+            cache (ResponseCache): Response cache. None disables caching.
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_per_host = max_per_host
+        self.rate_per_host = rate_per_host
+        self.cache = cache
+        self._sessions: dict[str, requests.Session] = {}
+        self._semaphores: dict[str, HostSlots] = {}
+        self._limiters: dict[str, RateLimiter] = {}
+        self._host_limits: dict[str, tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def configure_host(self, host: str, max_concurrency: int, rate: float = 0):
+        """
+        Overrides the concurrency cap and request rate of a single host.
+
+        The limits of an already opened host are changed in place, so requests
+        holding a slot keep counting against the same cap. The connection pool
+        size of an already opened session is kept.
+        """
+        with self._lock:
+            self._host_limits[host] = (max_concurrency, rate)
+            if host in self._sessions:
+                self._semaphores[host].resize(max_concurrency)
+                self._limiters[host].reconfigure(rate, burst=max_concurrency)
+
+    def _host_state(self, host: str):
+        with self._lock:
+            if host not in self._sessions:
+                max_concurrency, rate = self._host_limits.get(
+                    host, (self.max_per_host, self.rate_per_host)
+                )
+                retry = Retry(
+                    total=self.retries,
+                    backoff_factor=self.backoff_factor,
+                    status_forcelist=RETRY_STATUS,
+                    allowed_methods=frozenset(["GET", "HEAD"]),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=max_concurrency,
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[host] = session
+                self._semaphores[host] = HostSlots(max_concurrency)
+                self._limiters[host] = RateLimiter(rate, burst=max_concurrency)
+            return (
+                self._sessions[host],
+                self._semaphores[host],
+                self._limiters[host],
+            )
+
+    @contextmanager
+    def _slot(self, url: str):
+        session, semaphore, limiter = self._host_state(urlsplit(url).netloc)
+        with semaphore:
+            limiter.acquire()
+            yield session
+
+    def get(
+        self,
+        url: str,
+        params: dict | None = None,
+        cache_ttl: float | None = None,
+        validate=None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Sends a GET request through the pooled session of the url's host.
+
+        Parameters:
+            url (str): The request URL.
+            params (dict): Query parameters.
+            cache_ttl (float): Overrides the endpoint TTL of the cache in seconds.
+                0 bypasses the cache for this request.
+            validate (callable): validate(response) -> bool. A 200 response is
+                cached only when it returns True, e.g. open_api.is_success for
+                API error bodies sent with status 200.
+            **kwargs: Passed to requests.Session.get. `timeout` defaults to
+                the client timeout.
+
+        Returns:
+            requests.Response: The response (a CachedResponse on cache hits).
+            5xx responses are returned after the retries are exhausted,
+            connection errors are raised.
+
+        Raises:
+            ValueError: With stream=True. Use stream() so the host slot is held
+                while the body is read.
+        """
+        if kwargs.get("stream"):
+            raise ValueError("use HTTPClient.stream() for streaming requests")
+        kwargs.setdefault("timeout", self.timeout)
+        ttl = 0
+        if self.cache is not None:
+            ttl = self.cache.ttl_for(url) if cache_ttl is None else cache_ttl
+        if ttl <= 0:
+            with self._slot(url) as session:
+                return session.get(url, params=params, **kwargs)
+
+        key = self.cache.key(url, params)
+        cached = self.cache.lookup(key)
+        if cached is not None:
+            meta, body = cached
+            if self.cache.is_fresh(meta, ttl):
+                self.cache.count("hits")
+                return self.cache.response(url, meta, body)
+            headers = dict(kwargs.pop("headers", None) or {})
+            headers.update(self.cache.conditional_headers(meta))
+            kwargs["headers"] = headers
+
+        with self._slot(url) as session:
+            response = session.get(url, params=params, **kwargs)
+
+        if cached is not None and response.status_code == 304:
+            self.cache.count("revalidated")
+            self.cache.touch(key)
+            return self.cache.response(url, *cached)
+        self.cache.count("misses")
+        if response.status_code == 200 and (validate is None or validate(response)):
+            self.cache.store(key, url, response)
+        return response
+
+    @contextmanager
+    def stream(self, url: str, params: dict | None = None, **kwargs):
+        """
+        Sends a streaming GET request, bypassing the cache.
+
+        The host slot is held until the block ends, so reading the body counts
+        against the host's concurrency cap. The response is closed at the end
+        of the block.
+
+        Parameters:
+            url (str): The request URL.
+            params (dict): Query parameters.
+            **kwargs: Passed to requests.Session.get.
+
+        Yields:
+            requests.Response: The response. Read the body with iter_content().
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        with self._slot(url) as session:
+            response = session.get(url, params=params, stream=True, **kwargs)
+            try:
+                yield response
+            finally:
+                response.close()
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._semaphores.clear()
+            self._limiters.clear()
+
+
+http_client = HTTPClient(cache=ResponseCache.from_env())
@@ -0,0 +1,450 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from src.dna_logger import logger
+from src.embedding import EmbeddingStage
+from src.extractors import (
+    BillExtractor,
+    ConfExtractor,
+    LinkDeduplicator,
+    build_bill_record,
+    get_handler,
+    parse_bill,
+    parse_bill_page,
+    save_bills,
+)
+from src.http_client import http_client
+from src.open_api import iter_rows
+from src.pipeline import Pipeline, Stage
+from src.summary import Summarizer
+from src.translation_queue import TranslationQueue
+
+NA_API_HOST = "open.assembly.go.kr"
+BILL_PAGE_HOST = "likms.assembly.go.kr"
+
+
+class BillIngestionRunner:
+    """
+    Fetches, parses and saves bills from their billDetail.do links.
+
+    The three stages run with separate limits: `max_workers` concurrent fetches
+    (HTML page + ALLBILL call), `parse_workers` concurrent parses, and saves in
+    batches of `save_batch_size` records on the calling thread. Requests are
+    capped per host through the shared http_client. Failed links are kept in
+    `retry_links` so they can be run again.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        rate_per_host: float = 5.0,
+        parse_workers: int = 2,
+        save_batch_size: int = 50,
+        extractor_cls=BillExtractor,
+    ):
+        """
+        Parameters:
+            max_workers (int): Number of bills fetched concurrently.
+            rate_per_host (float): Requests per second per host. 0 disables.
+            parse_workers (int): Number of concurrent parses.
+            save_batch_size (int): Records saved per save_bills call.
+            extractor_cls: Extractor class constructed per link.
+        """
+        self.max_workers = max_workers
+        self.parse_workers = parse_workers
+        self.save_batch_size = save_batch_size
+        self.extractor_cls = extractor_cls
+        self.retry_links: list[str] = []
+        for host in (NA_API_HOST, BILL_PAGE_HOST):
+            http_client.configure_host(host, max_workers, rate_per_host)
+
+    def _fetch(self, link: str):
+        return self.extractor_cls(link).fetch()
+
+    def run(self, links) -> dict[str, float]:
+        """
+        Processes bill links.
+
+        Parameters:
+            links (list): billDetail.do URLs.
+
+        Returns:
+            dict: succeeded / failed counts, elapsed seconds and bills per second.
+        """
+        links = list(dict.fromkeys(links))  # 중복 링크 제거, 순서 유지
+        succeeded = 0
+        failed_links = []
+        records = []
+        started = time.perf_counter()
+
+        def flush():
+            nonlocal succeeded, records
+            if not records:
+                return
+            batch, records = records, []
+            try:
+                save_bills([record for _, record in batch])
+                succeeded += len(batch)
+            except Exception as e:
+                logger.error(f"Failed to save {len(batch)} bills: {str(e)}")
+                failed_links.extend(link for link, _ in batch)
+
+        with ThreadPoolExecutor(self.max_workers) as fetch_pool, ThreadPoolExecutor(
+            self.parse_workers
+        ) as parse_pool:
+            pending = {
+                fetch_pool.submit(self._fetch, link): ("fetch", link) for link in links
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, link = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to {stage} URL {link}: {str(e)}")
+                        failed_links.append(link)
+                        continue
+
+                    if stage == "fetch":
+                        pending[parse_pool.submit(parse_bill, *result)] = (
+                            "parse",
+                            link,
+                        )
+                    elif result is None:
+                        logger.error(f"Failed to parse URL {link}: no bill info")
+                        failed_links.append(link)
+                    else:
+                        records.append((link, result))
+                        if len(records) >= self.save_batch_size:
+                            flush()
+            flush()
+
+        elapsed = time.perf_counter() - started
+        rate = succeeded / elapsed if elapsed else 0.0
+        self.retry_links = failed_links
+        logger.info(
+            f"Ingested {succeeded}/{len(links)} bills in {elapsed:.1f}s ({rate:.2f} bills/s)"
+        )
+        if failed_links:
+            logger.warning(f"{len(failed_links)} bills queued for retry")
+
+        return {
+            "succeeded": succeeded,
+            "failed": len(failed_links),
+            "elapsed": elapsed,
+            "bills_per_second": rate,
+        }
+
+    def retry(self) -> dict[str, float]:
+        """Runs the links that failed in the previous run again."""
+        return self.run(self.retry_links)
+
+
+class BillHarvester:
+    """
+    Bulk-loads bill metadata by paging through ALLBILL for a whole assembly.
+
+    Instead of one ALLBILL lookup per scraped bill number, rows arrive
+    MAX_PAGE_SIZE at a time. The detail page is fetched only for bills whose
+    summary is not stored yet; the rest keep their stored summary and PDF url
+    and get their metadata (committee, resolution result...) refreshed.
+    Batches that could not be saved are kept in `failed_batches` and can be
+    run again with retry().
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        rate_per_host: float = 5.0,
+        batch_size: int = 500,
+    ):
+        """
+        Parameters:
+            max_workers (int): Concurrent detail page fetches.
+            rate_per_host (float): Requests per second per host. 0 disables.
+            batch_size (int): ALLBILL rows processed and saved together.
+        """
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.failed_links: list[str] = []
+        self.failed_batches: list[list[dict]] = []
+        for host in (NA_API_HOST, BILL_PAGE_HOST):
+            http_client.configure_host(host, max_workers, rate_per_host)
+
+    @staticmethod
+    def _fetch_page(link: str):
+        """Returns (summary, bill_no, pdf_url) of a detail page, or None."""
+        try:
+            response = http_client.get(link)
+        except Exception as e:
+            logger.error(f"Failed to fetch URL {link}: {str(e)}")
+            return None
+        if response.status_code != 200:
+            logger.error(f"Failed to fetch URL {link}: status {response.status_code}")
+            return None
+        return parse_bill_page(response.content)
+
+    def _process(self, rows: list[dict], executor, counts: dict):
+        with get_handler() as db_handler:
+            stored = db_handler.get_stored_summaries([row["BILL_ID"] for row in rows])
+        if stored is None:
+            raise RuntimeError("failed to read stored summaries")
+
+        missing = [row for row in rows if row["BILL_ID"] not in stored]
+        pages = dict(
+            zip(
+                (row["BILL_ID"] for row in missing),
+                executor.map(self._fetch_page, (row["LINK_URL"] for row in missing)),
+            )
+        )
+
+        records = []
+        for row in rows:
+            if row["BILL_ID"] in stored:
+                summary, pdf_url = stored[row["BILL_ID"]]
+            elif pages[row["BILL_ID"]] is None:
+                self.failed_links.append(row["LINK_URL"])
+                continue
+            else:
+                summary, _, pdf_url = pages[row["BILL_ID"]]
+            records.append(build_bill_record(row, summary, pdf_url))
+        for key, value in save_bills(records).items():
+            counts[key] += value
+        counts["pages_fetched"] += len(missing)
+
+    def _process_batch(self, rows: list[dict], executor, counts: dict):
+        # 저장에 실패한 batch는 나머지 batch를 계속 처리하고 retry()로 다시 시도한다
+        try:
+            self._process(rows, executor, counts)
+        except RuntimeError as e:
+            logger.error(f"Failed to harvest a batch of {len(rows)} bills: {str(e)}")
+            self.failed_batches.append(rows)
+            counts["failed_rows"] += len(rows)
+
+    @staticmethod
+    def _new_counts() -> dict:
+        return {
+            "rows": 0,
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "pages_fetched": 0,
+            "failed_rows": 0,
+        }
+
+    def run(self, age: int, start_date: str | None = None, end_date: str | None = None):
+        """
+        Harvests the bills of an assembly.
+
+        Parameters:
+            age (int): Assembly number (ALLBILL AGE).
+            start_date (str): Keep only bills proposed on or after YYYY-MM-DD.
+            end_date (str): Keep only bills proposed on or before YYYY-MM-DD.
+
+        Returns:
+            dict: Row, save and detail page fetch counts and elapsed seconds.
+        """
+        counts = self._new_counts()
+        self.failed_links = []
+        self.failed_batches = []
+        started = time.perf_counter()
+        batch = []
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            for row in iter_rows("ALLBILL", {"AGE": age}, fmt="xml", prefetch=True):
+                if not row.get("BILL_ID") or not row.get("BILL_NO"):
+                    continue
+                proposed = row.get("PPSL_DT") or ""
+                if (start_date and proposed < start_date) or (
+                    end_date and proposed > end_date
+                ):
+                    continue
+                counts["rows"] += 1
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    self._process_batch(batch, executor, counts)
+                    batch = []
+            if batch:
+                self._process_batch(batch, executor, counts)
+
+        counts["elapsed"] = time.perf_counter() - started
+        logger.info(
+            f"Harvested {counts['rows']} bills of assembly {age} in "
+            f"{counts['elapsed']:.1f}s ({counts['pages_fetched']} detail pages, "
+            f"{len(self.failed_links)} failed, {counts['failed_rows']} rows not saved)"
+        )
+        return counts
+
+    def retry(self) -> dict:
+        """
+        Processes the batches that could not be saved in the previous run again.
+
+        Returns:
+            dict: The same counts as run(), for the retried rows only.
+        """
+        batches, self.failed_batches = self.failed_batches, []
+        counts = self._new_counts()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            for rows in batches:
+                counts["rows"] += len(rows)
+                self._process_batch(rows, executor, counts)
+        counts["elapsed"] = time.perf_counter() - started
+        logger.info(
+            f"Retried {counts['rows']} bills, {counts['failed_rows']} rows not saved"
+        )
+        return counts
+
+
+def build_ingestion_pipeline(
+    fetch_workers: int = 8,
+    parse_workers: int = 2,
+    llm_workers: int = 2,
+    rate_per_host: float = 5.0,
+    save_batch_size: int = 50,
+    embed_batch_size: int = 100,
+    summarize: bool = False,
+    translate: bool = True,
+    embed: bool = False,
+) -> Pipeline:
+    """
+    Builds the streaming ingestion pipeline:
+    fetch_conf -> fetch_bill -> parse -> save -> summarize -> translate -> embed.
+
+    Source items are (dae_num, date) tuples. Bill links are deduplicated across
+    conferences and dates before any bill fetch.
+
+    The translate stage only adds the saved bills to the translation_jobs
+    queue, which the translation worker processes. The summarize and embed
+    stages call the LLM backend, so they are off unless requested.
+
+    Parameters:
+        fetch_workers (int): Concurrent bill fetches.
+        parse_workers (int): Concurrent parses.
+        llm_workers (int): Workers of the summarize stage.
+        rate_per_host (float): Requests per second per National Assembly host.
+        save_batch_size (int): Records per save_bills call.
+        embed_batch_size (int): Bills per embedding batch.
+        summarize (bool): Include the summarize stage (LLM calls).
+        translate (bool): Include the translate stage (enqueue only).
+        embed (bool): Include the embed stage (LLM calls).
+
+    Returns:
+        Pipeline: Call run() with the (dae_num, date) tuples.
+    """
+    for host in (NA_API_HOST, BILL_PAGE_HOST):
+        http_client.configure_host(host, fetch_workers, rate_per_host)
+
+    seen_links = LinkDeduplicator()
+
+    def fetch_conf(item):
+        dae_num, date = item
+        conf = ConfExtractor(dae_num, date, seen_links=seen_links)
+        if not conf.conf_ids:
+            logger.info(f"info: No Conf on {date}")
+            return []
+        conf.save_conf("localhost", "root", None)
+        return conf.links
+
+    # 실패한 링크는 seen_links에서 풀어 다른 날짜나 다음 실행에서 다시 수집한다
+    def fetch_bill(link):
+        try:
+            return link, BillExtractor(link).fetch()
+        except Exception:
+            seen_links.release([link])
+            raise
+
+    def parse(item):
+        link, raw = item
+        record = parse_bill(*raw)
+        if record is None:
+            logger.error(f"Failed to parse URL {link}: no bill info")
+            seen_links.release([link])
+            return None
+        return link, record
+
+    def save(items):
+        records = [record for _, record in items]
+        try:
+            save_bills(records)
+        except Exception:
+            seen_links.release(link for link, _ in items)
+            raise
+        return records
+
+    def summarize_bill(record):
+        # 요약이 없어 bill_body가 BILL_NM으로 대체된 의안은 요약하지 않는다
+        if not record["bill_body"] or record["bill_body"] == record["bill_title"]:
+            logger.info(f"info: No summary to summarize for bill {record['bill_id']}")
+            return record
+        summarizer = Summarizer(record["bill_body"])
+        summarizer.bill_id = record["bill_id"]
+        with get_handler() as db_handler:
+            db_handler.save_summary(summarizer)
+        return record
+
+    def enqueue_translations(records):
+        # 번역은 translation_jobs 큐의 worker가 재시도/중복 관리와 함께 처리한다
+        with get_handler() as db_handler:
+            TranslationQueue(db_handler).enqueue_missing(
+                record["bill_id"] for record in records
+            )
+        return records
+
+    # 배치마다 스레드 풀을 새로 만들지 않도록 하나의 stage를 재사용
+    embedding_stage = EmbeddingStage(batch_size=embed_batch_size) if embed else None
+
+    def embed_bills(records):
+        bills = [
+            {
+                "bill_id": record["bill_id"],
+                "bill_title": record["bill_title"],
+                "bill_summary": record["bill_body"],
+            }
+            for record in records
+        ]
+        with get_handler() as db_handler:
+            embedding_stage.run(bills, db_handler)
+
+    stages = [
+        Stage("fetch_conf", fetch_conf, workers=2, queue_size=10, fan_out=True),
+        Stage("fetch_bill", fetch_bill, workers=fetch_workers, queue_size=200),
+        Stage("parse", parse, workers=parse_workers, queue_size=fetch_workers * 2),
+        Stage(
+            "save",
+            save,
+            workers=1,
+            queue_size=save_batch_size * 2,
+            batch_size=save_batch_size,
+            fan_out=True,
+        ),
+    ]
+    if summarize:
+        stages.append(Stage("summarize", summarize_bill, workers=llm_workers))
+    if translate:
+        # translation_jobs.bill_id가 unique이므로 한 worker에서 순서대로 추가한다
+        stages.append(
+            Stage(
+                "translate",
+                enqueue_translations,
+                workers=1,
+                queue_size=save_batch_size * 2,
+                batch_size=save_batch_size,
+                fan_out=True,
+            )
+        )
+    if embed:
+        stages.append(
+            Stage(
+                "embed",
+                embed_bills,
+                workers=1,
+                queue_size=embed_batch_size * 2,
+                batch_size=embed_batch_size,
+                batch_timeout=10.0,
+                close=embedding_stage.close,
+            )
+        )
+    # 마지막 stage의 결과를 실행 내내 메모리에 쌓지 않는다
+    stages[-1].sink = True
+    return Pipeline(stages)
@@ -0,0 +1,376 @@
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+
+from src.load import api_keyManager
+from src.dna_logger import logger
+
+DEFAULT_MODEL = "gemini-1.5-flash"
+DEFAULT_EMBEDDING_MODEL = "models/text-embedding-004"
+DEFAULT_STOP_SEQUENCE = "종료!"
+
+
+class LLMBackendError(Exception):
+    """Raised when a backend cannot produce a response."""
+
+
+def request_key(kind: str, model: str, payload) -> str:
+    """
+    Builds a stable key for a generation or embedding request.
+
+    Parameters:
+        kind (str): "generate" or "embed".
+        model (str): The model name used for the request.
+        payload: Any JSON serializable request body.
+
+    Returns:
+        str: A sha256 hex digest identifying the request.
+    """
+    raw = json.dumps(
+        {"kind": kind, "model": model, "payload": payload},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def generate_key(
+    model: str,
+    system_instruction: str,
+    text: str,
+    temperature: float = 0,
+    stop_sequences: list[str] | None = None,
+) -> str:
+    """
+    Key of a generation request. The sampling settings are part of the key,
+    so a replay never returns a response recorded with other settings.
+    """
+    return request_key(
+        "generate",
+        model,
+        {
+            "system_instruction": system_instruction,
+            "text": text,
+            "temperature": temperature,
+            "stop_sequences": list(stop_sequences or [DEFAULT_STOP_SEQUENCE]),
+        },
+    )
+
+
+class LLMBackend:
+    """
+    Interface used by Summarizer, KeywordExtractor and the embedding code.
+
+    Subclasses implement generate() and embed(). `request_interval` is the pause
+    callers should keep between consecutive requests to stay under the quota.
+    """
+
+    name = "base"
+    request_interval = 0.0
+
+    def generate(
+        self,
+        text: str,
+        system_instruction: str,
+        model: str = DEFAULT_MODEL,
+        temperature: float = 0,
+        stop_sequences: list[str] | None = None,
+    ) -> str:
+        """
+        Generates text for a single prompt.
+
+        Parameters:
+            text (str): The user content.
+            system_instruction (str): The system instruction for the model.
+            model (str): The model name.
+            temperature (float): Sampling temperature.
+            stop_sequences (list): Stop sequences for the generation.
+
+        Returns:
+            str: The generated text.
+        """
+        raise NotImplementedError
+
+    def embed(
+        self, texts: list[str], model: str = DEFAULT_EMBEDDING_MODEL
+    ) -> list[list[float]]:
+        """
+        Embeds a list of texts.
+
+        Parameters:
+            texts (list): The texts to embed.
+            model (str): The embedding model name.
+
+        Returns:
+            list: One embedding vector per text, in input order.
+        """
+        raise NotImplementedError
+
+
+class GeminiBackend(LLMBackend):
+    """
+    Backend calling Google Generative AI (gemini).
+    """
+
+    name = "gemini"
+    request_interval = 4.0
+
+    def __init__(self, api_key: str | None = None):
+        import google.generativeai as genai
+
+        self.genai = genai
+        self.genai.configure(api_key=api_key or api_keyManager.get_ggl_api_key())
+
+    def generate(
+        self,
+        text,
+        system_instruction,
+        model=DEFAULT_MODEL,
+        temperature=0,
+        stop_sequences=None,
+    ):
+        generative_model = self.genai.GenerativeModel(
+            model, system_instruction=system_instruction
+        )
+        config = self.genai.GenerationConfig(
+            temperature=temperature,
+            stop_sequences=stop_sequences or [DEFAULT_STOP_SEQUENCE],
+        )
+        response = generative_model.generate_content(
+            contents=[text], generation_config=config
+        )
+        return response.text
+
+    def embed(self, texts, model=DEFAULT_EMBEDDING_MODEL):
+        result = self.genai.embed_content(model=model, content=list(texts))
+        return result["embedding"]
+
+
+class StubBackend(LLMBackend):
+    """
+    Deterministic offline backend for benchmarks and load tests.
+
+    The same request always yields the same response. Latency and failures are
+    injected to mimic the remote API.
+    """
+
+    name = "stub"
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        embedding_dim: int = 768,
+        seed: int = 0,
+    ):
+        """
+        Parameters:
+            latency (float): Seconds to sleep per request.
+            jitter (float): Extra random seconds added to the latency (0 ~ jitter).
+            failure_rate (float): Probability (0 ~ 1) that a request raises LLMBackendError.
+            embedding_dim (int): Dimension of the generated embedding vectors.
+            seed (int): Seed for latency jitter and failure injection.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.embedding_dim = embedding_dim
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def _simulate(self):
+        with self._lock:
+            self.calls += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            failed = self._random.random() < self.failure_rate
+        if delay > 0:
+            time.sleep(delay)
+        if failed:
+            raise LLMBackendError("stub: injected failure")
+
+    def generate(
+        self,
+        text,
+        system_instruction,
+        model=DEFAULT_MODEL,
+        temperature=0,
+        stop_sequences=None,
+    ):
+        self._simulate()
+        digest = generate_key(
+            model, system_instruction, text, temperature, stop_sequences
+        )[:8]
+        return f"[stub {digest}] {text[:200]}"
+
+    def embed(self, texts, model=DEFAULT_EMBEDDING_MODEL):
+        self._simulate()
+        embeddings = []
+        for text in texts:
+            rng = random.Random(request_key("embed", model, text))
+            embeddings.append(
+                [rng.uniform(-1.0, 1.0) for _ in range(self.embedding_dim)]
+            )
+        return embeddings
+
+
+class RecordingBackend(LLMBackend):
+    """
+    Wraps another backend and captures every response into `record_dir`,
+    so the run can be replayed offline with ReplayBackend.
+    """
+
+    name = "record"
+
+    def __init__(self, backend: LLMBackend, record_dir: str):
+        self.backend = backend
+        self.record_dir = record_dir
+        self.request_interval = backend.request_interval
+        os.makedirs(record_dir, exist_ok=True)
+
+    def _write(self, key: str, response):
+        path = os.path.join(self.record_dir, key + ".json")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"response": response}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def generate(
+        self,
+        text,
+        system_instruction,
+        model=DEFAULT_MODEL,
+        temperature=0,
+        stop_sequences=None,
+    ):
+        response = self.backend.generate(
+            text, system_instruction, model, temperature, stop_sequences
+        )
+        self._write(
+            generate_key(model, system_instruction, text, temperature, stop_sequences),
+            response,
+        )
+        return response
+
+    def embed(self, texts, model=DEFAULT_EMBEDDING_MODEL):
+        embeddings = self.backend.embed(texts, model)
+        for text, embedding in zip(texts, embeddings):
+            self._write(request_key("embed", model, text), embedding)
+        return embeddings
+
+
+class ReplayBackend(LLMBackend):
+    """
+    Serves responses captured by RecordingBackend.
+
+    Requests that were never recorded raise LLMBackendError, unless a
+    `fallback` backend is given.
+    """
+
+    name = "replay"
+
+    def __init__(self, record_dir: str, fallback: LLMBackend | None = None):
+        self.record_dir = record_dir
+        self.fallback = fallback
+
+    def _read(self, key: str):
+        path = os.path.join(self.record_dir, key + ".json")
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)["response"]
+        except FileNotFoundError:
+            return None
+
+    def generate(
+        self,
+        text,
+        system_instruction,
+        model=DEFAULT_MODEL,
+        temperature=0,
+        stop_sequences=None,
+    ):
+        response = self._read(
+            generate_key(model, system_instruction, text, temperature, stop_sequences)
+        )
+        if response is not None:
+            return response
+        if self.fallback is not None:
+            return self.fallback.generate(
+                text, system_instruction, model, temperature, stop_sequences
+            )
+        raise LLMBackendError("replay: no recorded response for request")
+
+    def embed(self, texts, model=DEFAULT_EMBEDDING_MODEL):
+        embeddings = [self._read(request_key("embed", model, text)) for text in texts]
+        missing = [text for text, emb in zip(texts, embeddings) if emb is None]
+        if missing:
+            if self.fallback is None:
+                raise LLMBackendError(
+                    f"replay: {len(missing)} embedding(s) were not recorded"
+                )
+            filled = iter(self.fallback.embed(missing, model))
+            embeddings = [emb if emb is not None else next(filled) for emb in embeddings]
+        return embeddings
+
+
+def create_llm_backend(kind: str | None = None) -> LLMBackend:
+    """
+    Creates a backend from environment variables.
+
+    LLM_BACKEND           gemini (default) | stub | record | replay
+    LLM_STUB_LATENCY      stub latency in seconds
+    LLM_STUB_JITTER       stub latency jitter in seconds
+    LLM_STUB_FAILURE_RATE stub failure probability
+    LLM_RECORD_DIR        directory of captured responses (record / replay)
+
+    Parameters:
+        kind (str): Overrides LLM_BACKEND.
+
+    Returns:
+        LLMBackend: The configured backend.
+    """
+    kind = (kind or os.getenv("LLM_BACKEND", "gemini")).lower()
+    record_dir = os.getenv("LLM_RECORD_DIR", "./llm_records")
+
+    if kind == "gemini":
+        return GeminiBackend()
+    if kind == "stub":
+        return StubBackend(
+            latency=float(os.getenv("LLM_STUB_LATENCY", "0")),
+            jitter=float(os.getenv("LLM_STUB_JITTER", "0")),
+            failure_rate=float(os.getenv("LLM_STUB_FAILURE_RATE", "0")),
+        )
+    if kind == "record":
+        return RecordingBackend(GeminiBackend(), record_dir)
+    if kind == "replay":
+        return ReplayBackend(record_dir)
+    raise ValueError(f"Unknown LLM backend: {kind}")
+
+
+_backend: LLMBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def get_llm_backend() -> LLMBackend:
+    """
+    Returns the process wide backend, creating it on first use.
+    """
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = create_llm_backend()
+            logger.info(f"LLM backend: {_backend.name}")
+        return _backend
+
+
+def set_llm_backend(backend: LLMBackend):
+    """
+    Replaces the process wide backend (e.g. with a StubBackend for load tests).
+    """
+    global _backend
+    with _backend_lock:
+        _backend = backend
@@ -9,6 +9,7 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Float,
+    Index,
     UniqueConstraint,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -91,6 +92,9 @@ class Bill(Base):
     )  # 추가된 필드
     bill_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     pdf_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    # 의안 원문 PDF (pdf_store의 sha256 파일명)와 추출한 본문
+    pdf_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    pdf_text: Mapped[Optional[str]] = mapped_column(Text(16777215), nullable=True)
     # Relationship with BillSummaryRelation and BillSummary
     # summaries = relationship("BillSummary", back_populates="bill", cascade="all, delete-orphan")
 
@@ -99,7 +103,7 @@ class Content(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
-    content_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    content_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     docstype_index: Mapped[int] = mapped_column(Integer, default=0)
     views: Mapped[int] = mapped_column(Integer, default=0)
     likes: Mapped[int] = mapped_column(Integer, default=0)
@@ -111,15 +115,16 @@ class Like(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(Integer, nullable=False)
-    content_id: Mapped[str] = mapped_column(String(500), nullable=False)
+    content_id: Mapped[str] = mapped_column(String(255), nullable=False)
     like_type: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    __table_args__ = (Index("ix_likes_user_id_content_id", "user_id", "content_id"),)
 
 class Comment(Base):
     __tablename__ = "comments"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(Integer, nullable=False)
-    content_id: Mapped[str] = mapped_column(String(500), nullable=False)
+    content_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     comment_text: Mapped[str] = mapped_column(Text, nullable=False)
     parent_id: Mapped[int] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -138,11 +143,14 @@ class UserPageVisit(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(Integer, nullable=False)
-    page_id: Mapped[str] = mapped_column(Text, nullable=False)
+    page_id: Mapped[str] = mapped_column(String(255), nullable=False)
     visit_time: Mapped[int] = mapped_column(Integer, nullable=False)
     visited_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=datetime.now
     )
+    __table_args__ = (
+        Index("ix_user_page_visits_user_id_visited_at", "user_id", "visited_at"),
+    )
 
 
 class UserContentMetric(Base):
@@ -164,6 +172,10 @@ class BillsEmbedding(Base):
         String(255), ForeignKey("bills.bill_id"), nullable=False
     )
     embedding: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    # 임베딩에 사용한 텍스트의 sha256, 텍스트가 바뀌지 않으면 다시 계산하지 않음
+    text_hash: Mapped[Optional[str]] = mapped_column(
+        String(64), nullable=True, index=True
+    )
 
 
 class BillSummary(Base):
@@ -282,6 +294,11 @@ class SimilarityScore(Base):
     similarity_score: Mapped[float] = mapped_column(Float, nullable=False)
     __table_args__ = (
         UniqueConstraint("source_bill_id", "target_bill_id", name="uq_source_target"),
+        Index(
+            "ix_similarity_scores_source_bill_id_similarity_score",
+            "source_bill_id",
+            "similarity_score",
+        ),
     )
 
 
@@ -291,3 +308,23 @@ class DateChecker(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     content_date: Mapped[datetime] = mapped_column(Date, nullable=False)
     execute_date: Mapped[datetime] = mapped_column(Date, nullable=False)
+
+
+class TranslationJob(Base):
+    __tablename__ = "translation_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    bill_id: Mapped[str] = mapped_column(
+        String(255), ForeignKey("bills.bill_id"), unique=True, nullable=False
+    )
+    # pending / in_flight / done / failed
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="pending", index=True
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    worker_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.now
+    )
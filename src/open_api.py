@@ -0,0 +1,193 @@
+import io
+import json
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+from src.dna_logger import logger
+from src.http_client import http_client
+from src.load import api_keyManager
+
+OPEN_API_URL = "https://open.assembly.go.kr/portal/openapi/"
+MAX_PAGE_SIZE = 1000  # 열린국회 API가 한 번에 돌려주는 최대 row 수
+
+SUCCESS_CODE = "INFO-000"
+NO_DATA_CODE = "INFO-200"  # 해당하는 데이터가 없습니다
+
+
+class OpenAPIError(Exception):
+    """Raised when the National Assembly open API returns an error."""
+
+
+class Page:
+    """One page of an endpoint: total row count and a row iterator."""
+
+    def __init__(self, total: int, rows):
+        self.total = total
+        self.rows = rows
+
+
+def parse_xml_page(content: bytes) -> Page:
+    """
+    Parses an XML page incrementally with ET.iterparse. The head (row count
+    and result code) is read first; rows are then parsed lazily, yielded as
+    dicts of tag -> text and cleared right after.
+    """
+    events = ET.iterparse(io.BytesIO(content), events=("start", "end"))
+    total, code, message = 0, None, None
+    root = None
+    for event, elem in events:
+        if root is None:
+            root = elem
+        if event == "start":
+            if elem.tag == "row":
+                break
+            continue
+        if elem.tag == "list_total_count":
+            total = int(elem.text or 0)
+        elif elem.tag == "CODE":
+            code = elem.text
+        elif elem.tag == "MESSAGE":
+            message = elem.text
+    else:
+        events = iter(())
+    _check_result(code, message)
+
+    def rows():
+        for event, elem in events:
+            if event == "end" and elem.tag == "row":
+                yield {child.tag: child.text for child in elem}
+                root.clear()
+
+    return Page(total, rows())
+
+
+def parse_json_page(content: bytes, endpoint: str) -> Page:
+    data = json.loads(content)
+    if endpoint not in data:
+        result = data.get("RESULT", {})
+        _check_result(result.get("CODE"), result.get("MESSAGE"))
+        return Page(0, iter(()))
+    head, body = data[endpoint][0]["head"], data[endpoint][1]
+    total = head[0]["list_total_count"]
+    result = head[1]["RESULT"]
+    _check_result(result.get("CODE"), result.get("MESSAGE"))
+    return Page(total, iter(body.get("row", [])))
+
+
+def result_code(content: bytes, fmt: str = "xml", endpoint: str | None = None):
+    """
+    Reads only the RESULT CODE of a page, e.g. INFO-000. Returns None when the
+    body cannot be parsed or has no code.
+    """
+    try:
+        if fmt == "xml":
+            for _, elem in ET.iterparse(io.BytesIO(content)):
+                if elem.tag == "CODE":
+                    return elem.text
+                if elem.tag == "row":
+                    return None
+            return None
+        data = json.loads(content)
+        if endpoint in data:
+            return data[endpoint][0]["head"][1]["RESULT"]["CODE"]
+        return data.get("RESULT", {}).get("CODE")
+    except (ET.ParseError, ValueError, LookupError, TypeError, AttributeError):
+        return None
+
+
+def is_success(response, fmt: str = "xml", endpoint: str | None = None) -> bool:
+    """
+    True when a response carries INFO-000. The API answers errors, quota
+    limits and "no data" with HTTP 200, so only these responses are cached.
+    """
+    return result_code(response.content, fmt, endpoint) == SUCCESS_CODE
+
+
+def _check_result(code, message):
+    if code not in (None, SUCCESS_CODE, NO_DATA_CODE):
+        raise OpenAPIError(f"{code}: {message}")
+
+
+def iter_rows(
+    endpoint: str,
+    params: dict | None = None,
+    fmt: str = "xml",
+    page_size: int = MAX_PAGE_SIZE,
+    prefetch: bool = False,
+    max_rows: int | None = None,
+    client=None,
+    cache_ttl: float | None = None,
+):
+    """
+    Yields every row of an open API endpoint, following pIndex until
+    list_total_count rows were read.
+
+    Only one page is held in memory at a time (two with `prefetch`), so large
+    endpoints are consumed with constant memory.
+
+    Parameters:
+        endpoint (str): Endpoint name, e.g. ALLSCHEDULE or VCONFBILLLIST.
+        params (dict): Query parameters besides KEY, Type, pIndex and pSize.
+        fmt (str): "xml" (parsed with ET.iterparse) or "json".
+        page_size (int): Rows per request, at most MAX_PAGE_SIZE.
+        prefetch (bool): Request the next page while the current one is consumed.
+        max_rows (int): Stop after this many rows.
+        client: HTTP client with a requests-like get() that accepts the
+            `validate` and `cache_ttl` keywords. Defaults to http_client.
+        cache_ttl (float): Overrides the endpoint TTL of the response cache.
+            0 bypasses the cache.
+
+    Yields:
+        dict: One row, field name -> value.
+
+    Raises:
+        OpenAPIError: On a non-200 response or an error result code.
+    """
+    client = client or http_client
+    url = OPEN_API_URL + endpoint
+    page_size = min(page_size, MAX_PAGE_SIZE)
+    base_params = {
+        "KEY": api_keyManager.get_na_api_key(),
+        "Type": fmt,
+        "pSize": page_size,
+        **(params or {}),
+    }
+
+    def fetch(index: int) -> Page:
+        response = client.get(
+            url,
+            params={**base_params, "pIndex": index},
+            validate=lambda response: is_success(response, fmt, endpoint),
+            cache_ttl=cache_ttl,
+        )
+        if response.status_code != 200:
+            raise OpenAPIError(
+                f"{endpoint} page {index} failed with status code {response.status_code}"
+            )
+        if fmt == "xml":
+            return parse_xml_page(response.content)
+        return parse_json_page(response.content, endpoint)
+
+    executor = ThreadPoolExecutor(1) if prefetch else None
+    try:
+        index = 1
+        page = fetch(index)
+        read = 0
+        while True:
+            has_next = index * page_size < page.total
+            upcoming = executor.submit(fetch, index + 1) if has_next and executor else None
+            count = 0
+            for row in page.rows:
+                yield row
+                count += 1
+                read += 1
+                if max_rows is not None and read >= max_rows:
+                    return
+            if not has_next or count == 0:
+                return
+            index += 1
+            page = upcoming.result() if upcoming else fetch(index)
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        logger.debug(f"open api {endpoint}: read pages up to pIndex {index}")
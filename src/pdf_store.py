@@ -0,0 +1,247 @@
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+
+from pypdf import PdfReader
+
+from src.db_handler import DBHandler
+from src.dna_logger import logger
+from src.http_client import http_client
+from src.query_metrics import query_metrics
+
+CHUNK_SIZE = 64 * 1024
+
+
+def extract_pdf_text(path: str) -> str:
+    """Extracts the text of a PDF file. Runs in a worker process."""
+    reader = PdfReader(path)
+    return "\n".join(page.extract_text() or "" for page in reader.pages).strip()
+
+
+class PdfStore:
+    """
+    Content-addressed file store: each file is saved as <sha256>.pdf under a
+    two-character fan-out directory, so identical files are kept once.
+
+    The digest of every downloaded url is recorded under urls/, so a url
+    whose file is already stored is not downloaded again. Bill PDFs do not
+    change once published, so the entries do not expire.
+    """
+
+    def __init__(self, root: str = "./.pdf_store"):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def path_for(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest + ".pdf")
+
+    def has(self, digest: str | None) -> bool:
+        return bool(digest) and os.path.exists(self.path_for(digest))
+
+    def _url_path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.root, "urls", key[:2], key)
+
+    def digest_for(self, url: str) -> str | None:
+        """Returns the digest of a url downloaded before, if its file is stored."""
+        try:
+            with open(self._url_path(url), encoding="utf-8") as f:
+                digest = f.read().strip()
+        except OSError:
+            return None
+        return digest if self.has(digest) else None
+
+    def _remember(self, url: str, digest: str) -> None:
+        path = self._url_path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(digest)
+        os.replace(tmp_path, path)
+
+    def download(self, url: str) -> tuple[str, int]:
+        """
+        Streams `url` to the store in CHUNK_SIZE chunks while hashing it.
+
+        Returns:
+            tuple: (sha256 hex digest, bytes written). Bytes written is 0 when
+            the same content was already stored.
+
+        Raises:
+            IOError: On a non-200 response.
+        """
+        tmp_path = os.path.join(self.root, f".{threading.get_ident()}.part")
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            # 본문을 다 읽을 때까지 host slot을 잡고 있는다
+            with http_client.stream(url) as response:
+                if response.status_code != 200:
+                    raise IOError(f"status code {response.status_code}")
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        digest.update(chunk)
+                        f.write(chunk)
+                        size += len(chunk)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        digest = digest.hexdigest()
+        path = self.path_for(digest)
+        if os.path.exists(path):
+            os.remove(tmp_path)
+            size = 0
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+        self._remember(url, digest)
+        return digest, size
+
+    def bytes_on_disk(self) -> int:
+        return sum(
+            os.path.getsize(os.path.join(directory, name))
+            for directory, _, files in os.walk(self.root)
+            for name in files
+            if name.endswith(".pdf")
+        )
+
+
+class PdfStage:
+    """
+    Downloads bill PDFs into a PdfStore and stores their text in bills.pdf_text.
+
+    Downloads run in a thread pool (network-bound), text extraction in a
+    process pool (CPU-bound), and extracted texts are saved in batches.
+    A bill whose pdf_url was downloaded into the store before is not downloaded
+    again.
+    """
+
+    def __init__(
+        self,
+        db_handler: DBHandler,
+        store: PdfStore | None = None,
+        download_workers: int = 4,
+        extract_workers: int = 2,
+        save_batch_size: int = 20,
+    ):
+        """
+        Parameters:
+            db_handler (DBHandler): Handler used to read bills and save texts.
+            store (PdfStore): Target store. Defaults to PdfStore().
+            download_workers (int): Concurrent downloads.
+            extract_workers (int): Text extraction processes.
+            save_batch_size (int): Texts per save_pdf_texts call.
+        """
+        self.db_handler = db_handler
+        self.store = store or PdfStore()
+        self.download_workers = download_workers
+        self.extract_workers = extract_workers
+        self.save_batch_size = save_batch_size
+
+    def _download(self, bill: dict) -> tuple[str, int]:
+        digest = self.store.digest_for(bill["pdf_url"])
+        if digest:
+            return digest, -1  # 이미 저장된 파일
+        return self.store.download(bill["pdf_url"])
+
+    @query_metrics.job("pdf_stage")
+    def run(self, limit: int | None = None) -> dict[str, float]:
+        """
+        Processes the bills that have a pdf_url but no pdf_text yet.
+
+        Parameters:
+            limit (int): Maximum number of bills.
+
+        Returns:
+            dict: downloaded / skipped / extracted / failed counts, bytes
+            downloaded, bytes on disk, elapsed seconds and bills per second.
+        """
+        bills = self.db_handler.get_bills_without_pdf_text(limit) or []
+        counts = {"downloaded": 0, "skipped": 0, "extracted": 0, "failed": 0}
+        downloaded_bytes = 0
+        rows = []
+        started = time.perf_counter()
+
+        def flush():
+            nonlocal rows
+            if rows:
+                self.db_handler.save_pdf_texts(rows)
+                rows = []
+
+        with ThreadPoolExecutor(self.download_workers) as download_pool, ProcessPoolExecutor(
+            self.extract_workers
+        ) as extract_pool:
+            pending = {
+                download_pool.submit(self._download, bill): ("download", bill)
+                for bill in bills
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, bill = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to {stage} PDF of bill {bill['bill_id']}: {str(e)}"
+                        )
+                        counts["failed"] += 1
+                        continue
+
+                    if stage == "download":
+                        digest, size = result
+                        if size < 0:
+                            counts["skipped"] += 1
+                        else:
+                            counts["downloaded"] += 1
+                            downloaded_bytes += size
+                        bill = {**bill, "pdf_hash": digest}
+                        extract = extract_pool.submit(
+                            extract_pdf_text, self.store.path_for(digest)
+                        )
+                        pending[extract] = ("extract", bill)
+                    else:
+                        counts["extracted"] += 1
+                        rows.append(
+                            {
+                                "bill_id": bill["bill_id"],
+                                "pdf_hash": bill["pdf_hash"],
+                                "pdf_text": result,
+                            }
+                        )
+                        if len(rows) >= self.save_batch_size:
+                            flush()
+            flush()
+
+        elapsed = time.perf_counter() - started
+        report = {
+            **counts,
+            "bytes_downloaded": downloaded_bytes,
+            "bytes_on_disk": self.store.bytes_on_disk(),
+            "elapsed": elapsed,
+            "bills_per_second": counts["extracted"] / elapsed if elapsed else 0.0,
+        }
+        logger.info(
+            f"pdf: {counts['extracted']}/{len(bills)} extracted "
+            f"({counts['downloaded']} downloaded, {counts['skipped']} already stored, "
+            f"{counts['failed']} failed), {downloaded_bytes / 2**20:.1f} MiB downloaded, "
+            f"{report['bytes_on_disk'] / 2**20:.1f} MiB on disk, "
+            f"{report['bills_per_second']:.2f} bills/s"
+        )
+        return report
+
+
+if __name__ == "__main__":
+    from src.database import get_db
+
+    with get_db() as db:
+        PdfStage(DBHandler(db)).run()
@@ -0,0 +1,261 @@
+import queue
+import threading
+import time
+
+from src.dna_logger import logger
+from src.query_metrics import query_metrics
+
+_DONE = object()  # 상위 stage가 끝났음을 알리는 표시
+
+
+class StageStats:
+    """
+    Counters of a single stage. Latency is the time spent inside the stage
+    function; throughput is items processed per second of pipeline wall time.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.received = 0
+        self.processed = 0
+        self.failed = 0
+        self.emitted = 0
+        self.busy_time = 0.0
+        self.max_latency = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, items: int, latency: float, failed: bool, emitted: int):
+        with self._lock:
+            if failed:
+                self.failed += items
+            else:
+                self.processed += items
+            self.emitted += emitted
+            self.busy_time += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def as_dict(self, elapsed: float) -> dict:
+        with self._lock:
+            calls = self.processed + self.failed
+            return {
+                "received": self.received,
+                "processed": self.processed,
+                "failed": self.failed,
+                "emitted": self.emitted,
+                "throughput": self.processed / elapsed if elapsed else 0.0,
+                "avg_latency": self.busy_time / calls if calls else 0.0,
+                "max_latency": self.max_latency,
+            }
+
+
+class Stage:
+    """
+    One step of a Pipeline.
+
+    `func` receives an item (or a list of up to `batch_size` items) and returns
+    the value passed to the next stage. None drops the item. With
+    `fan_out=True` the return value is iterated and every element is passed on.
+    The values of the last stage are collected in Pipeline.results unless the
+    stage is a `sink`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func,
+        workers: int = 1,
+        queue_size: int = 100,
+        batch_size: int = 1,
+        batch_timeout: float = 1.0,
+        fan_out: bool = False,
+        sink: bool = False,
+        close=None,
+    ):
+        """
+        Parameters:
+            name (str): Stage name used in logs and stats.
+            func (callable): The stage function.
+            workers (int): Number of worker threads.
+            queue_size (int): Capacity of the input queue. A full queue blocks the
+                upstream stage (backpressure).
+            batch_size (int): Items handed to `func` at once. 1 passes single items.
+            batch_timeout (float): Seconds to wait for a batch to fill up.
+            fan_out (bool): Emit each element of the returned iterable.
+            sink (bool): Drop the values of the stage when it is the last one,
+                instead of keeping them in Pipeline.results for the whole run.
+            close (callable): Called once when the pipeline run ends, e.g. to
+                shut down a thread pool used by `func`.
+        """
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.fan_out = fan_out
+        self.sink = sink
+        self.close = close
+
+
+class Pipeline:
+    """
+    In-process producer/consumer pipeline.
+
+    Stages are connected by bounded queues and run concurrently in their own
+    worker threads, so network-bound and CPU-bound stages overlap. Items that
+    raise are counted as failed and logged; the rest of the run continues.
+    Each stage's `close` is called when run() ends, also after an error.
+    """
+
+    def __init__(self, stages: list[Stage], report_interval: float = 30.0):
+        """
+        Parameters:
+            stages (list): Stages in order.
+            report_interval (float): Seconds between progress logs. 0 disables.
+        """
+        self.stages = stages
+        self.report_interval = report_interval
+        self.stats = {stage.name: StageStats(stage.name) for stage in stages}
+        self.results = []
+        self._started = 0.0
+
+    def _emit(self, index: int, value, queues):
+        if index + 1 < len(queues):
+            queues[index + 1].put(value)
+        elif not self.stages[index].sink:
+            self.results.append(value)
+
+    def _call(self, index: int, stage: Stage, payload, queues):
+        items = len(payload) if stage.batch_size > 1 else 1
+        started = time.perf_counter()
+        try:
+            result = stage.func(payload)
+            values = [] if result is None else (result if stage.fan_out else [result])
+            emitted = 0
+            for value in values:
+                if value is not None:
+                    self._emit(index, value, queues)
+                    emitted += 1
+            self.stats[stage.name].record(
+                items, time.perf_counter() - started, False, emitted
+            )
+        except Exception as e:
+            self.stats[stage.name].record(items, time.perf_counter() - started, True, 0)
+            logger.error(f"pipeline stage {stage.name} failed: {str(e)}")
+
+    def _next_batch(self, inbox: queue.Queue, stage: Stage):
+        """Collects up to batch_size items. Returns (batch, upstream_done)."""
+        batch = []
+        deadline = time.monotonic() + stage.batch_timeout
+        while len(batch) < stage.batch_size:
+            timeout = deadline - time.monotonic() if batch else None
+            if timeout is not None and timeout <= 0:
+                break
+            try:
+                item = inbox.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _worker(self, index: int, stage: Stage, queues, remaining, lock):
+        inbox = queues[index]
+        stats = self.stats[stage.name]
+        while True:
+            if stage.batch_size > 1:
+                batch, finished = self._next_batch(inbox, stage)
+                with stats._lock:
+                    stats.received += len(batch)
+                if batch:
+                    self._call(index, stage, batch, queues)
+            else:
+                item = inbox.get()
+                finished = item is _DONE
+                if not finished:
+                    with stats._lock:
+                        stats.received += 1
+                    self._call(index, stage, item, queues)
+            if finished:
+                break
+
+        # 마지막으로 끝난 worker가 다음 stage에 종료를 알린다
+        with lock:
+            remaining[index] -= 1
+            last = remaining[index] == 0
+        if last and index + 1 < len(queues):
+            for _ in range(self.stages[index + 1].workers):
+                queues[index + 1].put(_DONE)
+
+    def _report(self, stop: threading.Event):
+        while not stop.wait(self.report_interval):
+            self.log_stats()
+
+    def run(self, items) -> dict[str, dict]:
+        """
+        Feeds `items` into the first stage and waits until every stage is drained.
+
+        Parameters:
+            items (iterable): Source items. Consumed lazily, so feeding blocks
+                while the first stage's queue is full.
+
+        Returns:
+            dict: Stage name -> counters (see StageStats.as_dict).
+        """
+        self._started = time.perf_counter()
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        remaining = [stage.workers for stage in self.stages]
+        lock = threading.Lock()
+
+        # stage 스레드의 쿼리도 run()을 호출한 job으로 집계한다
+        worker = query_metrics.bind(self._worker)
+        threads = []
+        for index, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                thread = threading.Thread(
+                    target=worker,
+                    args=(index, stage, queues, remaining, lock),
+                    name=f"{stage.name}-{n}",
+                    daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+
+        stop = threading.Event()
+        if self.report_interval > 0:
+            threading.Thread(target=self._report, args=(stop,), daemon=True).start()
+
+        try:
+            for item in items:
+                queues[0].put(item)
+        finally:
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_DONE)
+            for thread in threads:
+                thread.join()
+            stop.set()
+            self._close_stages()
+
+        self.log_stats()
+        return self.stats_dict()
+
+    def _close_stages(self):
+        for stage in self.stages:
+            if stage.close is None:
+                continue
+            try:
+                stage.close()
+            except Exception as e:
+                logger.error(f"pipeline stage {stage.name} failed to close: {str(e)}")
+
+    def stats_dict(self) -> dict[str, dict]:
+        elapsed = time.perf_counter() - self._started
+        return {name: stats.as_dict(elapsed) for name, stats in self.stats.items()}
+
+    def log_stats(self):
+        for name, stats in self.stats_dict().items():
+            logger.info(
+                f"pipeline {name}: {stats['processed']} ok, {stats['failed']} failed, "
+                f"{stats['throughput']:.2f}/s, avg {stats['avg_latency'] * 1000:.0f}ms"
+            )
@@ -0,0 +1,244 @@
+import functools
+import heapq
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from dotenv import load_dotenv
+from sqlalchemy import event
+
+from src.dna_logger import logger
+
+load_dotenv()
+
+_STRINGS = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBERS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMS = re.compile(r"%\(\w+\)s|%s|\?|(?<!:):\w+")
+_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_ROWS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Replaces literals and bind parameters with ? and collapses IN lists and
+    multi-row VALUES, so the same query with different values groups together.
+    """
+    statement = _STRINGS.sub("?", statement)
+    statement = _NUMBERS.sub("?", statement)
+    statement = _PARAMS.sub("?", statement)
+    statement = _LISTS.sub("(?)", statement)
+    statement = _ROWS.sub("(?)", statement)
+    return _SPACES.sub(" ", statement).strip()
+
+
+class QueryStats:
+    """Query count, DB time, row count and slowest statements of one scope."""
+
+    def __init__(self, name: str | None = None, keep_slowest: int = 5):
+        self.name = name
+        self.runs = 0
+        self.queries = 0
+        self.seconds = 0.0
+        self.rows = 0
+        self.keep_slowest = keep_slowest
+        self._slowest: list[tuple[float, str]] = []  # min-heap (seconds, sql)
+        self._lock = threading.Lock()
+
+    def add(self, statement: str, seconds: float, rows: int) -> None:
+        with self._lock:
+            self.queries += 1
+            self.seconds += seconds
+            self.rows += max(rows, 0)
+            if len(self._slowest) < self.keep_slowest:
+                heapq.heappush(self._slowest, (seconds, normalize_sql(statement)))
+            elif seconds > self._slowest[0][0]:
+                # 정규화는 느린 쿼리 목록에 들어갈 때만 한다
+                heapq.heapreplace(self._slowest, (seconds, normalize_sql(statement)))
+
+    def merge(self, other: "QueryStats") -> None:
+        with self._lock:
+            self.runs += 1
+            self.queries += other.queries
+            self.seconds += other.seconds
+            self.rows += other.rows
+            slowest = {sql: seconds for seconds, sql in self._slowest}
+            for seconds, sql in other._slowest:
+                slowest[sql] = max(seconds, slowest.get(sql, 0.0))
+            self._slowest = heapq.nlargest(
+                self.keep_slowest, ((seconds, sql) for sql, seconds in slowest.items())
+            )
+            heapq.heapify(self._slowest)
+
+    def slowest(self) -> list[dict]:
+        with self._lock:
+            return [
+                {"sql": sql, "ms": round(seconds * 1000, 2)}
+                for seconds, sql in sorted(self._slowest, reverse=True)
+            ]
+
+    def as_dict(self) -> dict:
+        return {
+            "runs": self.runs,
+            "queries": self.queries,
+            "db_ms": round(self.seconds * 1000, 2),
+            "rows": self.rows,
+            "slowest": self.slowest(),
+        }
+
+
+class QueryMetrics:
+    """
+    Collects per-request and per-job query metrics from SQLAlchemy
+    before_cursor_execute / after_cursor_execute events.
+
+    track() opens a scope (a request or a batch job). Queries issued inside it
+    are counted in that scope, logged when it ends, and merged into per-name
+    totals returned by snapshot(). The scope lives in a ContextVar, so each
+    thread and each concurrent job counts only its own queries; work handed to
+    other threads is counted when wrapped with bind(). Statements slower than
+    `slow_ms` are logged right away.
+
+    When disabled, no event listener is installed and track() does nothing,
+    so queries run without any extra work.
+    """
+
+    def __init__(self, enabled: bool = False, slow_ms: float = 500.0):
+        """
+        Parameters:
+            enabled (bool): Install the listeners and collect metrics.
+            slow_ms (float): Statements slower than this are logged as warnings.
+        """
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self.totals: dict[str, QueryStats] = {}
+        self._current: ContextVar[QueryStats | None] = ContextVar(
+            "query_stats", default=None
+        )
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """Creates the metrics from DB_QUERY_METRICS / DB_SLOW_QUERY_MS."""
+        return cls(
+            enabled=os.getenv("DB_QUERY_METRICS", "0").lower() in ("1", "true"),
+            slow_ms=float(os.getenv("DB_SLOW_QUERY_MS", "500")),
+        )
+
+    def install(self, engine) -> None:
+        """Adds the cursor event listeners to an engine when enabled."""
+        if not self.enabled:
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        conn.info["query_started"] = time.perf_counter()
+
+    def _after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        started = conn.info.pop("query_started", None)
+        if started is None:
+            return
+        seconds = time.perf_counter() - started
+        if seconds * 1000 >= self.slow_ms:
+            logger.warning(
+                f"slow query ({seconds * 1000:.1f} ms): {normalize_sql(statement)}"
+            )
+        stats = self._current.get()
+        if stats is not None:
+            stats.add(statement, seconds, cursor.rowcount)
+
+    @contextmanager
+    def track(self, name: str | None = None):
+        """
+        Counts the queries issued inside the block by this thread, and by
+        functions wrapped with bind() inside it.
+
+        Parameters:
+            name (str): Scope name, e.g. "POST /api/recommend/user_contents".
+                Can be set later through the yielded stats.name.
+
+        Yields:
+            QueryStats: Stats of the scope, or None when disabled.
+        """
+        if not self.enabled:
+            yield None
+            return
+        stats = QueryStats(name)
+        token = self._current.set(stats)
+        started = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            self._current.reset(token)
+            self._finish(stats, time.perf_counter() - started)
+
+    def _finish(self, stats: QueryStats, elapsed: float) -> None:
+        name = stats.name or "unnamed"
+        with self._lock:
+            totals = self.totals.get(name)
+            if totals is None:
+                totals = self.totals[name] = QueryStats(name)
+        totals.merge(stats)
+        slowest = stats.slowest()
+        logger.info(
+            f"queries: {name} - {stats.queries} queries, "
+            f"{stats.seconds * 1000:.1f}/{elapsed * 1000:.1f} ms in db, {stats.rows} rows"
+            + (f", slowest {slowest[0]['ms']} ms: {slowest[0]['sql']}" if slowest else "")
+        )
+
+    def bind(self, func):
+        """
+        Wraps a function handed to a worker thread so its queries are counted
+        in the scope that is active here, e.g.
+        executor.submit(query_metrics.bind(process), partition).
+        """
+        stats = self._current.get()
+        if stats is None:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            token = self._current.set(stats)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._current.reset(token)
+
+        return wrapper
+
+    def job(self, name: str):
+        """Decorator running a batch job function inside track(name)."""
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.track(name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def snapshot(self) -> dict:
+        """Totals per scope name, for the metrics endpoint."""
+        with self._lock:
+            totals = list(self.totals.values())
+        return {
+            "enabled": self.enabled,
+            "scopes": {stats.name: stats.as_dict() for stats in totals},
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.totals.clear()
+
+
+query_metrics = QueryMetrics.from_env()
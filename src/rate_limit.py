@@ -0,0 +1,115 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    `rate` tokens are added per second up to `burst`. acquire() blocks until a
+    token is available.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Parameters:
+            rate (float): Allowed requests per second. 0 or less disables limiting.
+            burst (int): Maximum number of requests allowed back to back.
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reconfigure(self, rate: float, burst: int = 1):
+        """Changes the rate and burst in place, so current users see the new limit."""
+        with self._lock:
+            self.rate = rate
+            self.burst = max(1, burst)
+            self._tokens = min(self._tokens, float(self.burst))
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class RateLimitedExecutor:
+    """
+    ThreadPoolExecutor whose tasks each take a RateLimiter token before running.
+
+    Used for calls against quota-limited services (LLM API, National Assembly API)
+    so concurrency can be raised without exceeding the request rate.
+    """
+
+    def __init__(self, max_workers: int = 4, rate: float = 0, burst: int = 1):
+        """
+        Parameters:
+            max_workers (int): Number of worker threads.
+            rate (float): Allowed task starts per second. 0 disables limiting.
+            burst (int): Maximum number of task starts allowed back to back.
+        """
+        self.limiter = RateLimiter(rate, burst)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def _run(self, fn, *args, **kwargs):
+        self.limiter.acquire()
+        return fn(*args, **kwargs)
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        return self._executor.submit(self._run, fn, *args, **kwargs)
+
+    def map(self, fn, *iterables):
+        return self._executor.map(lambda *args: self._run(fn, *args), *iterables)
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+        return False
+
+
+def retry_call(fn, *args, attempts: int = 3, backoff: float = 1.0, **kwargs):
+    """
+    Calls `fn` and retries with exponential backoff when it raises.
+
+    Parameters:
+        fn (callable): The function to call.
+        attempts (int): Maximum number of calls.
+        backoff (float): Seconds to wait before the second call, doubled each retry.
+
+    Returns:
+        The return value of `fn`. The last exception is re-raised when every
+        attempt fails.
+    """
+    for attempt in range(attempts):
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(backoff * (2**attempt))
@@ -0,0 +1,155 @@
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from itertools import islice
+
+
+class _Entry:
+    __slots__ = ("visits", "warmed_at")
+
+    def __init__(self, size: int):
+        self.visits: deque = deque(maxlen=size)  # (visited_at, page_id), 최신순
+        self.warmed_at: float | None = None
+
+
+class RecentVisitCache:
+    """
+    Most recent page ids of each user, newest first.
+
+    Each user keeps a ring buffer of the last `size` visits. A user is loaded
+    from the DB on first access (and again after `ttl` seconds, so other
+    workers' writes show up), and record() adds new visits of cached users as
+    they arrive. At most `max_users` users are kept; the least recently used
+    is dropped.
+
+    visited_at values are compared exactly, so recorded visits must carry the
+    value that is written to the DB (VisitBuffer truncates it to seconds).
+    """
+
+    def __init__(self, max_users: int = 10000, size: int = 50, ttl: float = 300.0):
+        """
+        Parameters:
+            max_users (int): Users kept in memory.
+            size (int): Visits kept per user. Larger requests go to the DB.
+            ttl (float): Seconds before a user is loaded from the DB again.
+        """
+        self.max_users = max_users
+        self.size = size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._users: OrderedDict[int, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """Creates the cache from RECENT_VISITS_USERS / _SIZE / _TTL."""
+        return cls(
+            max_users=int(os.getenv("RECENT_VISITS_USERS", "10000")),
+            size=int(os.getenv("RECENT_VISITS_SIZE", "50")),
+            ttl=float(os.getenv("RECENT_VISITS_TTL", "300")),
+        )
+
+    def __len__(self):
+        return len(self._users)
+
+    def _entry(self, user_id: int) -> _Entry:
+        entry = self._users.get(user_id)
+        if entry is None:
+            entry = self._users[user_id] = _Entry(self.size)
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+        else:
+            self._users.move_to_end(user_id)
+        return entry
+
+    @staticmethod
+    def _merge(entry: _Entry, visits) -> None:
+        merged, seen = [], set()
+        for visit in sorted(
+            [*entry.visits, *visits], key=lambda visit: visit[0], reverse=True
+        ):
+            if visit not in seen:
+                seen.add(visit)
+                merged.append(visit)
+        entry.visits.clear()
+        entry.visits.extend(merged)  # maxlen을 넘는 오래된 방문은 버려진다
+
+    def record(self, visits) -> None:
+        """
+        Adds visits (dicts with user_id, page_id, visited_at), e.g. as a
+        VisitBuffer listener. Visits of users that are not cached are skipped;
+        they are read from the DB when the user is loaded.
+        """
+        by_user: dict[int, list] = {}
+        for visit in visits:
+            by_user.setdefault(visit["user_id"], []).append(
+                (visit["visited_at"], visit["page_id"])
+            )
+        with self._lock:
+            for user_id, user_visits in by_user.items():
+                # 방문만 한 사용자로 캐시를 채워 자주 조회되는 사용자가 밀려나지 않도록 한다
+                entry = self._users.get(user_id)
+                if entry is None:
+                    continue
+                head = entry.visits[0][0] if entry.visits else None
+                user_visits.sort(key=lambda visit: visit[0])
+                if head is None or user_visits[0][0] >= head:
+                    # 대부분의 방문은 가장 최신이므로 앞에 붙이기만 하면 된다
+                    entry.visits.extendleft(user_visits)
+                else:
+                    self._merge(entry, user_visits)
+
+    def get(self, user_id: int, n: int, load) -> list[str] | None:
+        """
+        Returns the last `n` page ids of a user, newest first.
+
+        Parameters:
+            user_id (int): User ID.
+            n (int): Number of page ids.
+            load (callable): load(limit) returning the user's last `limit`
+                visits from the DB as (page_id, visited_at) rows, newest first.
+
+        Returns:
+            list: Page ids, or None when `load` returns None.
+        """
+        if n > self.size:
+            rows = load(n)
+            return None if rows is None else [row[0] for row in rows]
+
+        with self._lock:
+            entry = self._users.get(user_id)
+            if (
+                entry is not None
+                and entry.warmed_at is not None
+                and time.monotonic() - entry.warmed_at < self.ttl
+            ):
+                self._users.move_to_end(user_id)
+                self.hits += 1
+                return [page_id for _, page_id in islice(entry.visits, n)]
+            self.misses += 1
+            # 조회 중에 record()된 방문도 받도록 먼저 entry를 만든다
+            self._entry(user_id)
+
+        # DB 조회 중에는 lock을 잡지 않는다
+        rows = load(self.size)
+        if rows is None:
+            return None
+        with self._lock:
+            entry = self._entry(user_id)
+            # 조회 중에 기록된 방문(아직 DB에 쓰이지 않은 것 포함)과 합친다
+            self._merge(entry, [(visited_at, page_id) for page_id, visited_at in rows])
+            entry.warmed_at = time.monotonic()
+            return [page_id for _, page_id in islice(entry.visits, n)]
+
+    def invalidate(self, user_id: int | None = None) -> None:
+        """Drops one user, or every user when user_id is None."""
+        with self._lock:
+            if user_id is None:
+                self._users.clear()
+            else:
+                self._users.pop(user_id, None)
+
+
+recent_visits = RecentVisitCache.from_env()
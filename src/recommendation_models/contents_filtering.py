@@ -1,6 +1,7 @@
 from src.dna_logger import logger
 from src.summary import Summarizer
 from src.db_handler import get_db_handler
+from src.translation_queue import TranslationQueue
 
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -19,72 +20,39 @@ class ContentsFiltering:
         self.contents = [content for content in contents if content is not None]
         return self.contents
 
-    def translate_content(self):
+    def translate_content(self, batch_size: int = 20):
+        """
+        번역 작업 큐(translation_jobs)를 통해 번역되지 않은 법안만 번역한다.
+        프로세스가 중단되어도 재시작 시 끝나지 않은 작업만 이어서 처리한다.
+        """
         try:
-            if not self.contents:
-                logger.warning("No bills found in database")
-                return
+            queue = TranslationQueue(self.db_handler)
+            created = queue.enqueue_missing()
+            logger.info(f"Enqueued {created} bills for translation: {queue.stats()}")
 
-            translated_contents = []
+            summarizer = Summarizer("", summarize=False)
 
-            for bill in self.contents:
-                # Check if translations already exist in the database
-                existing_translation = self.db_handler.get_existing_translation(
-                    bill["bill_id"]
+            def translate(job):
+                translated_summary = summarizer.translate_to_english(
+                    job["bill_summary"]
                 )
-                if existing_translation:
-                    translated_contents.append(existing_translation)
-                    logger.info(
-                        f"Skipped translation for bill {bill['bill_id']}, already exists."
-                    )
-                    continue  # Skip to the next bill if translation exists
-
-                success = False
-                attempts = 0
-                while not success and attempts < 3:  # Retry up to 3 times
-                    try:
-                        summarizer = Summarizer(bill["bill_summary"])
-                        translated_summary = summarizer.translate_to_english(
-                            bill["bill_summary"]
-                        )
-                        translated_title = summarizer.translate_to_english(
-                            bill["bill_title"]
-                        )
-
-                        if translated_summary is not None:
-                            translated_contents.append(
-                                {
-                                    "id": bill["bill_id"],
-                                    "translated_bill_title": translated_title,
-                                    "translated_bill_summary": translated_summary,
-                                }
-                            )
-                            # Save to bills model
-                            self.db_handler.save_bill_translation(
-                                bill["bill_id"], translated_title, translated_summary
-                            )
-                            logger.info(
-                                f"Translated content for bill {bill['bill_id']}: \n {translated_title} \n {translated_summary}"
-                            )
-                            success = True
-                        else:
-                            translated_contents.append(
-                                {
-                                    "id": bill["bill_id"],
-                                    "translated_bill_title": translated_title,
-                                    "translated_bill_summary": translated_title,
-                                }
-                            )
-                            logger.warning(
-                                f"Attempt {attempts+1}: Translation failed for bill {bill['bill_id']}"
-                            )
-                            attempts += 1  # Increment attempts on failure
-                    except Exception as e:
-                        logger.error(
-                            f"Attempt {attempts+1}: Error during translation for bill {bill['bill_id']}: {str(e)}"
-                        )
-                        attempts += 1  # Increment attempts on exception
+                translated_title = summarizer.translate_to_english(job["bill_title"])
+                if translated_summary is None or translated_title is None:
+                    raise ValueError("empty translation response")
+                self.db_handler.save_bill_translation(
+                    job["bill_id"], translated_title, translated_summary
+                )
+                logger.info(
+                    f"Translated content for bill {job['bill_id']}: \n {translated_title} \n {translated_summary}"
+                )
+
+            report = queue.run(translate, batch_size=batch_size)
+            logger.info(
+                f"Translation finished: {report['done']} done, {report['failed']} failed, "
+                f"{report['throughput']:.2f} bills/s, backlog {queue.stats()}"
+            )
 
+            translated_contents = self.db_handler.get_translated_contents()
             if not translated_contents:
                 logger.warning("No valid translated contents found.")
                 return
@@ -127,16 +95,17 @@ class ContentsFiltering:
             cosine_sim = cosine_similarity(tfidf_matrix)
             cosine_sim_df = pd.DataFrame(cosine_sim)
 
-            # 추천 결과 생성 및 DB에 저장
-            for idx, bill in enumerate(valid_bills):
-                source_bill_id = bill["id"]  # 현재 법안의 ID를 source_bill_id로 설정
-                for sim_idx in range(len(valid_bills)):  # 모든 법안에 대해 반복
-                    if sim_idx != idx:  # 자기 자신 제외
-                        target_bill_id = valid_bills[sim_idx]["id"]
-                        similarity_score = cosine_sim[idx][sim_idx]
-                        self.db_handler.save_similarity_score(
-                            target_bill_id, source_bill_id, similarity_score
-                        )
+            # 추천 결과 생성 및 DB에 저장 (batch 단위로 commit)
+            with self.db_handler.batch():
+                for idx, bill in enumerate(valid_bills):
+                    source_bill_id = bill["id"]  # 현재 법안의 ID를 source_bill_id로 설정
+                    for sim_idx in range(len(valid_bills)):  # 모든 법안에 대해 반복
+                        if sim_idx != idx:  # 자기 자신 제외
+                            target_bill_id = valid_bills[sim_idx]["id"]
+                            similarity_score = cosine_sim[idx][sim_idx]
+                            self.db_handler.save_similarity_score(
+                                target_bill_id, source_bill_id, similarity_score
+                            )
 
             return cosine_sim_df
 
@@ -158,18 +127,19 @@ class ContentsFiltering:
             cosine_sim = cosine_similarity(tfidf_matrix)
             cosine_sim_df = pd.DataFrame(cosine_sim)
 
-            # 추천 결과 생성 및 DB에 저장
-            for idx, bill in enumerate(self.translated_contents):
-                source_bill_id = bill["id"]  # 현재 법안의 ID를 source_bill_id로 설정
-                for sim_idx in range(
-                    len(self.translated_contents)
-                ):  # 모든 법안에 대해 반복
-                    if sim_idx != idx:  # 자기 자신 제외
-                        target_bill_id = self.translated_contents[sim_idx]["id"]
-                        similarity_score = cosine_sim[idx][sim_idx]
-                        self.db_handler.save_similarity_score(
-                            target_bill_id, source_bill_id, similarity_score
-                        )
+            # 추천 결과 생성 및 DB에 저장 (batch 단위로 commit)
+            with self.db_handler.batch():
+                for idx, bill in enumerate(self.translated_contents):
+                    source_bill_id = bill["id"]  # 현재 법안의 ID를 source_bill_id로 설정
+                    for sim_idx in range(
+                        len(self.translated_contents)
+                    ):  # 모든 법안에 대해 반복
+                        if sim_idx != idx:  # 자기 자신 제외
+                            target_bill_id = self.translated_contents[sim_idx]["id"]
+                            similarity_score = cosine_sim[idx][sim_idx]
+                            self.db_handler.save_similarity_score(
+                                target_bill_id, source_bill_id, similarity_score
+                            )
 
             return cosine_sim_df
 
@@ -0,0 +1,249 @@
+import json
+import os
+import re
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+DATE_PATTERN = re.compile(r"(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})")
+TIME_PATTERN = re.compile(r"(\d{1,2}):(\d{2})")
+
+
+def parse_schedule_datetime(date_text: str | None, time_text: str | None = None):
+    """
+    Parses the date (YYYY.MM.DD or YYYY-MM-DD) and optional time (HH:MM) of a
+    schedule row. Returns None when the date cannot be read.
+    """
+    match = DATE_PATTERN.search(date_text or "")
+    if match is None:
+        return None
+    hour, minute = 0, 0
+    time_match = TIME_PATTERN.search(time_text or "")
+    if time_match:
+        hour, minute = min(int(time_match.group(1)), 23), int(time_match.group(2))
+    try:
+        return datetime(*map(int, match.groups()), hour, minute)
+    except ValueError:
+        return None
+
+
+class ScheduleStore:
+    """
+    Schedule rows kept sorted by their datetime.
+
+    Dates are parsed once when a row is added. Range, latest and next queries
+    use bisect on the sorted datetimes instead of scanning every row.
+    A row is identified by its `key_fields` (the meeting id, e.g. committee,
+    session and sequence number), so refreshing from the API adds the rows not
+    seen before, overwrites stored rows whose other fields changed and moves
+    rescheduled meetings to their new datetime. Rows missing a key field are
+    identified by their datetime and all their fields. `refreshed_at` keeps
+    the last refresh time per source (e.g. per committee).
+    """
+
+    def __init__(
+        self,
+        date_field: str,
+        time_field: str | None = None,
+        key_fields: tuple[str, ...] | None = None,
+    ):
+        """
+        Parameters:
+            date_field (str): Row field holding the date, e.g. SCH_DT.
+            time_field (str): Row field holding the time, e.g. SCH_TM.
+            key_fields (tuple): Fields holding the meeting id, e.g. ("UNIT_CD",
+                "MEETINGSESSION", "CHA"). None identifies rows by their
+                datetime and all fields.
+        """
+        self.date_field = date_field
+        self.time_field = time_field
+        self.key_fields = key_fields
+        self.refreshed_at: dict[str, float] = {}
+        self._keys: list[tuple[datetime, int]] = []  # (datetime, 추가 순서)
+        self._rows: list[dict] = []
+        self._ids: dict[tuple, tuple[datetime, int]] = {}  # identity -> 정렬 키
+        self._count = 0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._rows)
+
+    @property
+    def rows(self) -> list[dict]:
+        """All rows in chronological order."""
+        with self._lock:
+            return list(self._rows)
+
+    def _parse(self, row: dict):
+        return parse_schedule_datetime(
+            row.get(self.date_field),
+            row.get(self.time_field) if self.time_field else None,
+        )
+
+    def _identity(self, when: datetime, row: dict) -> tuple:
+        if self.key_fields is not None:
+            key = tuple(row.get(field) for field in self.key_fields)
+            if all(key):
+                return key
+        return tuple(sorted(row.items()))
+
+    def _claim(self, rows, new_rows: dict) -> int:
+        """
+        Collects the rows not stored yet into `new_rows` (identity ->
+        (datetime, order, row)) and overwrites stored rows that changed.
+        Stored rows whose datetime changed are removed and collected again.
+
+        Returns:
+            int: Number of rows added to `new_rows` or overwritten.
+        """
+        claimed = 0
+        for row in rows:
+            when = self._parse(row)
+            if when is None:
+                continue
+            identity = self._identity(when, row)
+            if identity in new_rows:
+                # 같은 refresh 안에서 다시 나온 행은 나중 값으로 바꾼다
+                _, count, stored = new_rows[identity]
+                if stored != row:
+                    new_rows[identity] = (when, count, row)
+                    self._ids[identity] = (when, count)
+                    claimed += 1
+                continue
+            key = self._ids.get(identity)
+            if key is None:
+                self._ids[identity] = (when, self._count)
+                new_rows[identity] = (when, self._count, row)
+                self._count += 1
+                claimed += 1
+                continue
+            index = bisect_left(self._keys, key)
+            if self._rows[index] == row:
+                continue
+            claimed += 1
+            if key[0] == when:
+                self._rows[index] = row
+                continue
+            # 시간이 바뀐 회의는 이전 위치에서 지우고 새 시간으로 다시 넣는다
+            del self._keys[index]
+            del self._rows[index]
+            self._ids[identity] = (when, key[1])
+            new_rows[identity] = (when, key[1], row)
+        return claimed
+
+    def _merge(self, new_rows: dict) -> None:
+        # 이미 정렬된 목록 뒤에 붙여 다시 정렬 (timsort는 정렬된 구간을 그대로 이용)
+        for when, count, row in new_rows.values():
+            self._keys.append((when, count))
+            self._rows.append(row)
+        order = sorted(range(len(self._keys)), key=self._keys.__getitem__)
+        self._keys = [self._keys[i] for i in order]
+        self._rows = [self._rows[i] for i in order]
+
+    def add(self, row: dict) -> bool:
+        """
+        Adds a row, or overwrites the stored row with the same identity.
+        Returns False for unchanged rows and rows without a date.
+        """
+        with self._lock:
+            new_rows = {}
+            if not self._claim([row], new_rows):
+                return False
+            for when, count, row in new_rows.values():
+                index = bisect_right(self._keys, (when, count))
+                self._keys.insert(index, (when, count))
+                self._rows.insert(index, row)
+        return True
+
+    def refresh(self, rows, source: str = "all") -> int:
+        """
+        Adds the new rows of an iterable such as open_api.iter_rows() and
+        overwrites the stored rows that changed.
+
+        Parameters:
+            rows (iterable): Rows to merge. Consumed lazily.
+            source (str): Name recorded in refreshed_at.
+
+        Returns:
+            int: Number of rows added or overwritten.
+        """
+        new_rows, changed = {}, 0
+        try:
+            # 행을 읽는 동안(네트워크 요청)에는 lock을 잡지 않는다
+            for row in rows:
+                with self._lock:
+                    changed += self._claim([row], new_rows)
+        finally:
+            # 중간에 실패해도 이미 읽은 행은 저장한다
+            with self._lock:
+                if new_rows:
+                    self._merge(new_rows)
+        with self._lock:
+            self.refreshed_at[source] = time.time()
+        return changed
+
+    def between(self, start: datetime | None = None, end: datetime | None = None):
+        """Rows with start <= datetime < end, in chronological order."""
+        with self._lock:
+            lo = 0 if start is None else bisect_left(self._keys, (start,))
+            hi = len(self._keys) if end is None else bisect_left(self._keys, (end,))
+            return self._rows[lo:hi]
+
+    def before(self, when: datetime | None = None) -> list[dict]:
+        """Rows strictly before `when` (default: now)."""
+        return self.between(None, when or datetime.now())
+
+    def after(self, when: datetime | None = None) -> list[dict]:
+        """Rows strictly after `when` (default: now)."""
+        when = when or datetime.now()
+        with self._lock:
+            # (when, 무한대) 뒤부터가 when 이후
+            return self._rows[bisect_right(self._keys, (when, float("inf"))) :]
+
+    def latest(self, when: datetime | None = None, where=None) -> dict | None:
+        """
+        The most recent row before `when` (default: now). With `where`, the most
+        recent row for which where(row) is true.
+        """
+        with self._lock:
+            index = bisect_left(self._keys, (when or datetime.now(),))
+            for i in range(index - 1, -1, -1):
+                if where is None or where(self._rows[i]):
+                    return self._rows[i]
+            return None
+
+    def next(self, when: datetime | None = None, where=None) -> dict | None:
+        """
+        The first row after `when` (default: now). With `where`, the first row
+        for which where(row) is true.
+        """
+        with self._lock:
+            index = bisect_right(self._keys, (when or datetime.now(), float("inf")))
+            for i in range(index, len(self._rows)):
+                if where is None or where(self._rows[i]):
+                    return self._rows[i]
+            return None
+
+    def save(self, path: str) -> None:
+        """Writes the rows and refresh times to a JSON file."""
+        with self._lock:
+            data = {"refreshed_at": self.refreshed_at, "rows": self._rows}
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+
+    def load(self, path: str) -> bool:
+        """Merges a file written by save(). Returns False if it does not exist."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        with self._lock:
+            new_rows = {}
+            self._claim(data.get("rows", []), new_rows)
+            self._merge(new_rows)
+            self.refreshed_at.update(data.get("refreshed_at", {}))
+        return True
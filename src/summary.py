@@ -1,5 +1,4 @@
-import google.generativeai as genai
-from src.load import api_keyManager
+from src.llm_backend import LLMBackend, get_llm_backend
 from src.extractors import BillExtractor
 from src.dna_logger import logger
 import time
@@ -7,21 +6,31 @@ import time
 
 class Summarizer:
 
-    def __init__(self, bill_summary: str):
+    def __init__(
+        self,
+        bill_summary: str,
+        backend: LLMBackend | None = None,
+        summarize: bool = True,
+    ):
         """
-        Initializes the Summarizer class by configuring the Google Generative AI API with
-        the Google API key and setting up the BillExtractor to fetch bill summaries.
+        Initializes the Summarizer class with the LLM backend used for generation.
+
+        Parameters:
+            bill_summary (str): The bill summary to summarize.
+            backend (LLMBackend): Generation backend. Defaults to get_llm_backend().
+            summarize (bool): Generate headline and paragraph right away.
+                Translation-only callers pass False to skip the two requests.
         """
         self.bill_summary = bill_summary
-        self.ggl_api_key = api_keyManager.get_ggl_api_key()
-        genai.configure(api_key=self.ggl_api_key)
-        try:
-            self.headline = ""
-            self.summarize_headline()
-            self.paragraph = ""
-            self.summarize_paragraph()
-        except Exception as e:
-            logger.error(f"Error: summarize error occurred {str(e)}")
+        self.backend = backend or get_llm_backend()
+        self.headline = ""
+        self.paragraph = ""
+        if summarize:
+            try:
+                self.summarize_headline()
+                self.summarize_paragraph()
+            except Exception as e:
+                logger.error(f"Error: summarize error occurred {str(e)}")
         self.bill_id = None  # need to implement how to deal with bill_id
         self.conf_id = None
 
@@ -30,7 +39,7 @@ class Summarizer:
         Summarizes the bill's content into a single headline using generative AI.
 
         This method calls the BillExtractor to retrieve the bill summary, and uses
-        the generative AI model 'gemini-1.5-flash' to summarize it into a headline
+        the configured LLM backend to summarize it into a headline
         in a friendly and polite tone with simpler language.
 
         Returns:
@@ -41,23 +50,16 @@ class Summarizer:
             logger.info("Info: empty summary")
             return
         system_instructions = "주어진 문단을 한 문장으로 요약하는데, 어려운 말을 쉬운 말로 풀어서 설명하되 존댓말로 말하는 친절한 말투로 해줘"
-        model = "gemini-1.5-flash"
-        temperature = 0
-        stop_sequence = "종료!"
-        model = genai.GenerativeModel(model, system_instruction=system_instructions)
-        config = genai.GenerationConfig(
-            temperature=temperature, stop_sequences=[stop_sequence]
-        )
-        response = model.generate_content(contents=[text], generation_config=config)
-        self.headline = response.text
-        return response.text
+        response = self.backend.generate(text, system_instructions)
+        self.headline = response
+        return response
 
     def summarize_paragraph(self):
         """
         Summarizes the bill's content into a paragraph using generative AI.
 
         This method calls the BillExtractor to retrieve the bill summary, and uses
-        the generative AI model 'gemini-1.5-flash' to simplify the language in the
+        the configured LLM backend to simplify the language in the
         summary while maintaining a polite tone in a longer form.
 
         Returns:
@@ -65,22 +67,15 @@ class Summarizer:
         """
         text = self.bill_summary
         system_instructions = "주어진 문단을 어려운 말을 쉬운 말로 풀어서 설명하되 존댓말로 말하는 친절한 말투로 해줘"
-        model = "gemini-1.5-flash"
-        temperature = 0
-        stop_sequence = "종료!"
-        model = genai.GenerativeModel(model, system_instruction=system_instructions)
-        config = genai.GenerationConfig(
-            temperature=temperature, stop_sequences=[stop_sequence]
-        )
-        response = model.generate_content(contents=[text], generation_config=config)
-        self.paragraph = response.text
-        return response.text
+        response = self.backend.generate(text, system_instructions)
+        self.paragraph = response
+        return response
 
     def translate_to_english(self, text):
         """
         Translates the bill's summary into English using generative AI.
 
-        This method uses the generative AI model 'gemini-1.5-flash' to translate
+        This method uses the configured LLM backend to translate
         the summary into English.
 
         Returns:
@@ -92,16 +87,9 @@ class Summarizer:
                 return
 
             system_instructions = "주어진 텍스트를 영어로 번역해줘"
-            model = "gemini-1.5-flash"
-            temperature = 0
-            stop_sequence = "종료!"
-            model = genai.GenerativeModel(model, system_instruction=system_instructions)
-            config = genai.GenerationConfig(
-                temperature=temperature, stop_sequences=[stop_sequence]
-            )
-            time.sleep(4)  # might have to change according to the response
-            response = model.generate_content(contents=[text], generation_config=config)
-            return response.text
+            # might have to change according to the response
+            time.sleep(self.backend.request_interval)
+            return self.backend.generate(text, system_instructions)
         except Exception as e:
             logger.error(
                 f"Error during translation: {str(e)}. Try changing sleep duration."
@@ -131,6 +119,7 @@ if __name__ == "__main__":
     be = BillExtractor(
         "https://likms.assembly.go.kr/bill/billDetail.do?billId=PRC_U2Y3E0F8G0A9G1U0G0N9R0R0M1F0U0"
     )
+    be.extract()
     summarizer = Summarizer(be.bill_summary)
     print("Headline : ", summarizer.get_headline())
     print("Paragraph : ", summarizer.get_paragraph())
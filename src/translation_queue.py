@@ -0,0 +1,256 @@
+import os
+import socket
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import bindparam, case, func, select, text, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.db_handler import DBHandler
+from src.dna_logger import logger
+from src.models import Bill, TranslationJob
+
+PENDING = "pending"
+IN_FLIGHT = "in_flight"
+DONE = "done"
+FAILED = "failed"
+
+
+class TranslationQueue:
+    """
+    Persistent per-bill work queue backed by the translation_jobs table.
+
+    Jobs move pending -> in_flight -> done. A failed attempt puts the job back
+    to pending until `max_attempts` is reached, after which it stays failed.
+    In-flight jobs whose worker died are released after `stale_after`.
+    """
+
+    def __init__(
+        self,
+        db_handler: DBHandler,
+        max_attempts: int = 3,
+        stale_after: timedelta = timedelta(minutes=30),
+        worker_id: str | None = None,
+    ):
+        self.db_handler = db_handler
+        self.db = db_handler.db
+        self.max_attempts = max_attempts
+        self.stale_after = stale_after
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+
+    def enqueue_missing(self, bill_ids=None) -> int:
+        """
+        Adds a pending job for every bill that has no job and no translation yet.
+
+        Parameters:
+            bill_ids (iterable): Only consider these bills. Default: every bill.
+
+        Returns:
+            int: Number of jobs created.
+        """
+        query = """
+                INSERT INTO translation_jobs (bill_id, status, attempts, updated_at)
+                SELECT b.bill_id, :status, 0, :now
+                FROM bills b
+                LEFT JOIN translation_jobs j ON j.bill_id = b.bill_id
+                WHERE j.id IS NULL
+                  AND b.bill_id IS NOT NULL
+                  AND (b.bill_title_eng IS NULL OR b.bill_body_eng IS NULL)
+                """
+        params = {"status": PENDING, "now": datetime.now()}
+        if bill_ids is None:
+            statement = text(query)
+        else:
+            params["bill_ids"] = list(bill_ids)
+            if not params["bill_ids"]:
+                return 0
+            statement = text(query + "  AND b.bill_id IN :bill_ids").bindparams(
+                bindparam("bill_ids", expanding=True)
+            )
+        result = self.db.execute(statement, params)
+        self.db.commit()
+        return result.rowcount
+
+    def release_stale(self) -> int:
+        """
+        Puts in-flight jobs claimed longer than `stale_after` ago back to pending.
+
+        Returns:
+            int: Number of released jobs.
+        """
+        result = self.db.execute(
+            update(TranslationJob)
+            .where(TranslationJob.status == IN_FLIGHT)
+            .where(TranslationJob.claimed_at < datetime.now() - self.stale_after)
+            .values(status=PENDING, worker_id=None, updated_at=datetime.now())
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def claim(self, batch_size: int = 20) -> list[dict]:
+        """
+        Claims up to `batch_size` pending jobs for this worker.
+
+        Rows are locked with SKIP LOCKED so concurrent workers never claim the
+        same bill.
+
+        Returns:
+            list: Dicts with bill_id, bill_title, bill_summary and attempts.
+        """
+        try:
+            jobs = (
+                self.db.execute(
+                    select(TranslationJob.id, TranslationJob.bill_id)
+                    .where(TranslationJob.status == PENDING)
+                    .order_by(TranslationJob.id)
+                    .limit(batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                .all()
+            )
+            if not jobs:
+                self.db.commit()
+                return []
+
+            job_ids = [job.id for job in jobs]
+            now = datetime.now()
+            self.db.execute(
+                update(TranslationJob)
+                .where(TranslationJob.id.in_(job_ids))
+                .values(
+                    status=IN_FLIGHT,
+                    attempts=TranslationJob.attempts + 1,
+                    worker_id=self.worker_id,
+                    claimed_at=now,
+                    updated_at=now,
+                )
+            )
+            rows = self.db.execute(
+                select(
+                    TranslationJob.bill_id,
+                    TranslationJob.attempts,
+                    Bill.bill_title,
+                    Bill.bill_body,
+                )
+                .join(Bill, Bill.bill_id == TranslationJob.bill_id)
+                .where(TranslationJob.id.in_(job_ids))
+            ).all()
+            self.db.commit()
+        except SQLAlchemyError as err:
+            self.db.rollback()
+            logger.error(f"error: failed to claim translation jobs {err}")
+            return []
+
+        return [
+            {
+                "bill_id": row.bill_id,
+                "bill_title": row.bill_title,
+                "bill_summary": row.bill_body,
+                "attempts": row.attempts,
+            }
+            for row in rows
+        ]
+
+    def complete(self, bill_id: str):
+        """Marks the job of `bill_id` as done."""
+        self.db.execute(
+            update(TranslationJob)
+            .where(TranslationJob.bill_id == bill_id)
+            .values(status=DONE, last_error=None, updated_at=datetime.now())
+        )
+        self.db.commit()
+
+    def fail(self, bill_id: str, error: str):
+        """
+        Records a failed attempt. The job returns to pending while attempts remain,
+        otherwise it is marked failed.
+        """
+        self.db.execute(
+            update(TranslationJob)
+            .where(TranslationJob.bill_id == bill_id)
+            .values(
+                status=case(
+                    (TranslationJob.attempts >= self.max_attempts, FAILED),
+                    else_=PENDING,
+                ),
+                last_error=error[:2000],
+                worker_id=None,
+                updated_at=datetime.now(),
+            )
+        )
+        self.db.commit()
+
+    def retry_failed(self) -> int:
+        """
+        Moves failed jobs back to pending with a fresh attempt budget.
+
+        Returns:
+            int: Number of jobs requeued.
+        """
+        result = self.db.execute(
+            update(TranslationJob)
+            .where(TranslationJob.status == FAILED)
+            .values(status=PENDING, attempts=0, updated_at=datetime.now())
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the number of jobs per status.
+        """
+        rows = self.db.execute(
+            select(TranslationJob.status, func.count()).group_by(
+                TranslationJob.status
+            )
+        ).all()
+        counts = {PENDING: 0, IN_FLIGHT: 0, DONE: 0, FAILED: 0}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def run(self, handle, batch_size: int = 20) -> dict[str, float]:
+        """
+        Claims and processes jobs until the queue has no pending work.
+
+        Parameters:
+            handle (callable): Called with a claimed job dict. Returns normally on
+                success and raises on failure.
+            batch_size (int): Number of jobs claimed per round trip.
+
+        Returns:
+            dict: done / failed counts, elapsed seconds and jobs per second.
+        """
+        self.release_stale()
+        done, failed = 0, 0
+        started = time.perf_counter()
+
+        while True:
+            jobs = self.claim(batch_size)
+            if not jobs:
+                break
+            for job in jobs:
+                try:
+                    handle(job)
+                    self.complete(job["bill_id"])
+                    done += 1
+                except Exception as e:
+                    logger.warning(
+                        f"Attempt {job['attempts']}: translation failed for bill {job['bill_id']}: {str(e)}"
+                    )
+                    self.fail(job["bill_id"], str(e))
+                    failed += 1
+
+            elapsed = time.perf_counter() - started
+            backlog = self.stats()
+            logger.info(
+                f"translation queue: done {done}, failed {failed}, "
+                f"{done / elapsed:.2f} bills/s, backlog {backlog}"
+            )
+
+        elapsed = time.perf_counter() - started
+        return {
+            "done": done,
+            "failed": failed,
+            "elapsed": elapsed,
+            "throughput": done / elapsed if elapsed else 0.0,
+        }
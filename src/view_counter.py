@@ -0,0 +1,82 @@
+import os
+from collections import Counter
+
+from src.database import get_db
+from src.db_handler import DBHandler
+from src.query_metrics import query_metrics
+from src.write_behind import WriteBehindBuffer
+
+
+class ViewCounter(WriteBehindBuffer):
+    """
+    Write-behind counter of content views.
+
+    increment() only adds to an in-memory Counter. A background thread writes
+    the buffered increments every `flush_interval` seconds as
+    `UPDATE contents SET views = views + :n` statements in one transaction,
+    and a flush also starts early once `max_pending` contents are buffered.
+    Retries, the buffer cap and stop() are handled by WriteBehindBuffer, so a
+    graceful shutdown loses no views.
+    """
+
+    name = "view counter"
+
+    def __init__(
+        self,
+        flush_interval: float = 5.0,
+        max_pending: int = 1000,
+        session_factory=get_db,
+        max_buffered: int | None = None,
+        max_retries: int = 3,
+    ):
+        """
+        Parameters:
+            flush_interval (float): Seconds between background flushes.
+            max_pending (int): Buffered content ids that trigger an early flush.
+            session_factory: Context manager yielding a DB session.
+            max_buffered (int): Content ids kept at most. Default: 10 x max_pending.
+            max_retries (int): Failed flushes before writing contents one by one.
+        """
+        super().__init__(
+            flush_interval, max_pending, session_factory, max_buffered, max_retries
+        )
+        self._pending: Counter = Counter()
+
+    @classmethod
+    def from_env(cls):
+        """Creates the counter from VIEW_FLUSH_INTERVAL / VIEW_FLUSH_SIZE."""
+        return cls(
+            flush_interval=float(os.getenv("VIEW_FLUSH_INTERVAL", "5")),
+            max_pending=int(os.getenv("VIEW_FLUSH_SIZE", "1000")),
+        )
+
+    def increment(self, content_id: str, n: int = 1) -> None:
+        with self._lock:
+            if content_id in self._pending or self._buffered(len(self._pending), 1):
+                self._pending[content_id] += n
+
+    def pending(self) -> int:
+        """Number of buffered views."""
+        with self._lock:
+            return sum(self._pending.values())
+
+    def _take(self):
+        counts, self._pending = self._pending, Counter()
+        return counts
+
+    def _restore(self, counts) -> None:
+        self._pending.update(counts)
+
+    def _split(self, counts) -> list:
+        return [Counter({content_id: n}) for content_id, n in counts.items()]
+
+    def _count(self, counts) -> int:
+        return sum(counts.values())
+
+    def _write(self, counts) -> bool:
+        with query_metrics.track("view_counter.flush"):
+            with self.session_factory() as db:
+                return DBHandler(db).add_content_views(dict(counts)) is not None
+
+
+view_counter = ViewCounter.from_env()
@@ -0,0 +1,129 @@
+import os
+from datetime import datetime
+
+from src.database import get_db
+from src.db_handler import DBHandler
+from src.dna_logger import logger
+from src.query_metrics import query_metrics
+from src.recent_visits import recent_visits
+from src.write_behind import WriteBehindBuffer
+
+
+def _local_naive(when: datetime | None) -> datetime | None:
+    # visited_at 컬럼은 timezone 없는 로컬 시간이다
+    if when is not None and when.tzinfo is not None:
+        return when.astimezone().replace(tzinfo=None)
+    return when
+
+
+class VisitBuffer(WriteBehindBuffer):
+    """
+    Write-behind buffer of user page visits.
+
+    add() appends the visits to an in-memory list and hands them to the
+    registered listeners (e.g. recent-visit caches), so readers see a visit
+    before it is written. A background thread writes the buffer with one
+    multi-row INSERT every `flush_interval` seconds, or earlier once
+    `max_pending` visits are buffered. Retries, the buffer cap and stop() are
+    handled by WriteBehindBuffer.
+    """
+
+    name = "visit buffer"
+
+    def __init__(
+        self,
+        flush_interval: float = 2.0,
+        max_pending: int = 500,
+        session_factory=get_db,
+        max_buffered: int | None = None,
+        max_retries: int = 3,
+    ):
+        """
+        Parameters:
+            flush_interval (float): Seconds between background flushes.
+            max_pending (int): Buffered visits that trigger an early flush.
+            session_factory: Context manager yielding a DB session.
+            max_buffered (int): Visits kept at most. Default: 10 x max_pending.
+            max_retries (int): Failed flushes before writing visits one by one.
+        """
+        super().__init__(
+            flush_interval, max_pending, session_factory, max_buffered, max_retries
+        )
+        self._pending: list[dict] = []
+        self._listeners = []
+
+    @classmethod
+    def from_env(cls):
+        """Creates the buffer from VISIT_FLUSH_INTERVAL / VISIT_FLUSH_SIZE."""
+        return cls(
+            flush_interval=float(os.getenv("VISIT_FLUSH_INTERVAL", "2")),
+            max_pending=int(os.getenv("VISIT_FLUSH_SIZE", "500")),
+        )
+
+    def add_listener(self, listener) -> None:
+        """Registers listener(visits), called with every batch passed to add()."""
+        self._listeners.append(listener)
+
+    def add(self, visits) -> int:
+        """
+        Buffers visits.
+
+        Parameters:
+            visits (iterable): dicts with user_id, page_id, visit_time and an
+                optional visited_at (default: now), truncated to seconds.
+
+        Returns:
+            int: Number of visits buffered, 0 when the buffer is full.
+        """
+        now = datetime.now()
+        rows = [
+            {
+                "user_id": visit["user_id"],
+                "page_id": visit["page_id"],
+                "visit_time": visit["visit_time"],
+                # DB는 초 단위로 반올림해 저장하므로, 캐시와 DB 값이 같도록 미리 자른다
+                "visited_at": (_local_naive(visit.get("visited_at")) or now).replace(
+                    microsecond=0
+                ),
+            }
+            for visit in visits
+        ]
+        if not rows:
+            return 0
+        with self._lock:
+            if not self._buffered(len(self._pending), len(rows)):
+                return 0
+            self._pending.extend(rows)
+        for listener in self._listeners:
+            try:
+                listener(rows)
+            except Exception as e:
+                logger.error(f"visit buffer: listener failed - {str(e)}")
+        return len(rows)
+
+    def pending(self) -> int:
+        """Number of buffered visits."""
+        with self._lock:
+            return len(self._pending)
+
+    def _take(self):
+        rows, self._pending = self._pending, []
+        return rows
+
+    def _restore(self, rows) -> None:
+        self._pending[:0] = rows
+
+    def _split(self, rows) -> list:
+        return [[row] for row in rows]
+
+    def _count(self, rows) -> int:
+        return len(rows)
+
+    def _write(self, rows) -> bool:
+        with query_metrics.track("visit_buffer.flush"):
+            with self.session_factory() as db:
+                return DBHandler(db).add_page_visits(rows) is not None
+
+
+visit_buffer = VisitBuffer.from_env()
+visit_buffer.add_listener(recent_visits.record)
@@ -0,0 +1,169 @@
+import atexit
+import threading
+
+from src.dna_logger import logger
+
+
+class WriteBehindBuffer:
+    """
+    Base of the write-behind buffers (ViewCounter, VisitBuffer).
+
+    Writes are buffered in memory and a background thread flushes them every
+    `flush_interval` seconds, or earlier once `max_pending` items are buffered.
+    At most `max_buffered` items are kept; writes beyond that are dropped and
+    counted in `dropped`, so a DB outage cannot grow the buffer without bound.
+
+    A failed flush puts its items back into the buffer. After `max_retries`
+    failed flushes in a row the items are written one by one, and the ones
+    that still fail are logged as dead letters and dropped, so a single bad
+    row cannot block the rest. stop() writes what is left.
+
+    Subclasses keep the buffered items in their own structure and implement
+    _take, _restore, _split, _count and _write.
+    """
+
+    name = "write-behind buffer"
+
+    def __init__(
+        self,
+        flush_interval: float,
+        max_pending: int,
+        session_factory,
+        max_buffered: int | None = None,
+        max_retries: int = 3,
+    ):
+        """
+        Parameters:
+            flush_interval (float): Seconds between background flushes.
+            max_pending (int): Buffered items that trigger an early flush.
+            session_factory: Context manager yielding a DB session.
+            max_buffered (int): Items kept at most. Default: 10 x max_pending.
+            max_retries (int): Failed flushes before writing items one by one.
+        """
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_buffered = max_buffered or max_pending * 10
+        self.max_retries = max_retries
+        self.session_factory = session_factory
+        self.flushed = 0
+        self.dropped = 0
+        self._failures = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _take(self):
+        """Removes and returns every buffered item. Called with the lock held."""
+        raise NotImplementedError
+
+    def _restore(self, items) -> None:
+        """Puts the items of a failed flush back. Called with the lock held."""
+        raise NotImplementedError
+
+    def _split(self, items) -> list:
+        """Splits items into single-item batches for the one-by-one fallback."""
+        raise NotImplementedError
+
+    def _count(self, items) -> int:
+        """Number of writes (visits, views...) in items."""
+        raise NotImplementedError
+
+    def _write(self, items) -> bool:
+        """Writes items in one transaction. Returns False on failure."""
+        raise NotImplementedError
+
+    def _buffered(self, size: int, extra: int) -> bool:
+        """
+        Checks whether `extra` more items fit next to `size` buffered ones and
+        counts them as dropped when they do not. Called with the lock held.
+        """
+        if size + extra <= self.max_buffered:
+            if size + extra >= self.max_pending:
+                self._wakeup.set()
+            return True
+        self.dropped += extra
+        logger.warning(
+            f"{self.name}: buffer full ({size} items), dropped {extra} items"
+        )
+        return False
+
+    def _try_write(self, items) -> bool:
+        try:
+            return self._write(items)
+        except Exception as e:
+            logger.error(f"{self.name}: {str(e)}")
+            return False
+
+    def flush(self) -> int:
+        """
+        Writes the buffered items.
+
+        Returns:
+            int: Number of writes flushed.
+        """
+        with self._flush_lock:
+            with self._lock:
+                items = self._take()
+            count = self._count(items)
+            if not count:
+                return 0
+            if self._try_write(items):
+                self._failures = 0
+                self.flushed += count
+                logger.debug(f"{self.name}: flushed {count} items")
+                return count
+
+            self._failures += 1
+            if self._failures < self.max_retries:
+                # 실패한 항목은 다음 flush에서 다시 시도한다
+                with self._lock:
+                    self._restore(items)
+                logger.error(
+                    f"{self.name}: flush of {count} items failed "
+                    f"({self._failures}/{self.max_retries})"
+                )
+                return 0
+
+            # 같은 항목 때문에 계속 실패하지 않도록 하나씩 저장하고, 실패한 항목은 버린다
+            self._failures = 0
+            written = 0
+            for item in self._split(items):
+                if self._try_write(item):
+                    written += self._count(item)
+                else:
+                    self.dropped += self._count(item)
+                    logger.error(f"{self.name}: dead letter {item}")
+            self.flushed += written
+            logger.error(
+                f"{self.name}: wrote {written} of {count} items one by one after "
+                f"{self.max_retries} failed flushes"
+            )
+            return written
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def start(self) -> None:
+        """Starts the background flush thread and flushes again at exit."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=self.name.replace(" ", "-"), daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Stops the background thread and writes the remaining items."""
+        if self._thread is not None:
+            self._stop.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
@@ -0,0 +1,33 @@
+import requests
+
+import utils.backfill as backfill
+
+
+def test_partition_with_failed_day_is_not_checkpointed(monkeypatch, tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    monkeypatch.setattr(
+        backfill, "main", lambda dae_num, date, *args: date != "2025-01-03"
+    )
+
+    counts = backfill.run_backfill(
+        "2025-01-01",
+        "2025-01-06",
+        chunk_days=3,
+        workers=2,
+        checkpoint_path=checkpoint_path,
+        use_schedule=False,
+    )
+
+    assert counts["completed"] == 1
+    assert counts["failed"] == 1
+    checkpoint = backfill.BackfillCheckpoint(checkpoint_path)
+    assert checkpoint.done == {"22:2025-01-04:2025-01-06"}
+
+
+def test_schedule_connection_error_queries_every_day(monkeypatch):
+    def iter_rows(*args, **kwargs):
+        raise requests.ConnectionError("connection reset")
+
+    monkeypatch.setattr(backfill, "iter_rows", iter_rows)
+
+    assert backfill.fetch_schedule_dates() == (set(), None)
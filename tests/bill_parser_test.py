@@ -0,0 +1,85 @@
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+
+import src.extractors as extractors
+from src.extractors import (
+    extract_bill_no_pdf_url,
+    extract_bill_summary,
+    parse_bill_page,
+)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "bill_pages")
+FIXTURES = sorted(os.listdir(FIXTURE_DIR))
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+        return f.read()
+
+
+def full_parse(content):
+    soup = BeautifulSoup(content, "html.parser")
+    bill_no, pdf_url = extract_bill_no_pdf_url(soup)
+    return extract_bill_summary(soup), bill_no, pdf_url
+
+
+@pytest.mark.parametrize("name", FIXTURES)
+def test_restricted_parse_matches_full_parse(name):
+    content = read_fixture(name)
+
+    assert parse_bill_page(content) == full_parse(content)
+
+
+@pytest.mark.parametrize("name", FIXTURES)
+def test_restricted_parse_with_html_parser(name):
+    content = read_fixture(name)
+
+    assert parse_bill_page(content, parser="html.parser") == full_parse(content)
+
+
+def test_parse_bill_page_values():
+    summary, bill_no, pdf_url = parse_bill_page(
+        read_fixture("bill_detail_with_summary.html")
+    )
+
+    assert bill_no == "2205123"
+    assert summary.startswith("제안이유")
+    assert pdf_url == (
+        "https://likms.assembly.go.kr/filegate/sender24?dummy=dummy"
+        "&bookId=8A944004-E8FF-C5BE-948F-304B7A8B1790&type=1"
+    )
+
+
+def test_parse_bill_page_empty_content():
+    assert parse_bill_page(None) == ("", "", None)
+
+
+def test_unrecognized_markup_falls_back_to_strainer():
+    content = read_fixture("bill_detail_with_summary.html").replace(
+        b'id="summaryContentDiv"', b"id=summaryContentDiv"
+    )
+
+    assert parse_bill_page(content) == full_parse(content)
+    assert parse_bill_page(content)[0].startswith("제안이유")
+
+
+def test_bill_page_is_parsed_once(monkeypatch):
+    content = read_fixture("bill_detail_with_summary.html")
+    calls = []
+
+    def counting_parse(page, *args, **kwargs):
+        calls.append(page)
+        return parse_bill_page(page, *args, **kwargs)
+
+    monkeypatch.setattr(extractors, "parse_bill_page", counting_parse)
+    extractor = extractors.BillExtractor("https://example.com/billDetail.do")
+    monkeypatch.setattr(extractor, "get_page", lambda link: content)
+    monkeypatch.setattr(extractor, "get_bill_info_raw", lambda bill_no: None)
+
+    page_fields, info = extractor.fetch()
+    extractors.parse_bill(page_fields, info)
+
+    assert len(calls) == 1
+    assert page_fields == parse_bill_page(content)
@@ -0,0 +1,35 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.models import Base
+
+
+@pytest.fixture
+def sqlite_sessionmaker():
+    """모든 테이블을 만든 in-memory sqlite DB의 sessionmaker"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(sqlite_sessionmaker):
+    """src.database.get_db처럼 세션을 여닫는 context manager"""
+
+    @contextmanager
+    def factory():
+        with sqlite_sessionmaker() as db:
+            yield db
+
+    return factory
+
+
+@pytest.fixture
+def sqlite_session(sqlite_sessionmaker):
+    db = sqlite_sessionmaker()
+    yield db
+    db.close()
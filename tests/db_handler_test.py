@@ -1,8 +1,10 @@
 import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from src.models import Bill
+from src.models import Bill, SimilarityScore, TranslationJob
 from src.db_handler import DBHandler
-from datetime import datetime
+from datetime import date, datetime
 import src.database as database
 
 
@@ -17,6 +19,11 @@ def db_handler(db_session):
     return DBHandler(db_session)
 
 
+@pytest.fixture
+def sqlite_handler(sqlite_session):
+    return DBHandler(sqlite_session)
+
+
 @pytest.fixture
 def sample_bill_params():
     return {
@@ -35,6 +42,16 @@ def sample_bill_params():
     }
 
 
+@pytest.fixture
+def sqlite_bill_params(sample_bill_params):
+    # sqlite의 Date 컬럼은 문자열을 받지 않는다
+    return dict(
+        sample_bill_params,
+        ppsl_date=date.fromisoformat(sample_bill_params["ppsl_date"]),
+        rgs_rsln_date=date.fromisoformat(sample_bill_params["rgs_rsln_date"]),
+    )
+
+
 @pytest.fixture
 def before_clean_bill(db_handler: DBHandler, sample_bill_params):
     db_handler.del_bill(sample_bill_params["bill_id"])
@@ -92,11 +109,10 @@ def test_read_all_value_table(db_handler: DBHandler, sample_bill_params):
     db_handler.save_bill(sample_bill_params)
 
     # When
-    results = db_handler.get_all_value_tables()
+    results = db_handler.get_all_value_tables("bill_id")
 
     # Then
-    assert len(results) > 0
-    assert isinstance(results[0], Bill)
+    assert sample_bill_params["bill_id"] in results
 
 
 def test_read_value_table(db_handler: DBHandler, sample_bill_params):
@@ -138,3 +154,183 @@ def test_del_bill(db_handler: DBHandler, sample_bill_params):
 
     # Then
     assert db_handler.get_bill(sample_bill_params["bill_id"]) is None
+
+
+def test_save_bills(sqlite_handler: DBHandler, sqlite_bill_params):
+    other_params = dict(sqlite_bill_params, bill_id="test_id_2")
+    for params in (sqlite_bill_params, other_params):
+        if sqlite_handler.check_bill_exists(params["bill_id"]):
+            sqlite_handler.del_bill(params["bill_id"])
+    # Given
+    sqlite_handler.save_bill(sqlite_bill_params)
+
+    # When
+    first = sqlite_handler.save_bills([sqlite_bill_params, other_params])
+    second = sqlite_handler.save_bills(
+        [dict(sqlite_bill_params, bill_title="Updated Title"), other_params]
+    )
+
+    # Then
+    assert first == {"inserted": 1, "updated": 0, "unchanged": 1}
+    assert second == {"inserted": 0, "updated": 1, "unchanged": 1}
+    bill = sqlite_handler.get_bill(sqlite_bill_params["bill_id"])
+    assert bill.bill_title == "Updated Title"
+    sqlite_handler.del_bill(other_params["bill_id"])
+
+
+def test_batch_commits_at_exit(sqlite_handler: DBHandler, sqlite_bill_params):
+    if sqlite_handler.check_bill_exists(sqlite_bill_params["bill_id"]):
+        sqlite_handler.del_bill(sqlite_bill_params["bill_id"])
+
+    # When
+    with sqlite_handler.batch(max_size=10) as batch:
+        sqlite_handler.save_bill(sqlite_bill_params)
+        sqlite_handler.update_bill_value(
+            sqlite_bill_params["bill_id"], "bill_title", "Updated Title"
+        )
+        pending = batch.pending
+
+    # Then
+    assert pending == 2
+    assert batch.committed == 2 and batch.commits == 1
+    bill = sqlite_handler.get_bill(sqlite_bill_params["bill_id"])
+    assert bill.bill_title == "Updated Title"
+
+
+def test_save_bills_resets_translation_of_changed_text(
+    sqlite_handler: DBHandler, sqlite_bill_params
+):
+    # Given
+    sqlite_handler.save_bills([sqlite_bill_params])
+    sqlite_handler.save_bill_translation(sqlite_bill_params["bill_id"], "Title", "Body")
+    sqlite_handler.db.add(
+        TranslationJob(bill_id=sqlite_bill_params["bill_id"], status="done", attempts=1)
+    )
+    sqlite_handler.db.commit()
+
+    # When
+    counts = sqlite_handler.save_bills(
+        [dict(sqlite_bill_params, bill_body="수정된 내용", pdf_url="https://new.pdf")]
+    )
+
+    # Then
+    bill = sqlite_handler.get_bill(sqlite_bill_params["bill_id"])
+    job = sqlite_handler.db.query(TranslationJob).one()
+    assert counts == {"inserted": 0, "updated": 1, "unchanged": 0}
+    assert bill.bill_body == "수정된 내용" and bill.pdf_url == "https://new.pdf"
+    assert bill.bill_title_eng is None and bill.bill_body_eng is None
+    assert job.status == "pending" and job.attempts == 0
+
+
+def test_save_bills_keeps_translation_of_unchanged_text(
+    sqlite_handler: DBHandler, sqlite_bill_params
+):
+    sqlite_handler.save_bills([sqlite_bill_params])
+    sqlite_handler.save_bill_translation(sqlite_bill_params["bill_id"], "Title", "Body")
+
+    sqlite_handler.save_bills([dict(sqlite_bill_params, pdf_url="https://new.pdf")])
+
+    bill = sqlite_handler.get_bill(sqlite_bill_params["bill_id"])
+    assert bill.bill_title_eng == "Title"
+
+
+def test_batch_rolls_back_only_the_failed_write(
+    sqlite_handler: DBHandler, sqlite_bill_params
+):
+    first = dict(sqlite_bill_params, bill_id="batch_1")
+    broken = dict(sqlite_bill_params, bill_id="batch_2", bill_title=None)
+    third = dict(sqlite_bill_params, bill_id="batch_3")
+
+    # When
+    with sqlite_handler.batch(max_size=10) as batch:
+        results = [
+            sqlite_handler.save_bills([params]) for params in (first, broken, third)
+        ]
+
+    # Then
+    assert results[1] is None
+    assert batch.rolled_back == 1 and batch.committed == 2
+    assert sqlite_handler.get_bill("batch_1") is not None
+    assert sqlite_handler.get_bill("batch_2") is None
+    assert sqlite_handler.get_bill("batch_3") is not None
+
+
+def test_batch_keeps_other_writes_when_a_score_fails(
+    sqlite_handler: DBHandler, sqlite_bill_params
+):
+    # When
+    with sqlite_handler.batch(max_size=10) as batch:
+        sqlite_handler.save_bills([dict(sqlite_bill_params, bill_id="batch_1")])
+        sqlite_handler.save_similarity_score("batch_1", "batch_2", 0.5)
+        sqlite_handler.save_similarity_score("batch_1", "batch_3", None)
+        sqlite_handler.save_bills([dict(sqlite_bill_params, bill_id="batch_2")])
+
+    # Then
+    assert batch.rolled_back == 1 and batch.committed == 3
+    assert sqlite_handler.get_bill("batch_1") is not None
+    assert sqlite_handler.get_bill("batch_2") is not None
+    scores = sqlite_handler.db.query(SimilarityScore).all()
+    assert [score.target_bill_id for score in scores] == ["batch_1"]
+
+
+def test_batch_reads_use_no_savepoint(sqlite_handler: DBHandler, sqlite_bill_params):
+    statements = []
+    event.listen(
+        sqlite_handler.db.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    with sqlite_handler.batch(max_size=10):
+        sqlite_handler.check_bill_exists(sqlite_bill_params["bill_id"])
+        sqlite_handler.get_bill(sqlite_bill_params["bill_id"])
+        savepoints_before_write = sum("SAVEPOINT" in sql for sql in statements)
+        sqlite_handler.save_bill(sqlite_bill_params)
+
+    assert savepoints_before_write == 0
+    assert sum(sql.startswith("SAVEPOINT") for sql in statements) == 1
+
+
+def test_iter_bill_rows_pages_by_id(sqlite_handler: DBHandler, sqlite_bill_params):
+    sqlite_handler.save_bills(
+        [dict(sqlite_bill_params, bill_id=f"page_{i}") for i in range(5)]
+    )
+
+    chunks = []
+    for rows in sqlite_handler.iter_bill_rows(chunk_size=2):
+        chunks.append([row.bill_id for row in rows])
+        # chunk 사이에 같은 세션으로 저장할 수 있다
+        sqlite_handler.save_bill_translation(rows[0].bill_id, "Title", "Body")
+
+    assert chunks == [["page_0", "page_1"], ["page_2", "page_3"], ["page_4"]]
+    assert [content["id"] for content in sqlite_handler.get_translated_contents()] == [
+        "page_0",
+        "page_2",
+        "page_4",
+    ]
+
+
+def test_get_all_reads_only_the_given_columns(
+    sqlite_handler: DBHandler, sqlite_bill_params
+):
+    sqlite_handler.save_bills(
+        [dict(sqlite_bill_params, bill_id=f"all_{i}") for i in range(3)]
+    )
+
+    bills = sqlite_handler.get_all_bills(("bill_id", "pdf_url"), chunk_size=2)
+
+    assert [tuple(bill) for bill in bills] == [
+        (i + 1, f"all_{i}", sqlite_bill_params["pdf_url"]) for i in range(3)
+    ]
+    assert sqlite_handler.get_all_value_tables("bill_id", chunk_size=2) == [
+        "all_0",
+        "all_1",
+        "all_2",
+    ]
+
+
+def test_iter_bill_rows_raises_sql_errors(sqlite_handler: DBHandler):
+    Bill.__table__.drop(sqlite_handler.db.get_bind())
+
+    with pytest.raises(SQLAlchemyError):
+        next(sqlite_handler.iter_bill_rows())
@@ -0,0 +1,69 @@
+import time
+
+from src.embedding import EmbeddingStage, bill_text, decode_embedding, text_hash
+from src.llm_backend import StubBackend
+
+
+class FakeHandler:
+    """Stores embeddings in a dict keyed by bill_id."""
+
+    def __init__(self):
+        self.rows = {}
+
+    def get_embedding_hashes(self, bill_ids):
+        return {
+            bill_id: self.rows[bill_id]["text_hash"]
+            for bill_id in bill_ids
+            if bill_id in self.rows
+        }
+
+    def save_embeddings(self, rows):
+        self.rows.update((row["bill_id"], row) for row in rows)
+        return len(rows)
+
+
+def make_bills(*titles):
+    return [
+        {"bill_id": f"B{i}", "bill_title": title, "bill_summary": "summary"}
+        for i, title in enumerate(titles)
+    ]
+
+
+def test_run_embeds_only_changed_texts():
+    handler = FakeHandler()
+    backend = StubBackend(embedding_dim=4)
+    stage = EmbeddingStage(handler, backend=backend, batch_size=2, rate=0)
+
+    assert stage.run(make_bills("a", "b", "c")) == {
+        "skipped": 0,
+        "embedded": 3,
+        "failed": 0,
+    }
+    calls = backend.calls
+    result = stage.run(make_bills("a", "b changed", "c"))
+    stage.close()
+
+    assert result == {"skipped": 2, "embedded": 1, "failed": 0}
+    assert backend.calls == calls + 1
+    bill = make_bills("a", "b changed")[1]
+    assert handler.rows["B1"]["text_hash"] == text_hash(bill_text(bill))
+    assert len(decode_embedding(handler.rows["B1"]["embedding"])) == 4
+
+
+def test_embed_texts_is_rate_limited_and_reuses_the_executor():
+    backend = StubBackend(embedding_dim=2)
+    stage = EmbeddingStage(backend=backend, batch_size=1, max_workers=4, rate=20)
+
+    started = time.perf_counter()
+    vectors = stage.embed_texts(["a", "b", "c"])
+    executor = stage.executor
+    stage.embed_texts(["d"])
+    elapsed = time.perf_counter() - started
+    assert stage.executor is executor
+    stage.close()
+
+    assert len(vectors) == 3
+    assert backend.calls == 4
+    # 토큰은 초당 20개: 첫 요청 이후 3개는 최소 0.05초 간격
+    assert elapsed >= 0.14
+    assert stage._executor is None
@@ -0,0 +1,112 @@
+import datetime
+from contextlib import contextmanager
+
+import pytest
+
+import src.extractors as extractors
+import utils.extract_all as extract_all
+from src.open_api import OpenAPIError
+
+
+class FakeHandler:
+    def __init__(self, last_date=None, mark_result=True):
+        self.last_date = last_date
+        self.mark_result = mark_result
+        self.marked = []
+
+    def get_last_processed_date(self):
+        return self.last_date
+
+    def mark_date_processed(self, content_date):
+        self.marked.append(content_date)
+        return self.mark_result
+
+    def save_conf(self, params):
+        return True
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    handler = FakeHandler(last_date=datetime.date.today() - datetime.timedelta(days=3))
+
+    @contextmanager
+    def get_handler():
+        yield handler
+
+    monkeypatch.setattr(extract_all, "get_handler", get_handler)
+    return handler
+
+
+def test_failed_conference_fetch_fails_the_day(monkeypatch):
+    def iter_rows(*args, **kwargs):
+        raise OpenAPIError("ERROR-290: quota exceeded")
+        yield
+
+    monkeypatch.setattr(extractors, "iter_rows", iter_rows)
+
+    assert extract_all.main(22, "2025-01-02") is False
+
+
+def test_day_without_conferences_succeeds(monkeypatch):
+    monkeypatch.setattr(extractors, "iter_rows", lambda *args, **kwargs: iter(()))
+
+    assert extract_all.main(22, "2025-01-02") is True
+
+
+def fake_iter_rows(links):
+    def iter_rows(endpoint, params=None, **kwargs):
+        if endpoint == "VCONFBILLLIST":
+            if links is None:
+                raise OpenAPIError("ERROR-300: missing CONF_ID")
+            return iter([{"LINK_URL": link} for link in links])
+        return iter([{"CONFER_NUM": "C1", "CONF_DATE": params["CONF_DATE"]}])
+
+    return iter_rows
+
+
+class FailingRunner:
+    def __init__(self):
+        self.retry_links = []
+
+    def run(self, links):
+        self.retry_links = list(links)
+
+    def retry(self):
+        self.run(self.retry_links)
+
+
+def test_failed_bill_link_fetch_fails_the_day(monkeypatch):
+    monkeypatch.setattr(extractors, "iter_rows", fake_iter_rows(None))
+
+    assert extract_all.main(22, "2025-01-02") is False
+
+
+def test_unsaved_links_are_released(monkeypatch):
+    @contextmanager
+    def get_handler():
+        yield FakeHandler()
+
+    monkeypatch.setattr(extractors, "get_handler", get_handler)
+    monkeypatch.setattr(extractors, "iter_rows", fake_iter_rows(["L1", "L2"]))
+    seen_links = extractors.LinkDeduplicator()
+
+    assert extract_all.main(22, "2025-01-02", FailingRunner(), seen_links) is False
+    assert seen_links.claim(["L1", "L2"]) == ["L1", "L2"]
+
+
+def test_incremental_stops_at_failed_day(monkeypatch, handler):
+    results = iter([True, False, True])
+    monkeypatch.setattr(extract_all, "main", lambda *args: next(results))
+
+    processed = extract_all.run_incremental(runner=object())
+
+    assert processed == handler.marked
+    assert len(processed) == 1
+
+
+def test_incremental_stops_when_mark_fails(monkeypatch, handler):
+    handler.mark_result = None
+    monkeypatch.setattr(extract_all, "main", lambda *args: True)
+
+    assert extract_all.run_incremental(runner=object()) == []
+    assert len(handler.marked) == 1
@@ -0,0 +1,66 @@
+from contextlib import contextmanager
+
+import pytest
+
+import src.ingestion as ingestion
+import utils.extract_all as extract_all
+
+
+def allbill_row(i):
+    return {
+        "BILL_ID": f"B{i}",
+        "BILL_NO": f"22{i:05d}",
+        "BILL_NM": f"title {i}",
+        "PPSR_NM": "proposer",
+        "PPSL_DT": "2025-01-02",
+        "JRCMIT_NM": None,
+        "RGS_RSLN_DT": None,
+        "RGS_CONF_RSLT": None,
+        "LINK_URL": f"https://likms.assembly.go.kr/bill/billDetail.do?billId=B{i}",
+    }
+
+
+class FakeHandler:
+    def get_stored_summaries(self, bill_ids):
+        return {bill_id: ("summary", None) for bill_id in bill_ids}
+
+
+@pytest.fixture
+def harvester(monkeypatch):
+    @contextmanager
+    def get_handler():
+        yield FakeHandler()
+
+    monkeypatch.setattr(ingestion, "get_handler", get_handler)
+    monkeypatch.setattr(
+        ingestion, "iter_rows", lambda *args, **kwargs: iter(map(allbill_row, range(5)))
+    )
+    return ingestion.BillHarvester(max_workers=1, rate_per_host=0, batch_size=2)
+
+
+def test_failed_batch_is_kept_for_retry(monkeypatch, harvester):
+    fail_once = {"B2"}
+
+    def save_bills(records):
+        if records[0]["bill_id"] in fail_once:
+            fail_once.discard(records[0]["bill_id"])
+            raise RuntimeError("failed to save a batch of 2 bills")
+        return {"inserted": len(records), "updated": 0, "unchanged": 0}
+
+    monkeypatch.setattr(ingestion, "save_bills", save_bills)
+
+    counts = harvester.run(22)
+    assert counts["inserted"] == 3 and counts["failed_rows"] == 2
+    assert [row["BILL_ID"] for rows in harvester.failed_batches for row in rows] == [
+        "B2",
+        "B3",
+    ]
+
+    retried = harvester.retry()
+    assert retried["inserted"] == 2 and retried["failed_rows"] == 0
+    assert harvester.failed_batches == []
+
+
+def test_run_harvest_rejects_dates_before_first_assembly():
+    with pytest.raises(ValueError, match="1948-05-31"):
+        extract_all.run_harvest("1900-01-01", "2025-01-01")
@@ -0,0 +1,110 @@
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+import src.open_api as open_api
+from src.http_cache import ResponseCache, date_ttl
+from src.http_client import HTTPClient
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serves an open API like XML page. ?CODE= selects the result code."""
+
+    requests = []
+
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        code = query.get("CODE", ["INFO-000"])[0]
+        Handler.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = (
+            f"<X><head><list_total_count>1</list_total_count><RESULT><CODE>{code}"
+            f"</CODE><MESSAGE>m</MESSAGE></RESULT></head><row><ID>1</ID></row></X>"
+        ).encode()
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Handler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}/portal/openapi/"
+    httpd.shutdown()
+
+
+@pytest.fixture
+def client(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache"), ttls={"X": 60})
+    client = HTTPClient(retries=0, cache=cache)
+    yield client
+    client.close()
+
+
+def test_cache_is_created_lazily(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache"))
+
+    assert not (tmp_path / "cache").exists()
+    assert cache.lookup(cache.key("http://example.com/X")) is None
+
+
+def test_fresh_response_is_served_from_cache(server, client):
+    first = client.get(server + "X", params={"KEY": "secret", "pIndex": 1})
+    second = client.get(server + "X", params={"pIndex": 1, "KEY": "other"})
+
+    assert len(Handler.requests) == 1
+    assert getattr(second, "from_cache", False)
+    assert second.content == first.content
+    assert client.cache.stats()["hits"] == 1
+
+
+def test_stale_response_is_revalidated(server, client):
+    first = client.get(server + "X", cache_ttl=0.01)
+    time.sleep(0.02)
+    second = client.get(server + "X", cache_ttl=0.01)
+
+    assert [etag for _, etag in Handler.requests] == [None, '"v1"']
+    assert second.content == first.content
+    assert client.cache.stats()["revalidated"] == 1
+
+
+def test_error_results_are_not_cached(server, client, monkeypatch):
+    monkeypatch.setattr(open_api, "OPEN_API_URL", server)
+
+    for code in ("ERROR-300", "INFO-200", "ERROR-300"):
+        try:
+            list(open_api.iter_rows("X", params={"CODE": code}, client=client))
+        except open_api.OpenAPIError:
+            pass
+    list(open_api.iter_rows("X", client=client))
+    list(open_api.iter_rows("X", client=client))
+
+    assert len(Handler.requests) == 4
+    assert client.cache.stats()["entries"] == 1
+
+
+def test_recent_days_bypass_the_cache(server, client, monkeypatch):
+    monkeypatch.setattr(open_api, "OPEN_API_URL", server)
+    yesterday = date.today() - timedelta(days=1)
+
+    for _ in range(2):
+        list(open_api.iter_rows("X", client=client, cache_ttl=date_ttl(yesterday)))
+
+    assert len(Handler.requests) == 2
+    assert date_ttl(yesterday.isoformat()) == 0
+    assert date_ttl(date.today() - timedelta(days=2)) is None
@@ -0,0 +1,36 @@
+import pytest
+
+from src.llm_backend import (
+    LLMBackendError,
+    RecordingBackend,
+    ReplayBackend,
+    StubBackend,
+)
+
+
+def test_stub_backend_is_deterministic():
+    backend = StubBackend(embedding_dim=4)
+
+    assert backend.generate("text", "system") == backend.generate("text", "system")
+    assert backend.embed(["a", "b"]) == StubBackend(embedding_dim=4).embed(["a", "b"])
+    assert backend.embed(["a"]) != backend.embed(["b"])
+    with pytest.raises(LLMBackendError):
+        StubBackend(failure_rate=1.0).generate("text", "system")
+
+
+def test_record_then_replay(tmp_path):
+    recorder = RecordingBackend(StubBackend(embedding_dim=4), str(tmp_path))
+    generated = recorder.generate("text", "system", temperature=0.5)
+    embedded = recorder.embed(["a", "b"])
+
+    replay = ReplayBackend(str(tmp_path))
+
+    assert replay.generate("text", "system", temperature=0.5) == generated
+    assert replay.embed(["a", "b"]) == embedded
+    # 다른 sampling 설정으로 기록된 응답은 재생하지 않는다
+    with pytest.raises(LLMBackendError):
+        replay.generate("text", "system", temperature=0)
+    with pytest.raises(LLMBackendError):
+        replay.generate("text", "system", temperature=0.5, stop_sequences=["끝"])
+    with pytest.raises(LLMBackendError):
+        replay.embed(["c"])
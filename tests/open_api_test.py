@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from src.open_api import OpenAPIError, iter_rows
+
+
+class FakeResponse:
+    def __init__(self, content: bytes, status_code: int = 200):
+        self.content = content
+        self.status_code = status_code
+
+
+class FakeClient:
+    """Serves `total` numbered rows of an endpoint, page by page."""
+
+    def __init__(self, endpoint: str, total: int, code: str = "INFO-000"):
+        self.endpoint = endpoint
+        self.total = total
+        self.code = code
+        self.requested = []
+
+    def get(self, url, params=None, **kwargs):
+        index, size = params["pIndex"], params["pSize"]
+        self.requested.append(index)
+        ids = range((index - 1) * size, min(index * size, self.total))
+        if params["Type"] == "json":
+            body = {
+                self.endpoint: [
+                    {
+                        "head": [
+                            {"list_total_count": self.total},
+                            {"RESULT": {"CODE": self.code, "MESSAGE": "msg"}},
+                        ]
+                    },
+                    {"row": [{"ID": str(i)} for i in ids]},
+                ]
+            }
+            return FakeResponse(json.dumps(body).encode())
+        rows = "".join(f"<row><ID>{i}</ID></row>" for i in ids)
+        xml = (
+            f"<{self.endpoint}><head><list_total_count>{self.total}</list_total_count>"
+            f"<RESULT><CODE>{self.code}</CODE><MESSAGE>msg</MESSAGE></RESULT></head>"
+            f"{rows}</{self.endpoint}>"
+        )
+        return FakeResponse(xml.encode())
+
+
+@pytest.mark.parametrize("fmt", ["xml", "json"])
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_iter_rows_follows_all_pages(fmt, prefetch):
+    client = FakeClient("ALLSCHEDULE", total=25)
+
+    rows = list(
+        iter_rows("ALLSCHEDULE", fmt=fmt, page_size=10, prefetch=prefetch, client=client)
+    )
+
+    assert [row["ID"] for row in rows] == [str(i) for i in range(25)]
+    assert client.requested == [1, 2, 3]
+
+
+def test_iter_rows_stops_at_max_rows():
+    client = FakeClient("VCONFBILLLIST", total=25)
+
+    rows = list(iter_rows("VCONFBILLLIST", page_size=10, max_rows=12, client=client))
+
+    assert len(rows) == 12
+    assert client.requested == [1, 2]
+
+
+def test_iter_rows_no_data_and_errors():
+    assert list(iter_rows("X", client=FakeClient("X", 0, code="INFO-200"))) == []
+    with pytest.raises(OpenAPIError):
+        list(iter_rows("X", client=FakeClient("X", 5, code="ERROR-300")))
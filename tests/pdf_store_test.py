@@ -0,0 +1,116 @@
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.db_handler import DBHandler
+from src.http_client import HTTPClient
+from src.models import Bill
+from src.pdf_store import PdfStage, PdfStore
+
+PDF_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "pdfs", "bill.pdf")
+
+with open(PDF_PATH, "rb") as f:
+    PDF_BYTES = f.read()
+
+
+class Handler(BaseHTTPRequestHandler):
+    requests = 0
+
+    def do_GET(self):
+        Handler.requests += 1
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(PDF_BYTES)))
+        self.end_headers()
+        self.wfile.write(PDF_BYTES)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Handler.requests = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+@pytest.fixture
+def db_handler(server, sqlite_session):
+    pdf_urls = [
+        f"{server}/b0.pdf",
+        f"{server}/b1.pdf",
+        "PDF URL not found.",
+        "PDF URL extraction failed. Regex did not match.",
+        None,
+    ]
+    sqlite_session.add_all(
+        [
+            Bill(bill_id=f"B{i}", bill_no=i, bill_title="t", ord_num=22, pdf_url=url)
+            for i, url in enumerate(pdf_urls)
+        ]
+    )
+    sqlite_session.commit()
+    return DBHandler(sqlite_session)
+
+
+def test_only_http_pdf_urls_are_pending(db_handler):
+    bills = db_handler.get_bills_without_pdf_text()
+
+    assert [bill["bill_id"] for bill in bills] == ["B0", "B1"]
+
+
+def test_store_keeps_identical_files_once(server, tmp_path):
+    store = PdfStore(str(tmp_path))
+
+    digest, size = store.download(f"{server}/b0.pdf")
+    again, again_size = store.download(f"{server}/b1.pdf")
+
+    assert digest == again and size == len(PDF_BYTES) and again_size == 0
+    assert store.has(digest) and store.bytes_on_disk() == len(PDF_BYTES)
+    assert store.digest_for(f"{server}/b1.pdf") == digest
+    assert store.digest_for(f"{server}/b2.pdf") is None
+
+
+def test_stage_extracts_and_saves_text(db_handler, tmp_path):
+    stage = PdfStage(db_handler, PdfStore(str(tmp_path)), extract_workers=1)
+
+    report = stage.run()
+
+    assert report["extracted"] == 2 and report["failed"] == 0
+    bill = db_handler.get_bill("B0")
+    assert bill.pdf_text == "Bill PDF fixture text"
+    assert db_handler.get_bills_without_pdf_text() == []
+
+    # 본문이 다시 비워진 법안도 같은 주소의 파일은 다시 받지 않는다
+    db_handler.db.query(Bill).update({Bill.pdf_text: None, Bill.pdf_hash: None})
+    db_handler.db.commit()
+    requests = Handler.requests
+    report = stage.run()
+
+    assert report["skipped"] == 2 and Handler.requests == requests
+    assert db_handler.get_bill("B1").pdf_text == "Bill PDF fixture text"
+
+
+def test_stream_holds_the_host_slot_until_closed(server):
+    client = HTTPClient(retries=0, max_per_host=1)
+    finished = threading.Event()
+
+    def fetch():
+        client.get(f"{server}/b1.pdf").close()
+        finished.set()
+
+    with client.stream(f"{server}/b0.pdf") as response:
+        thread = threading.Thread(target=fetch)
+        thread.start()
+        assert not finished.wait(0.2)
+        assert next(response.iter_content(16))
+    thread.join(5)
+
+    assert finished.is_set()
+    with pytest.raises(ValueError):
+        client.get(f"{server}/b0.pdf", stream=True)
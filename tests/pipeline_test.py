@@ -0,0 +1,131 @@
+import threading
+from contextlib import contextmanager
+
+from src.pipeline import Pipeline, Stage
+
+
+def test_pipeline_runs_all_stages():
+    pipeline = Pipeline(
+        [
+            Stage("split", lambda n: range(n), workers=2, fan_out=True),
+            Stage("square", lambda x: x * x, workers=3, queue_size=2),
+            Stage("sum", sum, batch_size=4, batch_timeout=0.1),
+        ],
+        report_interval=0,
+    )
+
+    stats = pipeline.run([3, 4])
+
+    assert sum(pipeline.results) == (0 + 1 + 4) + (0 + 1 + 4 + 9)
+    assert stats["split"]["emitted"] == 7
+    assert stats["square"]["processed"] == 7
+    assert stats["sum"]["processed"] == 7
+
+
+def test_pipeline_counts_failures_and_drops_none():
+    def check(x):
+        if x == 2:
+            raise ValueError("bad item")
+        return None if x == 3 else x
+
+    pipeline = Pipeline([Stage("check", check, workers=2)], report_interval=0)
+
+    stats = pipeline.run(range(5))
+
+    assert sorted(pipeline.results) == [0, 1, 4]
+    assert stats["check"]["processed"] == 4
+    assert stats["check"]["failed"] == 1
+
+
+def test_sink_results_are_dropped_and_stages_closed():
+    closed = []
+
+    def fail(x):
+        raise ValueError("bad item")
+
+    pipeline = Pipeline(
+        [
+            Stage("fail", fail, close=lambda: closed.append("fail")),
+            Stage("save", lambda x: x, sink=True, close=lambda: closed.append("save")),
+        ],
+        report_interval=0,
+    )
+    pipeline.run(range(3))
+
+    sink = Pipeline([Stage("save", lambda x: x, sink=True)], report_interval=0)
+    stats = sink.run(range(3))
+
+    assert closed == ["fail", "save"]
+    assert sink.results == []
+    assert stats["save"]["processed"] == 3
+
+
+def test_pipeline_backpressure_bounds_queue():
+    release = threading.Event()
+    seen = []
+
+    def slow(x):
+        release.wait(1)
+        seen.append(x)
+        return x
+
+    pipeline = Pipeline(
+        [Stage("slow", slow, workers=1, queue_size=1)], report_interval=0
+    )
+    fed = []
+
+    def source():
+        for i in range(5):
+            fed.append(i)
+            yield i
+
+    thread = threading.Thread(target=pipeline.run, args=(source(),))
+    thread.start()
+    thread.join(0.2)
+    # worker holds one item, queue holds one, feeder blocks on the third put
+    assert len(fed) <= 3
+    release.set()
+    thread.join()
+    assert sorted(seen) == list(range(5))
+
+
+def test_summarize_stage_skips_title_fallback(monkeypatch):
+    import src.ingestion as ingestion
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Summarizer must not run without a summary")
+
+    monkeypatch.setattr(ingestion, "Summarizer", fail)
+    pipeline = ingestion.build_ingestion_pipeline(summarize=True, translate=False)
+    summarize = next(stage for stage in pipeline.stages if stage.name == "summarize")
+    record = {"bill_id": "B1", "bill_title": "법안", "bill_body": "법안"}
+
+    assert summarize.func(record) is record
+
+
+def test_translate_stage_only_enqueues(monkeypatch):
+    import src.ingestion as ingestion
+
+    enqueued = []
+
+    class Queue:
+        def __init__(self, db_handler):
+            pass
+
+        def enqueue_missing(self, bill_ids):
+            enqueued.extend(bill_ids)
+
+    @contextmanager
+    def get_handler():
+        yield None
+
+    monkeypatch.setattr(ingestion, "TranslationQueue", Queue)
+    monkeypatch.setattr(ingestion, "get_handler", get_handler)
+    pipeline = ingestion.build_ingestion_pipeline()
+    translate = pipeline.stages[-1]
+    records = [{"bill_id": "B1"}, {"bill_id": "B2"}]
+
+    assert [stage.name for stage in pipeline.stages][-2:] == ["save", "translate"]
+    assert translate.sink
+    assert translate.func(records) is records
+    assert enqueued == ["B1", "B2"]
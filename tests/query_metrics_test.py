@@ -0,0 +1,93 @@
+import threading
+
+from sqlalchemy import create_engine, text
+
+from src.query_metrics import QueryMetrics, normalize_sql
+
+
+def make_metrics(enabled=True):
+    engine = create_engine("sqlite://")
+    metrics = QueryMetrics(enabled=enabled)
+    metrics.install(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER, name TEXT)"))
+    return metrics, engine
+
+
+def test_normalize_sql():
+    assert (
+        normalize_sql("SELECT * FROM t\n WHERE id IN (1, 2, 3) AND name = 'a''b'")
+        == "SELECT * FROM t WHERE id IN (?) AND name = ?"
+    )
+    assert (
+        normalize_sql("INSERT INTO t (id) VALUES (%(id_m0)s), (%(id_m1)s)")
+        == "INSERT INTO t (id) VALUES (?)"
+    )
+
+
+def test_track_counts_queries_of_the_scope():
+    metrics, engine = make_metrics()
+
+    with metrics.track("request") as stats, engine.begin() as conn:
+        conn.execute(text("INSERT INTO t VALUES (1, 'a'), (2, 'b')"))
+        conn.execute(text("SELECT * FROM t WHERE id = :id"), {"id": 1})
+    with engine.begin() as conn:
+        conn.execute(text("SELECT * FROM t"))  # scope 밖의 쿼리
+
+    assert stats.queries == 2
+    assert stats.rows >= 2
+    assert metrics.snapshot()["scopes"]["request"]["runs"] == 1
+    assert len(stats.slowest()) == 2
+
+
+def test_job_scope_counts_only_bound_worker_threads():
+    metrics, engine = make_metrics()
+
+    def worker():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    with metrics.track("job") as stats:
+        bound = threading.Thread(target=metrics.bind(worker))
+        unrelated = threading.Thread(target=worker)
+        for thread in (bound, unrelated):
+            thread.start()
+            thread.join()
+
+    assert stats.queries == 1
+
+
+def test_concurrent_jobs_count_their_own_queries():
+    metrics, engine = make_metrics()
+    started = threading.Barrier(2)
+    results = {}
+
+    def job(name, n):
+        with metrics.track(name) as stats:
+            started.wait()
+            for _ in range(n):
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+            started.wait()
+        results[name] = stats.queries
+
+    threads = [
+        threading.Thread(target=job, args=(name, n))
+        for name, n in (("first", 2), ("second", 3))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {"first": 2, "second": 3}
+
+
+def test_disabled_metrics_do_nothing():
+    metrics, engine = make_metrics(enabled=False)
+
+    with metrics.track("request") as stats, engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert stats is None
+    assert metrics.snapshot()["scopes"] == {}
@@ -0,0 +1,48 @@
+"""Helpers to check the MySQL query plans of the statements a call issues."""
+import re
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+EXPLAINABLE = re.compile(r"^\s*(SELECT|UPDATE|DELETE)\b", re.IGNORECASE)
+
+
+@contextmanager
+def record_statements(db):
+    """
+    Collects the (statement, parameters) of every SELECT / UPDATE / DELETE sent
+    through the session's engine. For executemany only the first parameter
+    set is kept, since they all share one plan.
+    """
+    statements = []
+    engine = db.get_bind()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if EXPLAINABLE.match(statement):
+            statements.append((statement, parameters[0] if executemany else parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def explain(db, statement, parameters) -> list[dict]:
+    """Runs EXPLAIN on a recorded statement and returns the plan rows."""
+    result = db.connection().exec_driver_sql("EXPLAIN " + statement, parameters)
+    return [dict(row._mapping) for row in result]
+
+
+def full_scans(plan: list[dict]) -> list[dict]:
+    """
+    Plan rows that read a whole table (access type ALL), even when MySQL
+    listed possible keys and chose not to use them.
+    Derived tables (<derived2>, <subquery3>, ...) are not counted.
+    """
+    return [
+        row
+        for row in plan
+        if row.get("type") == "ALL"
+        and not str(row.get("table") or "").startswith("<")
+    ]
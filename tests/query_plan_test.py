@@ -0,0 +1,112 @@
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from domain.recommendation import recommendation_crud, recommendation_schema
+from src.db_handler import DBHandler
+from src.recent_visits import recent_visits
+from tests.query_plan import explain, full_scans, record_statements
+
+# 마이그레이션을 끝까지 적용한 MySQL DB의 URL
+# (예: mysql+mysqlconnector://user:pw@localhost/dna)
+QUERY_PLAN_DB = os.getenv("QUERY_PLAN_DB")
+
+pytestmark = pytest.mark.skipif(
+    not QUERY_PLAN_DB, reason="set QUERY_PLAN_DB to check query plans"
+)
+
+# 존재하지 않는 id로 호출하므로 UPDATE는 아무 행도 바꾸지 않는다
+MISSING_ID = "__query_plan_check__"
+MISSING_USER = -1
+
+
+def recent_contents(db):
+    recent_visits.invalidate(MISSING_USER)
+    DBHandler(db).get_recent_contents(MISSING_USER, 20)
+
+
+def best_seller(db):
+    import src.recommendation_models as rm
+
+    rm.BestSeller(DBHandler(db))
+
+
+def new_recommendation(db):
+    import src.recommendation_models as rm
+
+    rm.NewRecommendation(DBHandler(db))
+
+
+def random_recommendation(db):
+    import src.recommendation_models as rm
+
+    rm.RandomRecommendation(DBHandler(db)).recommend_randomly([], 2)
+
+
+QUERIES = {
+    "get_recent_contents": recent_contents,
+    "get_content": lambda db: DBHandler(db).get_content(MISSING_ID),
+    "check_bill_exists": lambda db: DBHandler(db).check_bill_exists(MISSING_ID),
+    "increment_content_views": lambda db: DBHandler(db).increment_content_views(
+        MISSING_ID
+    ),
+    "add_content_views": lambda db: DBHandler(db).add_content_views({MISSING_ID: 1}),
+    "get_similar_contents": lambda db: recommendation_crud.get_similar_contents(
+        db, MISSING_ID, 5
+    ),
+    "get_similarity_totals": lambda db: recommendation_crud.get_similarity_totals(
+        db, [MISSING_ID, MISSING_ID + "2"], 3
+    ),
+    "get_existing_user": lambda db: recommendation_crud.get_existing_user(
+        db,
+        recommendation_schema.CollaborativeRecommendation(user_id=MISSING_USER),
+    ),
+    "BestSeller": best_seller,
+    "NewRecommendation": new_recommendation,
+    "RandomRecommendation": random_recommendation,
+}
+
+# 테이블 전체를 pandas로 읽어 순위를 매기는 추천 모델은 의도적으로 full scan을 한다.
+# 쿼리를 바꿔 scan이 사라지면 strict xfail이 실패하므로 여기서 지운다.
+FULL_SCAN_ALLOWED = {
+    "BestSeller": "ranks every row of contents by views",
+    "NewRecommendation": "ranks every content and bill by views and date",
+    "RandomRecommendation": "samples from every bill",
+}
+
+
+def query_params():
+    for name in QUERIES:
+        if name in FULL_SCAN_ALLOWED:
+            reason = f"intended full scan: {FULL_SCAN_ALLOWED[name]}"
+            mark = pytest.mark.xfail(reason=reason, raises=AssertionError, strict=True)
+            yield pytest.param(name, marks=mark)
+        else:
+            yield name
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine(QUERY_PLAN_DB)
+    try:
+        with Session(engine) as db:
+            yield db
+            db.rollback()
+    finally:
+        engine.dispose()
+
+
+@pytest.mark.parametrize("name", list(query_params()))
+def test_query_does_not_scan_full_table(db_session, name):
+    with record_statements(db_session) as statements:
+        QUERIES[name](db_session)
+
+    assert statements, f"{name} issued no query"
+    for statement, parameters in statements:
+        scans = full_scans(explain(db_session, statement, parameters))
+        assert not scans, (
+            f"{name} scans {[row['table'] for row in scans]} without an index: "
+            f"{statement}"
+        )
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+
+from src.recent_visits import RecentVisitCache
+
+START = datetime(2025, 3, 1, 9, 0)
+
+
+def visit(user_id, page_id, minutes):
+    return {
+        "user_id": user_id,
+        "page_id": page_id,
+        "visited_at": START + timedelta(minutes=minutes),
+    }
+
+
+class FakeLoader:
+    """Returns the stored (page_id, visited_at) rows of a user, newest first."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def __call__(self, limit):
+        self.calls += 1
+        return sorted(self.rows, key=lambda row: row[1], reverse=True)[:limit]
+
+
+def test_cache_loads_once_and_keeps_recorded_visits():
+    cache = RecentVisitCache(size=3)
+    load = FakeLoader([("a", START), ("b", START + timedelta(minutes=1))])
+
+    assert cache.get(1, 3, load) == ["b", "a"]
+    cache.record([visit(1, "c", 2), visit(1, "d", 3)])
+
+    assert cache.get(1, 3, load) == ["d", "c", "b"]
+    assert cache.get(1, 2, load) == ["d", "c"]
+    assert load.calls == 1
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_cache_skips_uncached_users_and_merges_visits_recorded_while_loading():
+    cache = RecentVisitCache(size=5)
+    cache.record([visit(1, "skipped", 10)])
+    assert len(cache) == 0
+
+    rows = [("a", START), ("old", START - timedelta(minutes=1))]
+
+    def load(limit):
+        # 조회 중에 기록된 방문: 이미 DB에 쓰인 방문과 아직 쓰이지 않은 방문
+        cache.record([visit(1, "a", 0), visit(1, "new", 5)])
+        return rows
+
+    assert cache.get(1, 5, load) == ["new", "a", "old"]
+
+
+def test_cache_evicts_least_recently_used_user():
+    cache = RecentVisitCache(max_users=2, size=2)
+    load = FakeLoader([("a", START)])
+
+    cache.get(1, 1, load)
+    cache.get(2, 1, load)
+    cache.get(1, 1, load)
+    cache.get(3, 1, load)
+
+    assert len(cache) == 2
+    cache.get(2, 1, load)
+    assert load.calls == 4
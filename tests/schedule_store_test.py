@@ -0,0 +1,111 @@
+from datetime import datetime
+
+import requests
+
+import src.extractors as extractors
+from src.schedule_store import ScheduleStore, parse_schedule_datetime
+
+
+def make_store(*dates):
+    store = ScheduleStore("SCH_DT", "SCH_TM")
+    store.refresh(
+        {"SCH_DT": date, "SCH_TM": time, "SCH_CN": f"{date} {time}"}
+        for date, time in dates
+    )
+    return store
+
+
+def test_parse_schedule_datetime():
+    assert parse_schedule_datetime("2025.03.04", "14:30") == datetime(2025, 3, 4, 14, 30)
+    assert parse_schedule_datetime("2025-03-04") == datetime(2025, 3, 4)
+    assert parse_schedule_datetime("") is None
+
+
+def test_store_keeps_rows_sorted_and_answers_queries():
+    store = make_store(
+        ("2025.03.05", "10:00"),
+        ("2025.03.01", "09:00"),
+        ("2025.03.03", "15:00"),
+        ("2025.03.03", "11:00"),
+    )
+    now = datetime(2025, 3, 3, 12, 0)
+
+    assert [row["SCH_CN"] for row in store.rows] == [
+        "2025.03.01 09:00",
+        "2025.03.03 11:00",
+        "2025.03.03 15:00",
+        "2025.03.05 10:00",
+    ]
+    assert store.latest(now)["SCH_CN"] == "2025.03.03 11:00"
+    assert store.next(now)["SCH_CN"] == "2025.03.03 15:00"
+    assert len(store.before(now)) == 2
+    assert len(store.after(now)) == 2
+    assert len(store.between(datetime(2025, 3, 3), datetime(2025, 3, 4))) == 2
+    assert store.latest(now, where=lambda row: "09:00" in row["SCH_CN"])["SCH_DT"] == "2025.03.01"
+
+
+def test_store_refresh_is_incremental_and_persistable(tmp_path):
+    store = make_store(("2025.03.01", "09:00"))
+
+    added = store.refresh(
+        [
+            {"SCH_DT": "2025.03.01", "SCH_TM": "09:00", "SCH_CN": "2025.03.01 09:00"},
+            {"SCH_DT": "2025.03.02", "SCH_TM": "09:00", "SCH_CN": "new"},
+        ]
+    )
+    path = str(tmp_path / "schedule.json")
+    store.save(path)
+    loaded = ScheduleStore("SCH_DT", "SCH_TM")
+    loaded.load(path)
+
+    assert added == 1
+    assert loaded.rows == store.rows
+    assert "all" in loaded.refreshed_at
+
+
+def test_store_updates_and_moves_meetings_by_id():
+    store = ScheduleStore("SCH_DT", "SCH_TM", key_fields=("CMIT_NM", "CONF_DGR"))
+    first = {
+        "SCH_DT": "2025.03.01",
+        "SCH_TM": "09:00",
+        "CMIT_NM": "법사위",
+        "CONF_DGR": "1",
+    }
+    second = dict(first, SCH_DT="2025.03.02", CONF_DGR="2")
+    store.refresh([first, second])
+
+    rescheduled = dict(first, SCH_DT="2025.03.03")
+    moved = dict(second, EV_PLC="본관 406호")
+    added = store.refresh([rescheduled, moved])
+
+    assert added == 2
+    assert store.rows == [moved, rescheduled]
+    assert store.between(datetime(2025, 3, 1), datetime(2025, 3, 2)) == []
+    assert store.add(rescheduled) is False
+
+    # 차수가 없는 행은 날짜/시간과 모든 필드로 구분한다
+    event = {"SCH_DT": "2025.03.01", "SCH_TM": "10:00", "CMIT_NM": "법사위"}
+    assert store.add(event) and store.add(dict(event, SCH_TM="11:00"))
+    assert len(store) == 4
+
+
+def test_multi_conf_refresh_keeps_going_when_a_unit_fails(monkeypatch):
+    def iter_conf_schedule(unit_cd):
+        if unit_cd == "U2":
+            raise requests.ConnectionError("connection reset")
+        yield {
+            "UNIT_CD": unit_cd,
+            "TITLE": f"{unit_cd} 회의",
+            "MEETTING_DATE": "2025-03-04",
+            "MEETTING_TIME": "10:00",
+        }
+
+    monkeypatch.setattr(extractors, "iter_conf_schedule", iter_conf_schedule)
+    calendar = extractors.MultiConfScheduleExtractor(["U1", "U2", "U3"])
+
+    results = calendar.refresh()
+
+    assert results == {"U1": 1, "U2": None, "U3": 1}
+    assert [row["UNIT_CD"] for row in calendar.get_schedule()] == ["U1", "U3"]
+    assert "U2" not in calendar.store.refreshed_at
+    assert list(calendar.refresh(max_age=3600)) == ["U2"]
@@ -0,0 +1,72 @@
+from datetime import timedelta
+
+import pytest
+
+from src.db_handler import DBHandler
+from src.models import Bill, TranslationJob
+from src.translation_queue import DONE, FAILED, IN_FLIGHT, PENDING, TranslationQueue
+
+
+@pytest.fixture
+def queue(sqlite_session):
+    sqlite_session.add_all(
+        [
+            Bill(bill_id=f"B{i}", bill_no=i, bill_title=f"title {i}", ord_num=22)
+            for i in range(3)
+        ]
+    )
+    sqlite_session.commit()
+    queue = TranslationQueue(
+        DBHandler(sqlite_session), max_attempts=2, worker_id="test"
+    )
+    queue.enqueue_missing()
+    return queue
+
+
+def test_claim_marks_jobs_in_flight_once(queue):
+    jobs = queue.claim(batch_size=2)
+
+    assert [job["bill_id"] for job in jobs] == ["B0", "B1"]
+    assert jobs[0]["attempts"] == 1
+    assert [job["bill_id"] for job in queue.claim(batch_size=5)] == ["B2"]
+    assert queue.claim() == []
+    assert queue.stats()[IN_FLIGHT] == 3
+
+
+def test_complete_and_fail_with_retry(queue):
+    queue.claim(batch_size=3)
+    queue.complete("B0")
+    queue.fail("B1", "timeout")
+
+    # 시도 횟수가 남은 작업은 pending으로 돌아가 다시 claim된다
+    retried = queue.claim()
+    assert [job["bill_id"] for job in retried] == ["B1"]
+    assert retried[0]["attempts"] == 2
+    queue.fail("B1", "timeout")
+
+    assert queue.stats() == {PENDING: 0, IN_FLIGHT: 1, DONE: 1, FAILED: 1}
+    assert queue.retry_failed() == 1
+    assert [job["bill_id"] for job in queue.claim()] == ["B1"]
+
+
+def test_release_stale_returns_abandoned_jobs(queue):
+    queue.claim(batch_size=1)
+    queue.stale_after = timedelta(seconds=-1)
+
+    assert queue.release_stale() == 1
+    assert queue.stats()[PENDING] == 3
+    assert queue.enqueue_missing() == 0
+
+
+def test_enqueue_missing_only_adds_given_bills(queue):
+    queue.db.add_all(
+        [
+            Bill(bill_id=f"B{i}", bill_no=i, bill_title=f"title {i}", ord_num=22)
+            for i in (3, 4)
+        ]
+    )
+    queue.db.commit()
+
+    assert queue.enqueue_missing(["B0", "B3"]) == 1
+    assert queue.enqueue_missing([]) == 0
+    assert queue.stats()[PENDING] == 4
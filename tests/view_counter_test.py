@@ -0,0 +1,82 @@
+import pytest
+
+from src.models import Content
+from src.view_counter import ViewCounter
+
+
+@pytest.fixture
+def make_counter(sqlite_sessionmaker, session_factory):
+    with sqlite_sessionmaker() as db:
+        db.add_all(
+            [Content(title=name, content_id=name, views=0) for name in ("a", "b")]
+        )
+        db.commit()
+
+    def views():
+        with sqlite_sessionmaker() as db:
+            return {c.content_id: c.views for c in db.query(Content)}
+
+    def make(**kwargs):
+        return ViewCounter(session_factory=session_factory, **kwargs), views
+
+    return make
+
+
+def test_view_counter_buffers_until_flush(make_counter):
+    counter, views = make_counter(flush_interval=60)
+    for content_id in ["a", "a", "b", "a"]:
+        counter.increment(content_id)
+
+    assert views() == {"a": 0, "b": 0}
+    assert counter.flush() == 4
+    assert views() == {"a": 3, "b": 1}
+    assert counter.pending() == 0
+
+
+def test_view_counter_flushes_on_stop(make_counter):
+    counter, views = make_counter(flush_interval=60)
+    counter.start()
+    counter.increment("b", 5)
+    counter.stop()
+
+    assert views() == {"a": 0, "b": 5}
+
+
+def test_visits_endpoint_counts_content_views(monkeypatch, make_counter):
+    from domain.visit import visit_router, visit_schema
+
+    counter, views = make_counter(flush_interval=60)
+    monkeypatch.setattr(visit_router, "view_counter", counter)
+    monkeypatch.setattr(
+        visit_router.visit_buffer, "add", lambda visits: len(list(visits))
+    )
+    batch = visit_schema.PageVisitBatch(
+        visits=[
+            {"user_id": 1, "page_id": page_id, "visit_time": 5}
+            for page_id in ["a", "b", "a"]
+        ]
+    )
+
+    assert visit_router.record_visits(batch) == {"accepted": 3}
+    assert counter.flush() == 3
+    assert views() == {"a": 2, "b": 1}
+
+
+def test_visits_endpoint_rejects_batch_when_buffer_is_full(monkeypatch, make_counter):
+    from fastapi import HTTPException
+
+    from domain.visit import visit_router, visit_schema
+
+    counter, views = make_counter(flush_interval=60)
+    monkeypatch.setattr(visit_router, "view_counter", counter)
+    monkeypatch.setattr(visit_router.visit_buffer, "add", lambda visits: 0)
+    batch = visit_schema.PageVisitBatch(
+        visits=[{"user_id": 1, "page_id": "a", "visit_time": 5}]
+    )
+
+    with pytest.raises(HTTPException) as error:
+        visit_router.record_visits(batch)
+
+    assert error.value.status_code == 503
+    assert counter.flush() == 0
+    assert views() == {"a": 0, "b": 0}
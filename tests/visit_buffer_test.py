@@ -0,0 +1,73 @@
+from datetime import datetime
+
+from src.models import UserPageVisit
+from src.visit_buffer import VisitBuffer
+
+
+def test_visit_buffer_notifies_listeners_and_writes_in_one_flush(
+    sqlite_sessionmaker, session_factory
+):
+    buffer = VisitBuffer(flush_interval=60, session_factory=session_factory)
+    seen = []
+    buffer.add_listener(seen.extend)
+    visited_at = datetime(2025, 3, 1, 9, 0)
+
+    buffer.add(
+        [
+            {"user_id": 1, "page_id": "a", "visit_time": 10, "visited_at": visited_at},
+            {"user_id": 1, "page_id": "b", "visit_time": 3},
+        ]
+    )
+
+    assert [visit["page_id"] for visit in seen] == ["a", "b"]
+    assert buffer.pending() == 2
+    assert buffer.flush() == 2
+    with sqlite_sessionmaker() as db:
+        rows = db.query(UserPageVisit).order_by(UserPageVisit.id).all()
+    assert [(row.page_id, row.visit_time) for row in rows] == [("a", 10), ("b", 3)]
+    assert rows[0].visited_at == visited_at
+    assert buffer.pending() == 0
+
+
+def test_visit_buffer_drops_bad_rows_after_retries(
+    sqlite_sessionmaker, session_factory
+):
+    buffer = VisitBuffer(
+        flush_interval=60, session_factory=session_factory, max_retries=2
+    )
+    buffer.add(
+        [
+            {"user_id": 1, "page_id": "a", "visit_time": 1},
+            {"user_id": 1, "page_id": None, "visit_time": 1},
+            {"user_id": 1, "page_id": "c", "visit_time": 1},
+        ]
+    )
+
+    assert buffer.flush() == 0
+    assert buffer.pending() == 3
+    assert buffer.flush() == 2
+    assert buffer.pending() == 0 and buffer.dropped == 1
+    with sqlite_sessionmaker() as db:
+        assert [row.page_id for row in db.query(UserPageVisit)] == ["a", "c"]
+
+
+def test_visit_buffer_is_capped():
+    buffer = VisitBuffer(flush_interval=60, max_pending=2, max_buffered=3)
+    visit = {"user_id": 1, "page_id": "a", "visit_time": 1}
+
+    assert buffer.add([visit, visit]) == 2
+    assert buffer.add([visit, visit]) == 0
+    assert buffer.pending() == 2 and buffer.dropped == 2
+
+
+def test_visit_buffer_truncates_visited_at_to_seconds():
+    buffer = VisitBuffer(flush_interval=60)
+    seen = []
+    buffer.add_listener(seen.extend)
+    visited_at = datetime(2025, 3, 1, 9, 0, 0, 600000)
+
+    buffer.add(
+        [{"user_id": 1, "page_id": "a", "visit_time": 1, "visited_at": visited_at}]
+    )
+
+    assert seen[0]["visited_at"] == datetime(2025, 3, 1, 9, 0, 0)
@@ -0,0 +1,218 @@
+import datetime
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+from src.dna_logger import logger
+from src.extractors import LinkDeduplicator
+from src.http_client import http_client
+from src.ingestion import BILL_PAGE_HOST, NA_API_HOST, BillIngestionRunner
+from src.open_api import OpenAPIError, iter_rows
+from src.query_metrics import query_metrics
+from utils.extract_all import assembly_dates, generate_date_list, main
+
+def build_partitions(
+    start_date_str=None, end_date_str=None, chunk_days: int = 30
+) -> list[tuple[int, str, str]]:
+    """
+    기간을 국회 대수 경계와 chunk_days 단위로 나눕니다.
+
+    Args:
+        start_date_str: YYYY-MM-DD 시작 날짜. 없으면 1대 국회 시작일
+        end_date_str: YYYY-MM-DD 종료 날짜. 없으면 오늘
+        chunk_days: 파티션 하나의 최대 일수
+
+    Returns:
+        (대수, 시작 날짜, 종료 날짜) 목록. 한 파티션은 한 대수 안에 있습니다.
+    """
+
+    def parse(date_str):
+        return datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
+
+    start = parse(start_date_str or assembly_dates[0][1])
+    end = parse(end_date_str) if end_date_str else datetime.date.today()
+
+    partitions = []
+    for i, (dae_num, dae_start) in enumerate(assembly_dates):
+        dae_end = (
+            parse(assembly_dates[i + 1][1]) - datetime.timedelta(days=1)
+            if i + 1 < len(assembly_dates)
+            else end
+        )
+        current = max(parse(dae_start), start)
+        last = min(dae_end, end)
+        while current <= last:
+            chunk_end = min(current + datetime.timedelta(days=chunk_days - 1), last)
+            partitions.append(
+                (dae_num, current.strftime("%Y-%m-%d"), chunk_end.strftime("%Y-%m-%d"))
+            )
+            current = chunk_end + datetime.timedelta(days=1)
+    return partitions
+
+
+def fetch_schedule_dates() -> tuple[set[str], str | None]:
+    """
+    ALLSCHEDULE 전체 일정에서 회의(본회의/위원회)가 있었던 날짜를 모읍니다.
+
+    Returns:
+        (회의가 있는 YYYY-MM-DD 날짜 집합, 일정 API가 다루는 가장 이른 날짜).
+        일정을 가져오지 못하면 (빈 집합, None)
+    """
+    dates = set()
+    earliest = None
+    try:
+        for sch in iter_rows("ALLSCHEDULE", fmt="json", prefetch=True):
+            sch_dt = (sch.get("SCH_DT") or "").replace(".", "-")
+            if not sch_dt:
+                continue
+            if earliest is None or sch_dt < earliest:
+                earliest = sch_dt
+            kind = sch.get("SCH_KIND") or ""
+            if "회의" in kind or "위원회" in kind:
+                dates.add(sch_dt)
+    except (OpenAPIError, ValueError, requests.RequestException) as e:
+        logger.error(f"error: ALLSCHEDULE request failed - {str(e)}")
+        return set(), None
+
+    logger.info(f"info: {len(dates)} conference days in schedule since {earliest}")
+    return dates, earliest
+
+
+class BackfillCheckpoint:
+    """
+    JSON file of completed partitions, so an interrupted backfill resumes
+    where it stopped. Keys depend on the partition bounds, so changing
+    chunk_days starts the affected range over.
+    """
+
+    def __init__(self, path: str = "./.backfill_checkpoint.json"):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.done = set(json.load(f))
+        except (OSError, ValueError):
+            self.done = set()
+
+    @staticmethod
+    def key(partition) -> str:
+        return ":".join(str(part) for part in partition)
+
+    def is_done(self, partition) -> bool:
+        return self.key(partition) in self.done
+
+    def mark_done(self, partition):
+        with self._lock:
+            self.done.add(self.key(partition))
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(sorted(self.done), f)
+            os.replace(tmp_path, self.path)
+
+
+@query_metrics.job("backfill")
+def run_backfill(
+    start_date_str=None,
+    end_date_str=None,
+    chunk_days: int = 30,
+    workers: int = 4,
+    bill_workers: int = 4,
+    rate_per_host: float = 5.0,
+    checkpoint_path: str = "./.backfill_checkpoint.json",
+    use_schedule: bool = True,
+) -> dict[str, int]:
+    """
+    과거 회의/의안을 파티션 단위로 병렬 수집합니다.
+
+    - 기간을 국회 대수와 chunk_days 단위 파티션으로 나누고 workers개를 동시에 처리합니다.
+    - 요청 속도는 호스트별로 rate_per_host로 제한되며 모든 worker가 공유합니다.
+    - 일정 API가 다루는 기간에서는 회의가 없는 날의 회의 API 호출을 건너뜁니다.
+      일정 API 이전 기간은 모든 날짜를 조회합니다.
+    - 모든 날짜가 성공한 파티션만 체크포인트에 기록되므로 다시 실행하면
+      남은 파티션만 처리합니다.
+
+    Returns:
+        완료/실패/건너뛴 파티션 수와 조회한 날짜 수
+    """
+    checkpoint = BackfillCheckpoint(checkpoint_path)
+    partitions = [
+        p
+        for p in build_partitions(start_date_str, end_date_str, chunk_days)
+        if not checkpoint.is_done(p)
+    ]
+    conf_dates, schedule_start = fetch_schedule_dates() if use_schedule else (set(), None)
+
+    # runner는 worker마다 하나씩 만들고, 호스트 제한은 한 번만 설정해 모두 공유한다
+    runners = [
+        BillIngestionRunner(max_workers=bill_workers, rate_per_host=rate_per_host)
+        for _ in range(workers)
+    ]
+    for host in (NA_API_HOST, BILL_PAGE_HOST):
+        http_client.configure_host(host, workers * bill_workers, rate_per_host)
+    free_runners = list(runners)
+    seen_links = LinkDeduplicator()
+    runner_lock = threading.Lock()
+    counts = {"completed": 0, "failed": 0, "dates": 0, "skipped_dates": 0}
+    counts_lock = threading.Lock()
+
+    def process(partition):
+        dae_num, start, end = partition
+        dates = generate_date_list(start, end)
+        if schedule_start is not None:
+            dates = [d for d in dates if d < schedule_start or d in conf_dates]
+        with runner_lock:
+            runner = free_runners.pop()
+        failed_dates = []
+        try:
+            for date in dates:
+                try:
+                    ok = main(dae_num, date, runner, seen_links)
+                except Exception as e:
+                    logger.error(f"Backfill of {date} failed: {str(e)}")
+                    ok = False
+                if ok is not True:
+                    failed_dates.append(date)
+        finally:
+            with runner_lock:
+                free_runners.append(runner)
+        with counts_lock:
+            counts["dates"] += len(dates)
+            counts["skipped_dates"] += len(generate_date_list(start, end)) - len(dates)
+        if failed_dates:
+            # 하루라도 실패한 파티션은 체크포인트에 기록하지 않고 다음 실행에서 다시 처리한다
+            logger.warning(f"Backfill partition {partition} failed on {failed_dates}")
+        return not failed_dates
+
+    logger.info(f"info: Backfilling {len(partitions)} partitions with {workers} workers")
+    with ThreadPoolExecutor(workers) as executor:
+        # 작업 스레드의 쿼리도 backfill job으로 집계한다
+        process_in_job = query_metrics.bind(process)
+        futures = {executor.submit(process_in_job, p): p for p in partitions}
+        for future in as_completed(futures):
+            partition = futures[future]
+            try:
+                ok = future.result()
+            except Exception as e:
+                logger.error(f"Backfill partition {partition} failed: {str(e)}")
+                ok = False
+            if ok:
+                checkpoint.mark_done(partition)
+                counts["completed"] += 1
+            else:
+                counts["failed"] += 1
+            logger.info(
+                f"info: partition {partition} {'done' if ok else 'failed'} "
+                f"({counts['completed'] + counts['failed']}/{len(partitions)})"
+            )
+
+    logger.info(f"info: Backfill finished {counts}")
+    return counts
+
+
+if __name__ == "__main__":
+    import sys
+
+    run_backfill(*sys.argv[1:3])
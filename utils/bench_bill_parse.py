@@ -0,0 +1,73 @@
+"""
+billDetail.do 페이지 파싱 성능 비교 (전체 파싱 vs 필요한 영역만 파싱)
+
+    python -m utils.bench_bill_parse [페이지 디렉토리] [반복 횟수]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from src.extractors import (
+    HTML_PARSER,
+    extract_bill_no_pdf_url,
+    extract_bill_summary,
+    parse_bill_page,
+)
+
+DEFAULT_PAGE_DIR = os.path.join("tests", "fixtures", "bill_pages")
+
+
+def full_parse(content):
+    """기존 방식: html.parser로 페이지 전체를 파싱"""
+    soup = BeautifulSoup(content, "html.parser")
+    bill_no, pdf_url = extract_bill_no_pdf_url(soup)
+    return extract_bill_summary(soup), bill_no, pdf_url
+
+
+def measure(parse, pages, repeat):
+    """페이지당 평균 파싱 시간(ms)과 최대 메모리 사용량(KiB)을 반환"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for content in pages:
+            parse(content)
+    elapsed_ms = (time.perf_counter() - started) * 1000 / (repeat * len(pages))
+
+    peak = 0
+    for content in pages:
+        tracemalloc.start()
+        parse(content)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return elapsed_ms, peak / 1024
+
+
+def main(page_dir=DEFAULT_PAGE_DIR, repeat=20):
+    pages = []
+    for name in sorted(os.listdir(page_dir)):
+        with open(os.path.join(page_dir, name), "rb") as f:
+            pages.append(f.read())
+
+    for content in pages:
+        assert parse_bill_page(content) == full_parse(content)
+
+    print(f"{len(pages)} pages, {repeat} rounds")
+    print(f"{'method':<32}{'ms/page':>10}{'peak KiB':>12}")
+    for label, parse in [
+        ("full (html.parser)", full_parse),
+        ("restricted (html.parser)", lambda c: parse_bill_page(c, "html.parser")),
+        (f"restricted ({HTML_PARSER})", parse_bill_page),
+    ]:
+        elapsed_ms, peak_kib = measure(parse, pages, repeat)
+        print(f"{label:<32}{elapsed_ms:>10.2f}{peak_kib:>12.0f}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(
+        args[0] if args else DEFAULT_PAGE_DIR,
+        int(args[1]) if len(args) > 1 else 20,
+    )
@@ -1,7 +1,10 @@
-from src.extractors import ConfExtractor, BillExtractor
+from src.extractors import ConfExtractor, LinkDeduplicator, get_handler
+from src.open_api import OpenAPIError
+from src.ingestion import BillHarvester, BillIngestionRunner, build_ingestion_pipeline
 from src.summary import Summarizer
 from src.load import api_keyManager
 from src.dna_logger import logger
+from src.query_metrics import query_metrics
 import datetime
 import time
 # 국회 대수별 시작일자 정보를 저장
@@ -70,27 +73,162 @@ def generate_date_list(start_date_str, end_date_str):
     return date_list
 
 
-def main(dae_num, date):
-    conf = ConfExtractor(dae_num, date)
+def main(
+    dae_num,
+    date,
+    runner: BillIngestionRunner | None = None,
+    seen_links: LinkDeduplicator | None = None,
+) -> bool:
+    """
+    주어진 날짜의 모든 회의와 의안을 수집합니다.
+
+    Args:
+        seen_links: 여러 날짜를 수집할 때 공유하여 이미 수집한 의안 링크를 건너뜁니다
+
+    Returns:
+        해당 날짜의 모든 의안을 저장했으면 True (회의가 없는 날도 True).
+        회의 목록을 가져오지 못하면 False
+    """
+    try:
+        conf = ConfExtractor(dae_num, date, seen_links=seen_links)
+    except OpenAPIError as e:
+        logger.error(f"error: Conferences of {date} could not be fetched - {str(e)}")
+        return False
     print(conf.conf_info)
     if len(conf.conf_ids) == 0:
         logger.info("info: No Conf on this date")
-        return
+        return True
     conf.save_conf("localhost", "root", api_keyManager.get_db_password())
     print("conf.links: ", conf.links)
-    for link in conf.links:
-        print("link: ", link)
-        bill = BillExtractor(link)
-        print("bill.bill_info: ", bill.bill_info)
-        # bill.save_bill("localhost", "root", api_keyManager.get_db_password())
-        # su = Summarizer(bill.bill_summary)
-        # su.bill_id = bill.get_bill_id()
-        # su.conf_id = conf.get_conf_id()
-        # if not su.bill_summary == "":
-        #     su.save_summary("localhost", "root", api_keyManager.get_db_password())
-        #     time.sleep(8)
+    runner = runner or BillIngestionRunner()
+    runner.run(conf.links)
+    if runner.retry_links:
+        runner.retry()
+    if runner.retry_links and seen_links is not None:
+        # 저장하지 못한 의안은 다른 날짜나 다음 실행에서 다시 수집할 수 있도록 한다
+        seen_links.release(runner.retry_links)
+    return not runner.retry_links
+
+
+@query_metrics.job("extract_all.incremental")
+def run_incremental(default_start_str="2025-01-01", runner=None) -> list[str]:
+    """
+    date_checker에 기록된 마지막 수집 날짜 다음 날부터 오늘까지만 수집합니다.
+
+    날짜마다 수집이 끝나면 date_checker에 완료를 기록하므로, 중간에 중단되어도
+    다음 실행은 처리하지 못한 날짜부터 다시 시작합니다. 실패한 날짜가 있으면
+    그 뒤의 날짜를 기록하지 않고 멈춥니다 (워터마크가 실패한 날짜를 건너뛰지 않도록).
+    오늘은 회의 정보가 아직 추가될 수 있으므로 수집만 하고 기록하지 않습니다.
+
+    Args:
+        default_start_str: date_checker가 비어 있을 때 사용할 YYYY-MM-DD 시작 날짜
+        runner: 재사용할 BillIngestionRunner
+
+    Returns:
+        완료로 기록된 날짜 목록
+    """
+    today = datetime.date.today()
+    with get_handler() as db_handler:
+        last_date = db_handler.get_last_processed_date()
+    if last_date is None:
+        start_date = datetime.datetime.strptime(default_start_str, "%Y-%m-%d").date()
+    else:
+        start_date = last_date + datetime.timedelta(days=1)
+    if start_date > today:
+        logger.info(f"info: Already up to date (last processed {last_date})")
+        return []
+
+    dates = generate_date_list(start_date.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d"))
+    logger.info(f"info: Incremental ingestion of {len(dates)} dates from {dates[0]}")
+    runner = runner or BillIngestionRunner()
+    seen_links = LinkDeduplicator()
+    processed = []
+    for date in dates:
+        if not main(get_assembly_number(date), date, runner, seen_links):
+            logger.warning(f"Stopping incremental ingestion: {date} did not complete")
+            break
+        if date == today.strftime("%Y-%m-%d"):
+            break
+        with get_handler() as db_handler:
+            marked = db_handler.mark_date_processed(date)
+        if marked is None:
+            # DB 에러로 기록하지 못했으므로 다음 실행에서 이 날짜부터 다시 수집한다
+            logger.warning(f"Stopping incremental ingestion: {date} could not be marked")
+            break
+        processed.append(date)
+    return processed
+
+
+@query_metrics.job("extract_all.pipeline")
+def run_pipeline(start_date_str, end_date_str, **options):
+    """
+    주어진 기간의 회의 → 의안 → 요약 → 번역 → 임베딩을 스트리밍 파이프라인으로 처리합니다.
+
+    Args:
+        start_date_str: YYYY-MM-DD 형식의 시작 날짜
+        end_date_str: YYYY-MM-DD 형식의 종료 날짜
+        **options: build_ingestion_pipeline 인자 (worker 수, 단계 on/off 등)
+
+    Returns:
+        단계별 처리량/지연 시간 통계
+    """
+    pipeline = build_ingestion_pipeline(**options)
+    dates = generate_date_list(start_date_str, end_date_str)
+    return pipeline.run((get_assembly_number(date), date) for date in dates)
+
+
+@query_metrics.job("extract_all.harvest")
+def run_harvest(start_date_str, end_date_str, **options):
+    """
+    ALLBILL을 국회 대수(AGE)별로 페이지 단위 조회하여 기간 내 발의된 의안을 일괄 수집합니다.
+    요약이 저장되지 않은 의안만 상세 페이지를 가져옵니다.
+
+    Args:
+        start_date_str: YYYY-MM-DD 형식의 시작 날짜 (제안일 기준)
+        end_date_str: YYYY-MM-DD 형식의 종료 날짜 (제안일 기준)
+        **options: BillHarvester 인자 (max_workers, rate_per_host, batch_size)
+
+    Returns:
+        대수별 수집 통계. 저장하지 못한 batch는 한 번 더 시도한 결과를 합칩니다.
+
+    Raises:
+        ValueError: 날짜가 1대 국회 시작일보다 이르거나 시작 날짜가 종료 날짜보다 늦을 때
+    """
+    first = get_assembly_number(start_date_str)
+    last = get_assembly_number(end_date_str)
+    if first is None or last is None:
+        raise ValueError(
+            f"No National Assembly for {start_date_str} ~ {end_date_str}: "
+            f"dates must be on or after {assembly_dates[0][1]}"
+        )
+    if first > last:
+        raise ValueError(f"start date {start_date_str} is after end date {end_date_str}")
+
+    harvester = BillHarvester(**options)
+    results = {}
+    for age in range(first, last + 1):
+        counts = harvester.run(age, start_date_str, end_date_str)
+        if harvester.failed_batches:
+            retried = harvester.retry()
+            counts["failed_rows"] = retried["failed_rows"]
+            for key in ("inserted", "updated", "unchanged", "pages_fetched"):
+                counts[key] += retried[key]
+        results[age] = counts
+    return results
 
 
 if __name__ == "__main__":
-    for date in generate_date_list("2025-01-01", "2025-01-31"):
-        main(get_assembly_number(date), date)
+    import sys
+
+    if "--incremental" in sys.argv:
+        run_incremental()
+    elif "--harvest" in sys.argv:
+        run_harvest(*sys.argv[2:4])
+    else:
+        # 요약/임베딩은 LLM 할당량을 쓰므로 --summarize / --embed를 줄 때만 실행한다
+        run_pipeline(
+            "2025-01-01",
+            "2025-01-31",
+            summarize="--summarize" in sys.argv,
+            embed="--embed" in sys.argv,
+        )
@@ -1,53 +1,37 @@
-from src.extractors import BillExtractor
+from src.ingestion import BillIngestionRunner
 from src.dna_logger import logger
 
-import os
-from dotenv import load_dotenv
 
-
-def save_bills_from_urls(
-    bill_urls, host="localhost", user="root", password="your_password"
-):
+def save_bills_from_urls(bill_urls, max_workers=8, rate_per_host=5.0):
     """
     Extract bill information from given URLs and save them to the database.
 
     Parameters:
         bill_urls (list): List of bill URLs to process
-        host (str): Database host address
-        user (str): Database username
-        password (str): Database password
-    """
-
-    total_bills = len(bill_urls)
-    success_count = 0
-    failed_urls = []
-
-    for idx, url in enumerate(bill_urls, 1):
-        try:
-            logger.info(f"Processing bill {idx}/{total_bills}: {url}")
+        max_workers (int): Number of bills processed concurrently
+        rate_per_host (float): Requests per second per host
 
-            # Extract bill information
-            bill_extractor = BillExtractor(url)
-
-            # Save to database
-            bill_extractor.save_bill(host=host, user=user, password=password)
-
-            success_count += 1
-            logger.info(f"Successfully saved bill {bill_extractor.bill_no}")
+    Returns:
+        list: URLs that still failed after one retry
+    """
 
-        except Exception as e:
-            logger.error(f"Failed to process URL {url}: {str(e)}")
-            failed_urls.append(url)
-            continue
+    runner = BillIngestionRunner(max_workers=max_workers, rate_per_host=rate_per_host)
+    report = runner.run(bill_urls)
+    if runner.retry_links:
+        retry_report = runner.retry()
+        report["succeeded"] += retry_report["succeeded"]
 
     # Log summary
     logger.info(f"\nProcessing complete!")
-    logger.info(f"Successfully processed: {success_count}/{total_bills} bills")
+    logger.info(
+        f"Successfully processed: {report['succeeded']}/{len(set(bill_urls))} bills"
+    )
 
-    if failed_urls:
-        logger.warning(f"Failed URLs ({len(failed_urls)}):")
-        for url in failed_urls:
+    if runner.retry_links:
+        logger.warning(f"Failed URLs ({len(runner.retry_links)}):")
+        for url in runner.retry_links:
             logger.warning(url)
+    return runner.retry_links
 
 
 if __name__ == "__main__":
@@ -61,10 +45,5 @@ if __name__ == "__main__":
         # Add more URLs as needed
     ]
 
-    # 환경변수를 사용하여 비밀번호 가져오기
-    load_dotenv()
-    DB_USER = os.getenv("DATABASE_USERNAME")
-    DB_PASSWORD = os.getenv("DATABASE_PASSWORD")
-    DB_HOST = "localhost"
-
-    save_bills_from_urls(test_urls, host=DB_HOST, user=DB_USER, password=DB_PASSWORD)
+    # DB 접속 정보는 src.database가 .env에서 읽는다
+    save_bills_from_urls(test_urls)